@@ -0,0 +1,25 @@
+#!/bin/bash
+# fake testssl for local smoke tests
+json=""; host=""; file=""
+for a in "$@"; do
+  case "$a" in
+    --jsonfile=*) json="${a#--jsonfile=}";;
+    --file=*) file="${a#--file=}";;
+    -*) ;;
+    *) host="$a";;
+  esac
+done
+echo "$$ $host $*" >> /tmp/fake_testssl.log
+sleep ${FAKE_SLEEP:-0.5}
+h="${host%%:*}"
+emit() { printf '{"id":"%s","ip":"%s/1.2.3.4","port":"443","severity":"%s","finding":"x"}' "$1" "$2" "$3"; }
+if [ -n "$file" ]; then
+  out="["; first=1
+  while read -r line; do
+    hh=$(echo "$line" | awk '{print $NF}'); hh="${hh%%:*}"
+    for id in ROBOT BEAST RC4; do [ $first = 1 ] || out="$out,"; first=0; out="$out$(emit $id $hh HIGH)"; done
+  done < "$file"
+  echo "$out]" > "$json"
+else
+  echo "[$(emit ROBOT $h HIGH),$(emit BEAST $h OK),$(emit RC4 $h HIGH)]" > "$json"
+fi
@@ -0,0 +1,7 @@
+# fake mallodroid for local smoke tests
+import os, time
+def main(args, stdout_suppress=True, stderr_suppress=True):
+    with open("/tmp/fake_mallodroid.log", "a") as f:
+        f.write(f"{os.getpid()} {time.time()} {args}\n")
+    time.sleep(float(os.environ.get("FAKE_SLEEP", "0")))
+    return {k: [{"empty": True, "class": "A", "method": "m"}] for k in ["trustmanager", "customhostnameverifier", "allowallhostnameverifier", "onreceivedsslerror", "insecuresocketfactory"]}
@@ -0,0 +1,3 @@
+import sys, time
+time.sleep(0.5)
+print("sanity ok\nTest end\nMD5 forced MD5 forced sanity", sys.argv[1:])
@@ -26,6 +26,26 @@ class Accepting_all_certificates(Super_base):
         """
         self._arguments = []
 
+    # to override
+    def _rules(self) -> list:
+        """
+        Rules of SUPER needed by the module.
+
+        :return: the rule names
+        :rtype: list
+        """
+        return ["Accepting all SSL certificates"]
+
+    # to override
+    def _triggers(self) -> list:
+        """
+        Symbols of the javax.net.ssl package, in descriptors and constants.
+
+        :return: the symbols that must appear in the APK for the module to apply
+        :rtype: list
+        """
+        return ["net/ssl", "net.ssl"]
+
     # to override
     def _worker(self, results):
         """
@@ -36,6 +56,4 @@ class Accepting_all_certificates(Super_base):
         :return: dict results of the module
         :rtype: dict
         """
-        return self._obtain_results(
-            results, ["Accepting all SSL certificates"], ["criticals"]
-        )
+        return self._obtain_results(results, self._rules(), ["criticals"])
@@ -27,6 +27,29 @@ class Certificate_keystore_disclosure(Super_base):
         """
         self._arguments = []
 
+    # to override
+    def _rules(self) -> list:
+        """
+        SUPER rules read by the analysis.
+
+        :return: the rule names
+        :rtype: list
+        """
+        return ["Certificate or Keystore disclosure"]
+
+    # to override
+    def _triggers(self):
+        """
+        The rule matches string literals naming a certificate or keystore file, which
+        can be loaded without the KeyStore class (e.g. a PEM given to an SSLContext),
+        and the extensions may be split by whitespace: no symbol is needed for a
+        finding, so the module always applies.
+
+        :return: None, the module always applies
+        :rtype: None
+        """
+        return None
+
     # to override
     def _worker(self, results):
         """
@@ -36,6 +59,4 @@ class Certificate_keystore_disclosure(Super_base):
         :return: Results obtained from module
         :rtype: dict
         """
-        return self._obtain_results(
-            results, ["Certificate or Keystore disclosure"], ["warnings"]
-        )
+        return self._obtain_results(results, self._rules(), ["warnings"])
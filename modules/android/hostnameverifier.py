@@ -41,6 +41,16 @@ class Hostnameverifier(Mallodroid_base):
         """
         self._arguments = []
 
+    # to override
+    def _triggers(self) -> list:
+        """
+        Symbols needed for a custom HostnameVerifier.
+
+        :return: the symbols that must appear in the APK for the module to apply
+        :rtype: list
+        """
+        return ["HostnameVerifier"]
+
     # to override
     def _worker(self, results):
         """
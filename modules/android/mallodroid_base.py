@@ -2,6 +2,7 @@ from modules.android.wrappers.mallodroid import Mallodroid
 from utils.validation import Validator
 from utils.mitigations import load_mitigation
 import logging
+from modules.planner import Planner
 
 
 class Mallodroid_base:
@@ -62,6 +63,25 @@ class Mallodroid_base:
         """
         raise NotImplementedError("This method should be reimplemented!")
 
+    def _triggers(self):
+        """
+        Symbols whose presence in the DEX files makes the module applicable.
+        To be overridden, by default the module always applies.
+
+        :return: the symbols, None if the module always applies
+        :rtype: list
+        """
+        return None
+
+    def _sources(self):
+        """
+        Declares the data sources needed by the analysis.
+
+        :return: The Mallodroid analysis with its arguments.
+        :rtype: list
+        """
+        return [(Planner.Source.MALLODROID, tuple(self._arguments))]
+
     # to override
     def _worker(self, results):
         """
@@ -25,6 +25,26 @@ class Obfuscated_code(Super_base):
         """
         self._arguments = []
 
+    # to override
+    def _rules(self) -> list:
+        """
+        Names of the SUPER rules read by the module.
+
+        :return: the rule names
+        :rtype: list
+        """
+        return ["Obfuscated code"]
+
+    # to override
+    def _triggers(self) -> list:
+        """
+        Symbols of the obfuscator searched by the rule.
+
+        :return: the symbols that must appear in the APK for the module to apply
+        :rtype: list
+        """
+        return ["AESObfuscator"]
+
     # to override
     def _worker(self, results):
         """
@@ -34,4 +54,4 @@ class Obfuscated_code(Super_base):
         :return: dict of results
         :rtype: dict
         """
-        return self._obtain_results(results, ["Obfuscated code"], ["warnings"])
+        return self._obtain_results(results, self._rules(), ["warnings"])
@@ -26,6 +26,26 @@ class Ssl_getinsecure_method(Super_base):
         """
         self._arguments = []
 
+    # to override
+    def _rules(self) -> list:
+        """
+        Setup the SUPER rules to run.
+
+        :return: the rule names
+        :rtype: list
+        """
+        return ["SSL getInsecure method"]
+
+    # to override
+    def _triggers(self) -> list:
+        """
+        The socket factories searched by the rule.
+
+        :return: the symbols that must appear in the APK for the module to apply
+        :rtype: list
+        """
+        return ["SSLSocketFactory", "SSLCertificateSocketFactory"]
+
     # to override
     def _worker(self, results):
         """
@@ -35,4 +55,4 @@ class Ssl_getinsecure_method(Super_base):
         :return: dict of results of the module
         :rtype: dict
         """
-        return self._obtain_results(results, ["SSL getInsecure method"], ["highs"])
+        return self._obtain_results(results, self._rules(), ["highs"])
@@ -42,6 +42,16 @@ class Ssl_error(Mallodroid_base):
         """
         self._arguments = []
 
+    # to override
+    def _triggers(self) -> list:
+        """
+        Symbols of the SSL error handler of a WebView.
+
+        :return: the symbols that must appear in the APK for the module to apply
+        :rtype: list
+        """
+        return ["onReceivedSslError"]
+
     # to override
     def _worker(self, results):
         """
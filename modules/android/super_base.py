@@ -1,6 +1,7 @@
 from modules.android.wrappers.super import Super
 from utils.validation import Validator
 from utils.mitigations import load_mitigation
+from modules.planner import Planner
 
 
 class Super_base:
@@ -65,6 +66,41 @@ class Super_base:
         """
         raise NotImplementedError("This method should be reimplemented!")
 
+    def _rules(self):
+        """
+        Names of the SUPER rules read by the module.
+        To be overridden, by default all the rules are needed.
+
+        :return: the rule names, None for all the rules
+        :rtype: list
+        """
+        return None
+
+    def _triggers(self):
+        """
+        Symbols whose presence in the DEX files makes the module applicable.
+        To be overridden, by default the module always applies.
+
+        :return: the symbols, None if the module always applies
+        :rtype: list
+        """
+        return None
+
+    def _sources(self):
+        """
+        Declares the data sources needed by the analysis.
+
+        :return: the SUPER scan with its arguments and the rules read
+        :rtype: list
+        """
+        rules = self._rules()
+        return [
+            (
+                Planner.Source.SUPER,
+                (tuple(self._arguments), None if rules is None else tuple(rules)),
+            )
+        ]
+
     # to override
     def _worker(self, results):
         """
@@ -100,6 +136,27 @@ class Super_base:
                             out[key].append(single)
         return out
 
+    def __prepare(self, **kwargs) -> dict:
+        """
+        Receives the input arguments and obtains the arguments of the SUPER wrapper.
+
+        :param kwargs: input arguments, see :func:`run`
+        :return: the arguments of the wrapper
+        :rtype: dict
+        :raise AssertionError: if the input arguments are not valid
+        """
+        self.input(**kwargs)
+
+        if "path" not in kwargs:
+            raise AssertionError("path is missing!")
+        Validator([(self._input_dict["path"], str)])
+        return {
+            "path": self._input_dict["path"],
+            "args": self._arguments,
+            "rules": self._rules(),
+            "force": self._input_dict.get("force", False),
+        }
+
     def run(self, **kwargs):
         """
         Runs the analysis.
@@ -113,18 +170,20 @@ class Super_base:
         :rtype: dict
         :raise AssertionError: if the input arguments are not valid
         """
-        self.input(**kwargs)
+        self._output_dict = self._worker(self._instance.run(**self.__prepare(**kwargs)))
+        return self.output()
 
-        if "path" not in kwargs:
-            raise AssertionError("path is missing!")
-        Validator([(self._input_dict["path"], str)])
-        self._input_dict["path"] = self._input_dict["path"]
+    async def run_async(self, **kwargs):
+        """
+        Awaitable version of run.
+
+        :param kwargs: input arguments, see :func:`run`
+        :return: results
+        :rtype: dict
+        :raise AssertionError: if the input arguments are not valid
+        """
         self._output_dict = self._worker(
-            self._instance.run(
-                path=self._input_dict["path"],
-                args=self._arguments,
-                force=self._input_dict.get("force", False),
-            )
+            await self._instance.run_async(**self.__prepare(**kwargs))
         )
         return self.output()
 
@@ -32,6 +32,16 @@ class Trustmanager(Mallodroid_base):
         """
         self._arguments = []
 
+    # to override
+    def _triggers(self) -> list:
+        """
+        Classes that reveal a custom TrustManager or an insecure socket factory.
+
+        :return: the symbols that must appear in the APK for the module to apply
+        :rtype: list
+        """
+        return ["X509TrustManager", "SSLCertificateSocketFactory"]
+
     # to override
     def _worker(self, results):
         """
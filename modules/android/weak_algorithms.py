@@ -27,6 +27,35 @@ class Weak_algorithms(Super_base):
         """
         self._arguments = []
 
+    # to override
+    def _rules(self) -> list:
+        """
+        The SUPER rules used by the module.
+
+        :return: the rule names
+        :rtype: list
+        """
+        return ["Weak Algorithms"]
+
+    # to override
+    def _triggers(self) -> list:
+        """
+        Names of the weak algorithms, as given to getInstance.
+
+        :return: the symbols that must appear in the APK for the module to apply
+        :rtype: list
+        """
+        return [
+            "DESKeySpec",
+            "md5",
+            "md4",
+            "sha-1",
+            "rc2",
+            "rc4",
+            "ecb",
+            "nopadding",
+        ]
+
     # to override
     def _worker(self, results):
         """
@@ -37,4 +66,4 @@ class Weak_algorithms(Super_base):
         :return: the results
         :rtype: dict
         """
-        return self._obtain_results(results, ["Weak Algorithms"], ["highs"])
+        return self._obtain_results(results, self._rules(), ["highs"])
@@ -27,6 +27,26 @@ class Webview_ssl_errors(Super_base):
         """
         self._arguments = []
 
+    # to override
+    def _rules(self) -> list:
+        """
+        Set the SUPER rules of the module.
+
+        :return: the rule names
+        :rtype: list
+        """
+        return ["WebView ignores SSL errors"]
+
+    # to override
+    def _triggers(self) -> list:
+        """
+        Callback of a WebView that ignores the SSL errors.
+
+        :return: the symbols that must appear in the APK for the module to apply
+        :rtype: list
+        """
+        return ["onReceivedSslError"]
+
     # to override
     def _worker(self, results):
         """
@@ -37,6 +57,4 @@ class Webview_ssl_errors(Super_base):
         :return: results
         :rtype: dict
         """
-        return self._obtain_results(
-            results, ["WebView ignores SSL errors"], ["criticals"]
-        )
+        return self._obtain_results(results, self._rules(), ["criticals"])
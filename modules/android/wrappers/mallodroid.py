@@ -1,12 +1,45 @@
+import atexit
+import hashlib
 import logging
+import struct
+import tempfile
+import threading
+import zipfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
 from os import sep
 from pathlib import Path
 
+from utils.apk import Apk
+from utils.cache import Disk_cache, file_digest
 from utils.logger import Logger
 from utils.validation import Validator
 from utils.loader import load_module
 
 
+def _analyze(mallodroid: str, args: list, debug: bool):
+    """
+    Run mallodroid in a worker process.
+
+    :param mallodroid: path of mallodroid.py
+    :type mallodroid: str
+    :param args: arguments of mallodroid
+    :type args: list
+    :param debug: show the output of mallodroid
+    :type debug: bool
+    :return: results of mallodroid
+    :rtype: dict
+    """
+    logging.getLogger("androguard.analysis").setLevel(
+        logging.DEBUG if debug else logging.ERROR
+    )
+    return load_module(mallodroid, "mallodroid").main(
+        args, stdout_suppress=not debug, stderr_suppress=not debug
+    )
+
+
 class Mallodroid:
     """
     Mallodroid is a tool to perform static analysis of Android applications.
@@ -15,6 +48,9 @@ class Mallodroid:
 
     __cache = {}
     __instance = None
+    __disk_cache_size = 512 * 1024 * 1024  # bytes of results kept on disk
+    __executor = None  # process of __analyze_in_process, started when first needed
+    __executor_lock = threading.Lock()
 
     def __init__(self):
         logging.getLogger("androguard.analysis").setLevel(
@@ -37,6 +73,12 @@ class Mallodroid:
             path: path to the file to be analyzed
             args: list of arguments to be passed to mallodroid
             force: force the analysis of the file (default: False)
+            cache: use the persistent on-disk cache (default: False)
+            cache_ttl: seconds before a cached result expires (default: 86400)
+            process: run androguard in a separate process (default: False)
+            dex_jobs: processes analyzing the DEX files of a multidex APK (default: 1)
+            incremental: reuse the findings of a previous build of the same package
+                with the same DEX files (default: False)
         """
         self.__input_dict = kwargs
 
@@ -66,6 +108,12 @@ class Mallodroid:
             path: path to the file to be analyzed
             args: list of arguments to be passed to mallodroid
             force: force the analysis of the file ignoring cache (default: False)
+            cache: use the persistent on-disk cache (default: False)
+            cache_ttl: seconds before a cached result expires (default: 86400)
+            process: run androguard in a separate process (default: False)
+            dex_jobs: processes analyzing the DEX files of a multidex APK (default: 1)
+            incremental: reuse the findings of a previous build of the same package
+                with the same DEX files (default: False)
         """
         self.input(**kwargs)
         if "path" in self.__input_dict:
@@ -79,7 +127,23 @@ class Mallodroid:
         # validate input types
         args = self.__input_dict["args"] if "args" in self.__input_dict else []
         force = self.__input_dict["force"] if "force" in self.__input_dict else False
-        Validator([(args, list), (force, bool)])
+        self.__input_dict.setdefault("cache", False)
+        self.__input_dict.setdefault("cache_ttl", 86400)
+        self.__input_dict.setdefault("process", False)
+        self.__input_dict.setdefault("dex_jobs", 1)
+        self.__input_dict.setdefault("incremental", False)
+        Validator(
+            [
+                (args, list),
+                (force, bool),
+                (self.__input_dict["cache"], bool),
+                (self.__input_dict["cache_ttl"], int),
+                (self.__input_dict["process"], bool),
+                (self.__input_dict["dex_jobs"], int),
+                (self.__input_dict["incremental"], bool),
+            ]
+        )
+        assert self.__input_dict["dex_jobs"] >= 1, "The DEX jobs must be at least 1."
 
         self.__worker(self.__correct_path, args=args, force=force)
         return self.output(path=str(self.__correct_path.absolute()))
@@ -95,21 +159,308 @@ class Mallodroid:
         """
         file_id = str(path.absolute())
         self.__logging.debug(f"Starting analysis of {file_id} ...")
-        args.append("-f")
-        args.append(str(path.absolute()))
         if force:
             self.__logging.debug(
                 f"Analysis of {file_id} (cache miss or forced by call)"
             )
-            self.__cache[file_id] = self.__instance.main(
-                args,
-                stdout_suppress=False
-                if logging.getLogger().isEnabledFor(logging.DEBUG)
-                else True,
-                stderr_suppress=False
-                if logging.getLogger().isEnabledFor(logging.DEBUG)
-                else True,
-            )  # calls main
+            results = None
+            dex_key = None
+            if self.__input_dict["incremental"]:
+                dex_key = self.__dex_key(path, args)
+                results = self.__load_from_index(dex_key)
+            if results is None and self.__input_dict["dex_jobs"] > 1:
+                results = self.__analyze_split(path, args)
+            if results is not None:
+                self.__cache[file_id] = results
+            elif self.__input_dict["process"]:
+                self.__cache[file_id] = self.__analyze_in_process(
+                    args + ["-f", file_id]
+                )
+            else:
+                self.__cache[file_id] = self.__instance.main(
+                    args + ["-f", file_id],
+                    stdout_suppress=False
+                    if logging.getLogger().isEnabledFor(logging.DEBUG)
+                    else True,
+                    stderr_suppress=False
+                    if logging.getLogger().isEnabledFor(logging.DEBUG)
+                    else True,
+                )  # calls main
+            self.__save_to_disk(path, args)
+            if self.__input_dict["incremental"]:
+                self.__save_to_index(dex_key, self.__cache[file_id])
         else:
-            if file_id not in self.__cache:  # if not in cache, force analysis
+            # if not in cache, force analysis
+            if file_id not in self.__cache and not self.__load_from_disk(path, args):
                 self.__worker(path, args, force=True)
+
+    def __analyze_in_process(self, args: list) -> dict:
+        """
+        Run mallodroid in a separate process, so that androguard doesn't compete for
+        the GIL with the rest of the analysis.
+
+        The process is started by the first analysis and reused by the next ones,
+        which skip the start of the interpreter and the import of androguard.
+
+        :param args: arguments of mallodroid
+        :type args: list
+        :return: results of mallodroid
+        :rtype: dict
+        """
+        executor = self.__start_executor()
+        try:
+            return executor.submit(
+                _analyze,
+                self.__mallodroid,
+                args,
+                logging.getLogger().isEnabledFor(logging.DEBUG),
+            ).result()
+        except BrokenProcessPool:
+            # the process died (e.g. out of memory): the next analysis starts another
+            with self.__executor_lock:
+                if Mallodroid.__executor is executor:
+                    Mallodroid.__executor = None
+            raise
+
+    def __start_executor(self) -> ProcessPoolExecutor:
+        """
+        Obtain the process shared by the analyses in process, starting it if needed.
+
+        :return: the executor of the process
+        :rtype: ProcessPoolExecutor
+        """
+        with self.__executor_lock:
+            if Mallodroid.__executor is None:
+                # spawn, forking a process with running threads isn't safe
+                Mallodroid.__executor = ProcessPoolExecutor(
+                    max_workers=1, mp_context=get_context("spawn")
+                )
+                atexit.register(Mallodroid.__executor.shutdown)
+            return Mallodroid.__executor
+
+    def __split(self, path: Path, folder: str) -> list:
+        """
+        Write an APK for each DEX file of a multidex APK, with its manifest.
+
+        :param path: path to the multidex APK
+        :type path: Path
+        :param folder: folder where to write the APKs
+        :type folder: str
+        :return: paths of the APKs, empty if the APK has a single DEX file
+        :rtype: list
+        """
+        with Apk(str(path)) as apk:
+            dex_files = apk.dex_files()
+            if len(dex_files) < 2:
+                return []
+            manifest = apk.read("AndroidManifest.xml")
+            parts = []
+            for index, name in enumerate(dex_files):
+                part = Path(folder) / f"{index}_{path.name}"
+                with zipfile.ZipFile(part, "w", zipfile.ZIP_STORED) as split:
+                    split.writestr("AndroidManifest.xml", manifest)
+                    split.writestr("classes.dex", apk.read(name))
+                parts.append(part)
+        return parts
+
+    def __merge(self, partials: list) -> dict:
+        """
+        Merge the results of mallodroid on the DEX files of an APK.
+
+        :param partials: results of each DEX file
+        :type partials: list
+        :return: the results of the APK
+        :rtype: dict
+        """
+        results = {}
+        for partial in partials:
+            for key, value in partial.items():
+                if isinstance(value, list):
+                    results.setdefault(key, []).extend(value)
+                else:
+                    results.setdefault(key, value)
+        return results
+
+    def __analyze_split(self, path: Path, args: list):
+        """
+        Run mallodroid on each DEX file of a multidex APK, on a pool of processes.
+
+        The findings are merged as if the APK was analyzed at once, but the classes
+        of a DEX file are analyzed without the others: a check relying on a
+        superclass defined in another DEX file can miss it.
+
+        :param path: path to the APK
+        :type path: Path
+        :param args: arguments of mallodroid
+        :type args: list
+        :return: results of mallodroid, None if the APK has a single DEX file
+        :rtype: dict
+        """
+        with tempfile.TemporaryDirectory(prefix="mallodroid_") as folder:
+            try:
+                parts = self.__split(path, folder)
+            except (KeyError, ValueError, zlib.error, struct.error) as e:
+                self.__logging.warning(f"Couldn't split the DEX files of {path}: {e}")
+                return None
+            if not parts:
+                return None
+            self.__logging.debug(f"Analyzing the {len(parts)} DEX files of {path}..")
+            # spawn, forking a process with running threads isn't safe
+            with ProcessPoolExecutor(
+                max_workers=min(self.__input_dict["dex_jobs"], len(parts)),
+                mp_context=get_context("spawn"),
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _analyze,
+                        self.__mallodroid,
+                        args + ["-f", str(part.absolute())],
+                        logging.getLogger().isEnabledFor(logging.DEBUG),
+                    )
+                    for part in parts
+                ]
+                return self.__merge([future.result() for future in futures])
+
+    def __disk_key(self, path: Path, args: list) -> str:
+        """
+        Key of an analysis in the on-disk cache.
+
+        The APK is identified by its content, the checks by the code of mallodroid
+        and by the version of androguard.
+
+        :param path: path to the file analyzed
+        :type path: Path
+        :param args: list of arguments passed to mallodroid
+        :type args: list
+        :return: the key
+        :rtype: str
+        """
+        return Disk_cache.key(
+            file_digest(path),
+            list(args),
+            file_digest(self.__mallodroid),
+            self.__androguard_version(),
+        )
+
+    def __dex_key(self, path: Path, args: list):
+        """
+        Key of an analysis in the index of the incremental analysis.
+
+        Unlike the on-disk cache, the APK is identified by its package and by its
+        DEX files, in order: the builds changing only the resources, the manifest
+        or the signature share the findings, which depend only on the code.
+
+        :param path: path to the APK
+        :type path: Path
+        :param args: list of arguments passed to mallodroid
+        :type args: list
+        :return: the key, None if the DEX files can't be read
+        :rtype: str
+        """
+        try:
+            with Apk(str(path)) as apk:
+                package = apk.package()
+                dex_digests = [
+                    hashlib.sha256(apk.read(name)).hexdigest()
+                    for name in apk.dex_files()
+                ]
+        except (KeyError, ValueError, zlib.error, struct.error) as e:
+            self.__logging.warning(f"Couldn't index the DEX files of {path}: {e}")
+            return None
+        return Disk_cache.key(
+            package,
+            dex_digests,
+            list(args),
+            file_digest(self.__mallodroid),
+            self.__androguard_version(),
+        )
+
+    def __load_from_index(self, key: str):
+        """
+        Load the findings of a previous build with the same DEX files.
+
+        :param key: key of the analysis in the index, None to skip it
+        :type key: str
+        :return: results of mallodroid, None if there is no such build
+        :rtype: dict
+        """
+        if key is None:
+            return None
+        results = Disk_cache("mallodroid_index").get(key)
+        if results is not None:
+            self.__logging.info("DEX files unchanged, reusing the previous findings.")
+        return results
+
+    def __save_to_index(self, key: str, results: dict):
+        """
+        Save the findings of an APK in the index of the incremental analysis.
+
+        :param key: key of the analysis in the index, None to skip it
+        :type key: str
+        :param results: results of mallodroid
+        :type results: dict
+        """
+        if key is None:
+            return
+        index_cache = Disk_cache("mallodroid_index")
+        try:
+            index_cache.set(key, results, ttl=self.__input_dict["cache_ttl"])
+        except (TypeError, ValueError) as e:  # not JSON serializable
+            self.__logging.warning(f"Couldn't index the findings: {e}")
+        index_cache.evict(max_size=self.__disk_cache_size)
+
+    @staticmethod
+    def __androguard_version() -> str:
+        """
+        Obtain the version of androguard, part of the keys of the on-disk caches.
+
+        :return: the version, "unknown" if androguard isn't installed
+        :rtype: str
+        """
+        try:
+            from androguard import __version__ as androguard_version
+        except ImportError:
+            androguard_version = "unknown"
+        return androguard_version
+
+    def __load_from_disk(self, path: Path, args: list) -> bool:
+        """
+        Load the results of a previous analysis from the on-disk cache, if enabled.
+
+        :param path: path to the file to be analyzed
+        :type path: Path
+        :param args: list of arguments to be passed to mallodroid
+        :type args: list
+        :return: True if the results were found
+        :rtype: bool
+        """
+        if not self.__input_dict["cache"]:
+            return False
+        results = Disk_cache("mallodroid").get(self.__disk_key(path, args))
+        if results is None:
+            return False
+        self.__logging.debug(f"Loaded results of {path} from the disk cache")
+        self.__cache[str(path.absolute())] = results
+        return True
+
+    def __save_to_disk(self, path: Path, args: list):
+        """
+        Save the results of an analysis in the on-disk cache, if enabled.
+
+        :param path: path to the file analyzed
+        :type path: Path
+        :param args: list of arguments passed to mallodroid
+        :type args: list
+        """
+        if self.__input_dict["cache"]:
+            disk_cache = Disk_cache("mallodroid")
+            try:
+                disk_cache.set(
+                    self.__disk_key(path, args),
+                    self.__cache[str(path.absolute())],
+                    ttl=self.__input_dict["cache_ttl"],
+                )
+            except (TypeError, ValueError) as e:  # not JSON serializable
+                self.__logging.warning(f"Couldn't cache the results of {path}: {e}")
+            # drop the expired results and the oldest ones over the size limit
+            disk_cache.evict(max_size=self.__disk_cache_size)
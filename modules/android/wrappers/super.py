@@ -2,14 +2,17 @@ import json
 import logging
 import subprocess
 import sys
+import threading
 import uuid
 from os.path import devnull, sep, join
 from pathlib import Path
 from shutil import rmtree as rm_rf
-from os import walk
+from os import walk, makedirs, replace
 
+from utils.cache import Disk_cache, file_digest
 from utils.logger import Logger
 from utils.validation import Validator
+from utils.async_subprocess import run_command
 
 
 class Parser:
@@ -76,11 +79,18 @@ class Super:
     """
 
     __cache = {}
+    __covered = {}  # path -> names of the rules run, None for all
+    __version = None
+    __rules = f"configs{sep}tls_rules.json"
+    __rules_files = {}  # rule names -> trimmed rules file
+    __rules_lock = threading.Lock()
+    __disk_cache_size = 512 * 1024 * 1024  # bytes of results kept on disk
 
     def __init__(self):
         self.__logging = Logger("SUPER")
         self.__input_dict = {}
         self.__correct_path = None
+        self.__rule_names = None
 
     def input(self, **kwargs):
         """
@@ -90,7 +100,10 @@ class Super:
         :Keyword Arguments:
             * *path* (``str``) -- Path to the file to be scanned.
             * *args* (``list``) -- Additional arguments to be passed to SUPER.
+            * *rules* (``list``) -- Names of the rules to run, default all.
             * *force* (``bool``) -- Force the scan even if the file is already scanned.
+            * *cache* (``bool``) -- Use the persistent on-disk cache, default False.
+            * *cache_ttl* (``int``) -- Seconds before a cached result expires.
 
         :type kwargs: dict
         """
@@ -127,20 +140,15 @@ class Super:
             for filename in [f for f in filenames if f == "results.json"]:
                 return join(dirpath, filename)
 
-    def run(self, **kwargs):
+    def __prepare_input(self, **kwargs) -> (Path, list, bool):
         """
-        Runs SUPER.
-
-        :param kwargs: Dictionary of input arguments.
-        :Keyword Arguments:
-            * *path* (``str``) -- Path to the file to be scanned.
-            * *args* (``list``) -- Additional arguments to be passed to SUPER.
-            * *force* (``bool``) -- Force the scan even if the file is already scanned.
+        Parses and validates the input of run and run_async.
 
+        :param kwargs: Dictionary of input arguments, see :func:`run`.
         :type kwargs: dict
+        :return: path of the file, args and force parameters.
+        :rtype: tuple
         """
-
-        # input parsing
         self.input(**kwargs)
         if "path" in self.__input_dict:
             self.__correct_path = Path(self.__input_dict["path"])
@@ -153,9 +161,78 @@ class Super:
 
         args = self.__input_dict["args"] if "args" in self.__input_dict else []
         force = self.__input_dict["force"] if "force" in self.__input_dict else False
-        Validator([(self.__input_dict["path"], str), (args, list), (force, bool)])
-        self.__super_scan(self.__correct_path, args=args, force=force)
-        return self.output(path=str(self.__correct_path.absolute()))
+        self.__input_dict.setdefault("cache", False)
+        self.__input_dict.setdefault("cache_ttl", 86400)
+        rules = self.__input_dict.get("rules", None)
+        Validator(
+            [
+                (self.__input_dict["path"], str),
+                (args, list),
+                (force, bool),
+                (self.__input_dict["cache"], bool),
+                (self.__input_dict["cache_ttl"], int),
+                ([] if rules is None else rules, list),
+            ]
+        )
+        self.__rule_names = None if rules is None else frozenset(rules)
+        return self.__correct_path, args, force
+
+    def run(self, **kwargs):
+        """
+        Runs SUPER.
+
+        :param kwargs: Dictionary of input arguments.
+        :Keyword Arguments:
+            * *path* (``str``) -- Path to the file to be scanned.
+            * *args* (``list``) -- Additional arguments to be passed to SUPER.
+            * *rules* (``list``) -- Names of the rules to run, default all.
+            * *force* (``bool``) -- Force the scan even if the file is already scanned.
+            * *cache* (``bool``) -- Use the persistent on-disk cache, default False.
+            * *cache_ttl* (``int``) -- Seconds before a cached result expires.
+
+        :type kwargs: dict
+        """
+
+        # input parsing
+        path, args, force = self.__prepare_input(**kwargs)
+        self.__super_scan(path, args=args, force=force)
+        return self.output(path=str(path.absolute()))
+
+    async def run_async(self, **kwargs):
+        """
+        Awaitable version of run, SUPER is executed without blocking the event loop.
+
+        :param kwargs: Dictionary of input arguments, see :func:`run`.
+        :type kwargs: dict
+        """
+        path, args, force = self.__prepare_input(**kwargs)
+        if force or (
+            not self.__is_covered(path) and not self.__load_from_disk(path, args)
+        ):
+            folder_name = uuid.uuid4().hex
+            with open(devnull, "w") as null:
+                exit_code = await self.subprocess_call_async(
+                    self.__command(path, args, folder_name), null
+                )
+            self.__logging.debug(f"exit code: {exit_code}")
+            self.__load_results(path, folder_name)
+            self.__save_to_disk(path, args)
+        return self.output(path=str(path.absolute()))
+
+    def __output_redirection(self, null):
+        """
+        Where to redirect the output of SUPER.
+
+        :param null: File to be used as a null device.
+        :return: stdout if the user asked for debug mode, else the null device.
+        """
+        return (
+            sys.stdout
+            if logging.getLogger().isEnabledFor(
+                logging.DEBUG
+            )  # if the user asked for debug mode, let him see the output.
+            else null  # else /dev/null
+        )
 
     def subprocess_call(self, cmd, null, try_again=False):
         """
@@ -173,20 +250,8 @@ class Super:
         try:
             subprocess.run(
                 cmd,
-                stderr=(
-                    sys.stdout
-                    if logging.getLogger().isEnabledFor(
-                        logging.DEBUG
-                    )  # if the user asked for debug mode, let him see the output.
-                    else null  # else /dev/null
-                ),
-                stdout=(
-                    sys.stdout
-                    if logging.getLogger().isEnabledFor(
-                        logging.DEBUG
-                    )  # if the user asked for debug mode, let him see the output.
-                    else null  # else /dev/null
-                ),
+                stderr=self.__output_redirection(null),
+                stdout=self.__output_redirection(null),
                 check=True,  # check call equivalent
                 text=True,  # text as an input
                 input="yes",  # if asked, write 'yes' on each prompt
@@ -195,10 +260,95 @@ class Super:
         except subprocess.CalledProcessError as c:
             self.__logging.debug(str(c))
             if not try_again:
-                self.subprocess_call(cmd, null, try_again=True)
+                return self.subprocess_call(cmd, null, try_again=True)
             else:
                 return 2  # failed two times
 
+    async def subprocess_call_async(self, cmd, null, try_again=False):
+        """
+        Awaitable version of subprocess_call.
+
+        :param cmd: Command to be executed.
+        :type cmd: list
+        :param null: File to be used as a null device.
+        :type null: str
+        :param try_again: If True, will try again if the subprocess call fails.
+        :type try_again: bool
+        :return: Output of the subprocess call, if fails return 2.
+        :rtype: int
+        """
+        return_code, _ = await run_command(
+            cmd,
+            input="yes",  # if asked, write 'yes' on each prompt
+            stdout=self.__output_redirection(null),
+            stderr=self.__output_redirection(null),
+        )
+        if not return_code:
+            return 1 if try_again else 0  # failed 1 times or zero times
+        self.__logging.debug(
+            f"Command {cmd} returned non-zero exit status {return_code}."
+        )
+        if not try_again:
+            return await self.subprocess_call_async(cmd, null, try_again=True)
+        else:
+            return 2  # failed two times
+
+    def __command(self, path: Path, args: list, folder_name: str) -> list:
+        """
+        Builds the SUPER command.
+
+        :param path: Path to the file to be scanned.
+        :type path: Path
+        :param args: Additional arguments to be passed to SUPER.
+        :type args: list
+        :param folder_name: Name of the temp folder where the results are stored.
+        :type folder_name: str
+        :return: The command to execute.
+        :rtype: list
+        """
+        self.__logging.debug("Starting SUPER analysis")
+        self.__logging.debug(
+            f"Scanning {path.absolute()}, saving result to temp folder {folder_name}"
+        )
+        cmd = [
+            "super-analyzer",
+            "--results",
+            f"dependencies{sep}{folder_name}{sep}results",
+            "--dist",
+            f"dependencies{sep}{folder_name}{sep}dist",
+            "--rules",
+            self.__rules_file(),
+            "--json",
+        ]
+
+        if args:
+            self.__logging.debug(f"Scanning with personalized args: {args}")
+            for arg in args:
+                cmd.append(arg)
+        cmd.append(str(path.absolute()))
+        return cmd
+
+    def __load_results(self, path: Path, folder_name: str):
+        """
+        Loads the SUPER results in the cache and removes the temp folder.
+
+        :param path: Path to the file scanned.
+        :type path: Path
+        :param folder_name: Name of the temp folder where the results are stored.
+        :type folder_name: str
+        :raise: Exception if SUPER fails to decompile apk.
+        """
+        file_name = self.__find_file(f"dependencies{sep}{folder_name}{sep}results")
+        if file_name and Path(file_name).exists():  # load the temp file results
+            with open(file_name, "r") as file:  # load temp file
+                data = file.read()
+                self.__cache[str(path.absolute())] = Parser(json.loads(data)).output()
+                self.__covered[str(path.absolute())] = self.__rule_names
+
+            rm_rf(f"dependencies{sep}{folder_name}")
+        else:
+            raise Exception("Couldn't decompile the APK")
+
     def __super_scan(self, path: Path, args: list, force: bool):
         """
         Internal function to run SUPER.
@@ -213,43 +363,145 @@ class Super:
         :raise: Exception if SUPER fails to decompile apk.
         """
         if force:
-            self.__logging.debug("Starting SUPER analysis")
             folder_name = uuid.uuid4().hex
-            self.__logging.debug(
-                f"Scanning {path.absolute()}, saving result to temp folder {folder_name}"
-            )
             with open(devnull, "w") as null:
-                cmd = [
-                    "super-analyzer",
-                    "--results",
-                    f"dependencies{sep}{folder_name}{sep}results",
-                    "--dist",
-                    f"dependencies{sep}{folder_name}{sep}dist",
-                    "--rules",
-                    f"configs{sep}tls_rules.json",
-                    "--json",
-                ]
-
-                if args:
-                    self.__logging.debug(f"Scanning with personalized args: {args}")
-                    for arg in args:
-                        cmd.append(arg)
-                cmd.append(str(path.absolute()))
-                exit_code = self.subprocess_call(cmd, null)
-                self.__logging.debug(f"exit code: {exit_code}")
-                file_name = self.__find_file(
-                    f"dependencies{sep}{folder_name}{sep}results"
+                exit_code = self.subprocess_call(
+                    self.__command(path, args, folder_name), null
                 )
-                if Path(file_name).exists():  # load the temp file results
-                    with open(file_name, "r") as file:  # load temp file
-                        data = file.read()
-                        self.__cache[str(path.absolute())] = Parser(
-                            json.loads(data)
-                        ).output()
-
-                    rm_rf(f"dependencies{sep}{folder_name}")
-                else:
-                    raise Exception("Couldn't decompile the APK")
+            self.__logging.debug(f"exit code: {exit_code}")
+            self.__load_results(path, folder_name)
+            self.__save_to_disk(path, args)
         else:
-            if str(path.absolute()) not in self.__cache:
+            if not self.__is_covered(path) and not self.__load_from_disk(path, args):
                 self.__super_scan(path, args, force=True)
+
+    def __is_covered(self, path: Path) -> bool:
+        """
+        Check if the cached results of a file include the rules asked.
+
+        The rules of the cached scan are added to the next one, so that the
+        results of the previous callers stay available.
+
+        :param path: Path to the file to be scanned.
+        :type path: Path
+        :return: True if the rules asked are a subset of the ones cached
+        :rtype: bool
+        """
+        file_id = str(path.absolute())
+        if file_id not in self.__cache:
+            return False
+        covered = self.__covered.get(file_id)
+        if covered is None or (
+            self.__rule_names is not None and self.__rule_names <= covered
+        ):
+            return True
+        if self.__rule_names is not None:
+            self.__rule_names = self.__rule_names | covered
+        return False
+
+    def __rules_file(self) -> str:
+        """
+        Rules file with only the rules asked, built once for each set of rules.
+
+        :return: path of the rules file
+        :rtype: str
+        """
+        if self.__rule_names is None:
+            return self.__rules
+        with self.__rules_lock:
+            if self.__rule_names not in self.__rules_files:
+                with open(self.__rules) as file:
+                    rules = json.load(file)
+                names = {name.lower() for name in self.__rule_names}
+                trimmed = [rule for rule in rules if rule["label"].lower() in names]
+                missing = names - {rule["label"].lower() for rule in trimmed}
+                if missing:
+                    self.__logging.warning(f"SUPER rules not found: {missing}")
+                folder = f"dependencies{sep}super_rules"
+                makedirs(folder, exist_ok=True)
+                file_name = f"{folder}{sep}{Disk_cache.key(sorted(names), rules)}.json"
+                temp_name = f"{file_name}.{uuid.uuid4().hex}"
+                with open(temp_name, "w") as file:
+                    json.dump(trimmed, file, indent=4)
+                replace(temp_name, file_name)  # atomic, for the other processes
+                self.__rules_files[self.__rule_names] = file_name
+            return self.__rules_files[self.__rule_names]
+
+    def __tool_version(self) -> str:
+        """
+        Version of super-analyzer, obtained once.
+
+        :return: the output of super-analyzer --version, unknown if it fails
+        :rtype: str
+        """
+        if Super.__version is None:
+            try:
+                Super.__version = subprocess.run(
+                    ["super-analyzer", "--version"],
+                    capture_output=True,
+                    text=True,
+                ).stdout.strip()
+            except OSError:
+                Super.__version = "unknown"
+        return Super.__version
+
+    def __disk_key(self, path: Path, args: list) -> str:
+        """
+        Key of a scan in the on-disk cache.
+
+        The APK is identified by its content, so the same build is found also
+        under a different path.
+
+        :param path: Path to the file scanned.
+        :type path: Path
+        :param args: Additional arguments passed to SUPER.
+        :type args: list
+        :return: the key
+        :rtype: str
+        """
+        return Disk_cache.key(
+            file_digest(path),
+            list(args),
+            self.__tool_version(),
+            file_digest(self.__rules_file()),
+        )
+
+    def __load_from_disk(self, path: Path, args: list) -> bool:
+        """
+        Load the results of a previous scan from the on-disk cache, if enabled.
+
+        :param path: Path to the file to be scanned.
+        :type path: Path
+        :param args: Additional arguments to be passed to SUPER.
+        :type args: list
+        :return: True if the results were found
+        :rtype: bool
+        """
+        if not self.__input_dict["cache"]:
+            return False
+        results = Disk_cache("super").get(self.__disk_key(path, args))
+        if results is None:
+            return False
+        self.__logging.debug(f"Loaded SUPER results of {path} from the disk cache")
+        self.__cache[str(path.absolute())] = results
+        self.__covered[str(path.absolute())] = self.__rule_names
+        return True
+
+    def __save_to_disk(self, path: Path, args: list):
+        """
+        Save the results of a scan in the on-disk cache, if enabled.
+
+        :param path: Path to the file scanned.
+        :type path: Path
+        :param args: Additional arguments passed to SUPER.
+        :type args: list
+        """
+        if self.__input_dict["cache"]:
+            disk_cache = Disk_cache("super")
+            disk_cache.set(
+                self.__disk_key(path, args),
+                self.__cache[str(path.absolute())],
+                ttl=self.__input_dict["cache_ttl"],
+            )
+            # drop the expired results and the oldest ones over the size limit
+            disk_cache.evict(max_size=self.__disk_cache_size)
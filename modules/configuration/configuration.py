@@ -1,11 +1,16 @@
+import hashlib
+import re
 from enum import Enum
 from pathlib import Path
 
-from modules.configuration.configuration_base import Config_base
+from modules.configuration.configuration_base import Config_base, Directives
+from utils.cache import Disk_cache
 from utils.logger import Logger
 from utils.validation import Validator
 from crossplane import parse as nginx_parse
+from crossplane import __version__ as crossplane_version
 from apacheconfig import make_loader
+from apacheconfig import __version__ as apacheconfig_version
 
 
 class Configuration:
@@ -22,7 +27,17 @@ class Configuration:
         APACHE = 1
         NGINX = 2
 
-    def __init__(self, path: str, type_: Type = Type.AUTO, port=None):
+    # the parsed tree depends on the included files too, not only on the content
+    __INCLUDE = re.compile(rb"^\s*include", re.IGNORECASE | re.MULTILINE)
+
+    def __init__(
+        self,
+        path: str,
+        type_: Type = Type.AUTO,
+        port=None,
+        cache: bool = False,
+        cache_ttl: int = 86400,
+    ):
         """
         :param path: path to the configuration file
         :type path: str
@@ -30,11 +45,25 @@ class Configuration:
         :type type_: Type
         :param port: port to use for the check.
         :type port: str
+        :param cache: reuse the parsed configuration saved on disk for the same content
+        :type cache: bool
+        :param cache_ttl: seconds before a parsed configuration saved on disk expires
+        :type cache_ttl: int
         """
-        Validator([(path, str), (type_, self.Type), (port if port else "", str)])
+        Validator(
+            [
+                (path, str),
+                (type_, self.Type),
+                (port if port else "", str),
+                (cache, bool),
+                (cache_ttl, int),
+            ]
+        )
         self.__path = path
         self.__type = type_
         self.__port = port
+        self.__cache = cache
+        self.__cache_ttl = cache_ttl
         self.__logging = Logger("Configuration APACHE/NGINX")
         self.__loaded_conf = self.__load_conf(path)
 
@@ -80,6 +109,57 @@ class Configuration:
         assert (
             file.exists()
         ), f"Can't find the APACHE/NGINX file to parse at {file.absolute()}"
+        key = self.__disk_key(file) if self.__cache else None
+        if key:
+            parsed = Disk_cache("configuration").get(key)
+            if parsed is not None:
+                self.__logging.debug(f"Loaded the parsed {path} from the disk cache")
+                self.__type = self.Type[parsed["type"]]
+                return parsed["tree"]
+        results = self.__parse(file)
+        if key:
+            try:
+                Disk_cache("configuration").set(
+                    key,
+                    {"type": self.__type.name, "tree": results},
+                    ttl=self.__cache_ttl,
+                )
+            except (TypeError, ValueError) as e:  # not JSON serializable
+                self.__logging.warning(f"Couldn't cache the parsed {path}: {e}")
+        return results
+
+    def __disk_key(self, file: Path):
+        """
+        Key of a parsed configuration in the on-disk cache.
+
+        The file is identified by its content, the parsers by their versions. A file
+        including other files isn't cached.
+
+        :param file: path to the configuration file
+        :type file: Path
+        :return: the key, None if the file can't be cached
+        :rtype: str
+        """
+        content = file.read_bytes()
+        if self.__INCLUDE.search(content):
+            self.__logging.debug(f"{file} includes other files, not cached.")
+            return None
+        return Disk_cache.key(
+            hashlib.sha256(content).hexdigest(),
+            self.__type.name,
+            apacheconfig_version,
+            crossplane_version,
+        )
+
+    def __parse(self, file: Path) -> dict:
+        """
+        Parse the configuration file, detecting its type if needed.
+
+        :param file: path to the configuration file
+        :type file: Path
+        :return: loaded configuration
+        :rtype: dict
+        """
         if self.__type == self.Type.AUTO:
             try:
                 results = self.__load_apache_conf(file)
@@ -144,6 +224,7 @@ class Configuration:
         :rtype: dict
         """
         br = {"global": {}}
+        directives = Directives(self.__loaded_conf)
         for name, module in modules.items():
             if self.__is_config_enabled(module):
                 self.__blackbox(
@@ -156,6 +237,7 @@ class Configuration:
                     ignore_openssl=ignore_openssl,
                     boolean_results=br,
                     global_value=None,
+                    directives=directives,
                 )
         return br["global"]
 
@@ -202,12 +284,15 @@ class Configuration:
         boolean_results = {}
         is_executed = False  # needed to check if the for loop is executed, and so the boolean_results are filled
         boolean_results_global = self.__check_global(modules, openssl, ignore_openssl)
+        enabled = {
+            name for name, module in modules.items() if self.__is_config_enabled(module)
+        }
         for virtualhost in self.__obtain_vhost(port=self.__port):
             for vhost_name, vhost in virtualhost.items():
+                # normalised once, the conditions of all the modules read it
+                directives = Directives(vhost)
                 for name, module in modules.items():
-                    if self.__is_config_enabled(module) and self.__check_usage(
-                            module, vhost_name
-                    ):
+                    if name in enabled and self.__check_usage(module, vhost_name):
                         if not online:
                             self.__blackbox(
                                 module,
@@ -219,6 +304,7 @@ class Configuration:
                                 ignore_openssl,
                                 boolean_results,
                                 global_value=boolean_results_global,
+                                directives=directives,
                             )
                         else:
                             self.__hybrid(module, name, vhost, vhost_name)
@@ -258,6 +344,7 @@ class Configuration:
             ignore_openssl,
             boolean_results,
             global_value,
+            directives=None,
     ):
         """
         Internal method to check the configuration blackbox.
@@ -280,16 +367,20 @@ class Configuration:
         :type boolean_results: dict
         :param global_value: global boolean results
         :type global_value: dict
+        :param directives: normalised view of the vhost, shared by the modules
+        :type directives: Directives
         :return: dict changes made and edit boolean results as pointer.
         :rtype: dict
         """
         self.__logging.debug(f"Analyzing vulnerability {name} in vhost {vhost_name}..")
         if vhost_name not in boolean_results:
             boolean_results[vhost_name] = {}
-        is_empty = module.conf.is_empty(vhost)
+        if directives is None:
+            directives = Directives(vhost)
+        is_empty = module.conf.is_empty(directives)
 
         module_result = module.conf.condition(
-            vhost, openssl=openssl, ignore_openssl=ignore_openssl
+            directives, openssl=openssl, ignore_openssl=ignore_openssl
         )
         boolean_results[vhost_name][name] = (
             global_value[name]
@@ -307,6 +398,7 @@ class Configuration:
                 mitigation_and_raw["difference"] = self.__hybrid(
                     module, name, vhost, vhost_name
                 )
+                directives.invalidate()  # the fix edited the vhost
         boolean_results[vhost_name][name] = mitigation_and_raw.copy()
 
     def is_vuln(self, modules: dict, openssl=None, ignore_openssl=False):
@@ -1,4 +1,5 @@
 from enum import Enum
+from functools import lru_cache
 from ssl import OPENSSL_VERSION
 import logging
 from utils.validation import Validator
@@ -53,7 +54,9 @@ class OpenSSL:
         """
         return self.less_than(ver1, ver2)
 
-    def __compare(self, ver1, ver2, reverse=False):
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def __compare(ver1, ver2, reverse=False):
         """
         Internal method to compare two OpenSSL versions.
 
@@ -67,6 +70,8 @@ class OpenSSL:
         :rtype: bool
         :raise: AssertionError if length of ver1 and ver2 is different than 5 or 6 chars.
 
+        The modules compare the same few versions for every VirtualHost, the results
+        are cached.
         """
 
         assert (
@@ -83,6 +88,60 @@ class OpenSSL:
         return (ver1 < ver2) if not reverse else (ver1 > ver2)
 
 
+class Directives:
+    """
+    Normalised view of the directives of a VirtualHost.
+
+    The lowercased values are computed once and shared by the conditions of all the
+    modules. After a fix edits the VirtualHost, the view must be invalidated.
+    """
+
+    def __init__(self, vhost: dict):
+        """
+        :param vhost: VirtualHost object.
+        :type vhost: dict
+        """
+        self.vhost = vhost
+        self.__lower = {}
+
+    @staticmethod
+    def of(vhost):
+        """
+        Obtain the view of a VirtualHost, the VirtualHost itself if already a view.
+
+        :param vhost: VirtualHost object or its view.
+        :type vhost: dict or Directives
+        :returns: the view.
+        :rtype: Directives
+        """
+        return vhost if isinstance(vhost, Directives) else Directives(vhost)
+
+    def __contains__(self, key):
+        return key in self.vhost
+
+    def __getitem__(self, key):
+        return self.vhost[key]
+
+    def lower(self, key: str) -> str:
+        """
+        Obtain the lowercased value of a directive.
+
+        :param key: name of the directive.
+        :type key: str
+        :returns: the lowercased value, empty if the directive is missing.
+        :rtype: str
+        """
+        if key not in self.__lower:
+            self.__lower[key] = self.vhost[key].lower() if key in self.vhost else ""
+        return self.__lower[key]
+
+    def invalidate(self):
+        """
+        Drop the normalised values, to be called after editing the VirtualHost.
+        """
+        self.__lower.clear()
+
+
 class Type:
     """
     Type of configuration.
@@ -163,10 +222,7 @@ class Parse_configuration_protocols(Config_base):
         :returns: True if vhost is using ONLY the TLS version x.
         :rtype: bool
         """
-        return (
-            "SSLProtocol" in vhost
-            and vhost["SSLProtocol"].lower() == f"tlsv1.{version}"
-        )
+        return Directives.of(vhost).lower("SSLProtocol") == f"tlsv1.{version}"
 
     def __init__(self, openssl: str, protocols: dict):
         """
@@ -179,6 +235,10 @@ class Parse_configuration_protocols(Config_base):
         self.__protocols = protocols
         self.__key = "SSLProtocol"
         Validator([(openssl, str), (protocols, dict)])
+        # what must appear in the lowercased directive for the vhost to be safe
+        self.__needles = [
+            operation + protocol.lower() for protocol, operation in protocols.items()
+        ]
 
     def fix(self, vhost):
         """
@@ -215,30 +275,27 @@ class Parse_configuration_protocols(Config_base):
         :rtype: bool
         """
 
+        vhost = Directives.of(vhost)
         if self.is_tls(vhost, version=3):
             logging.debug("TLSv1.3 Detected as mutually allowed.")
             return False
-        key = self.__key
         openssl_greater_than = self.__openssl
         if openssl is None:
             openssl = ""
         Validator([(openssl, str)])
+        value = vhost.lower(self.__key)
         if not ignore_openssl:
             if openssl:
                 is_safe = self.openSSL.is_safe(ver1=openssl_greater_than, ver2=openssl)
             else:
                 is_safe = self.openSSL.is_safe(ver1=openssl_greater_than)
 
-            return not is_safe and True in (
-                operation + cipher.lower()
-                not in (vhost[key].lower() if key in vhost else "")
-                for cipher, operation in self.__protocols.items()
+            return not is_safe and any(
+                needle not in value for needle in self.__needles
             )
         else:
-            return True in (
-                operation + cipher.lower()
-                not in (vhost[key].lower() if key in vhost else "")
-                for cipher, operation in self.__protocols.items()
+            return any(
+                needle not in value for needle in self.__needles
             )  # is vulnerable if True
 
 
@@ -252,6 +309,8 @@ class Parse_configuration_ciphers(Config_base):
         self.__ciphers = ciphers
         self.__key = "SSLCipherSuite"
         Validator([(openssl, str), (ciphers, list)])
+        # what must appear in the lowercased directive for the vhost to be safe
+        self.__needles = ["!" + cipher.lower() for cipher in ciphers]
 
     def is_tls(self, vhost, version=3):
         """
@@ -264,10 +323,7 @@ class Parse_configuration_ciphers(Config_base):
         :returns: True if vhost is using ONLY the TLS version x.
         :rtype: bool
         """
-        return (
-            "SSLProtocol" in vhost
-            and vhost["SSLProtocol"].lower() == f"tlsv1.{version}"
-        )
+        return Directives.of(vhost).lower("SSLProtocol") == f"tlsv1.{version}"
 
     def is_empty(self, vhost):
         """
@@ -315,28 +371,27 @@ class Parse_configuration_ciphers(Config_base):
         :rtype: bool
 
         """
+        vhost = Directives.of(vhost)
         if self.is_tls(vhost, version=3):
             logging.debug("TLSv1.3 Detected as mutually allowed.")
             return False
-        key = self.__key
         openssl_greater_than = self.__openssl
         if openssl is None:
             openssl = ""
         Validator([(openssl, str)])
+        value = vhost.lower(self.__key)
         if not ignore_openssl:
             if openssl:
                 is_safe = self.openSSL.is_safe(ver1=openssl_greater_than, ver2=openssl)
             else:
                 is_safe = self.openSSL.is_safe(ver1=openssl_greater_than)
 
-            return not is_safe and True in (
-                "!" + cipher.lower() not in (vhost[key].lower() if key in vhost else "")
-                for cipher in self.__ciphers
+            return not is_safe and any(
+                needle not in value for needle in self.__needles
             )
         else:
-            return True in (
-                "!" + cipher.lower() not in (vhost[key].lower() if key in vhost else "")
-                for cipher in self.__ciphers
+            return any(
+                needle not in value for needle in self.__needles
             )  # is vulnerable if True
 
 
@@ -427,10 +482,7 @@ class Parse_configuration_checks_compression(Config_base):
         :returns: True if vhost is using only a specific version of TLS.
         :rtype: bool
         """
-        return (
-            "SSLProtocol" in vhost
-            and vhost["SSLProtocol"].lower() == f"tlsv1.{version}"
-        )
+        return Directives.of(vhost).lower("SSLProtocol") == f"tlsv1.{version}"
 
     def is_empty(self, vhost):
         """
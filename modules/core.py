@@ -1,9 +1,19 @@
+import logging
+import struct
+import tempfile
+import uuid
+import zlib
+from multiprocessing import get_context
+from os import close, mkdir, remove
 from os.path import sep
 from pathlib import Path
 
 from modules.configuration.configuration import Configuration
-from modules.server.testssl_base import Testssl_base
+from modules.planner import Planner
+from modules.server.wrappers.https_hsts import Https
 from modules.server.wrappers.testssl import Testssl
+from modules.server.wrappers.tlsfuzzer import Tlsfuzzer
+from utils.apk import Apk
 from utils.booleanize import boolean_results
 from utils.logger import Logger
 from utils.colors import Color
@@ -15,6 +25,8 @@ from modules.report import Report as Report_module
 from utils.urls import link_sep
 from utils.urls import has_wildcard, remove_wildcard
 from utils.subdomain_enumeration import enumerate
+from utils.stream import Result_stream
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 
 
 class Core:
@@ -42,6 +54,9 @@ class Core:
         DOMAINS = 2
         CONFIGURATION = 3
 
+    # rounds of HTTP(S) probes prefetched before the analysis of their domains
+    __prefetch_rounds = 4
+
     def __init__(
         self,
         hostname_or_path: str or list,
@@ -55,9 +70,25 @@ class Core:
         openssl_version=None,
         ignore_openssl=False,
         stix=False,
+        jobs=1,
+        parallel=False,
+        cache=False,
+        cache_ttl=86400,
+        resume=None,
+        http_concurrency=100,
+        http_timeout=5,
+        testssl_batch=0,
+        testssl_archive=None,
+        testssl_shards=1,
+        triage=True,
+        dex_jobs=1,
+        incremental=False,
+        tlsfuzzer_concurrency=4,
+        tlsfuzzer_batch=0,
     ):
         """
-        :param hostname_or_path: hostname or path to scan
+        :param hostname_or_path: hostname or path to scan, a list of domains or APKs
+            for a batch analysis
         :type hostname_or_path: str or list
         :param configuration: path to configuration file
         :type configuration: str or list
@@ -79,13 +110,51 @@ class Core:
         :type ignore_openssl: bool
         :param stix: generate stix report
         :type stix: bool
+        :param jobs: number of hosts or APKs to analyze concurrently
+        :type jobs: int
+        :param parallel: run the data sources of each host concurrently
+        :type parallel: bool
+        :param cache: use the persistent on-disk cache of the scan results
+        :type cache: bool
+        :param cache_ttl: seconds before a cached scan result expires
+        :type cache_ttl: int
+        :param resume: journal of the analysis, kept after the report: the hosts
+            already in it are skipped, the new ones appended
+        :type resume: str
+        :param http_concurrency: HTTP(S) probes at the same time for a domain list
+        :type http_concurrency: int
+        :param http_timeout: seconds before a HTTP(S) probe fails
+        :type http_timeout: int
+        :param testssl_batch: domains scanned by each testssl.sh mass testing run, 0 to
+            scan each domain separately
+        :type testssl_batch: int
+        :param testssl_archive: folder where to archive the complete testssl.sh output
+        :type testssl_archive: str
+        :param testssl_shards: concurrent testssl.sh runs splitting the checks of a host
+        :type testssl_shards: int
+        :param triage: skip the Android modules whose classes aren't in the APK
+        :type triage: bool
+        :param dex_jobs: processes analyzing the DEX files of a multidex APK
+        :type dex_jobs: int
+        :param incremental: reuse the Mallodroid findings of a previous build of the
+            same package with the same DEX files
+        :type incremental: bool
+        :param tlsfuzzer_concurrency: tlsfuzzer scripts to run at the same time
+        :type tlsfuzzer_concurrency: int
+        :param tlsfuzzer_batch: domains whose tlsfuzzer scripts run in a single pool
+            before analyzing them, 0 to run the scripts of each domain with its
+            analysis
+        :type tlsfuzzer_batch: int
         """
         if to_exclude is None:
             to_exclude = []
         self.__logging = Logger("Core")
         self.__input_dict = {}
         self.__cache = {}
+        self.__completed = set()
         modules = None
+        # the configuration as given, for the workers of a batch of APKs
+        self.__configuration = configuration
         if isinstance(configuration, list):  # if modules as argument
             modules = configuration
             configuration = "modules_list"
@@ -101,6 +170,21 @@ class Core:
             openssl_version=openssl_version,
             ignore_openssl=ignore_openssl,
             stix=stix,
+            jobs=jobs,
+            parallel=parallel,
+            cache=cache,
+            cache_ttl=cache_ttl,
+            resume=resume,
+            http_concurrency=http_concurrency,
+            http_timeout=http_timeout,
+            testssl_batch=testssl_batch,
+            testssl_archive=testssl_archive,
+            testssl_shards=testssl_shards,
+            triage=triage,
+            dex_jobs=dex_jobs,
+            incremental=incremental,
+            tlsfuzzer_concurrency=tlsfuzzer_concurrency,
+            tlsfuzzer_batch=tlsfuzzer_batch,
         )
         self.__cache[configuration] = self.__load_configuration(modules)
         self.__exec(
@@ -153,8 +237,45 @@ class Core:
                     str,
                 ),
                 (kwargs["stix"], bool),
+                (kwargs["jobs"], int),
+                (kwargs["parallel"], bool),
+                (kwargs["cache"], bool),
+                (kwargs["cache_ttl"], int),
+                ("" if not kwargs["resume"] else kwargs["resume"], str),
+                (kwargs["http_concurrency"], int),
+                (kwargs["http_timeout"], int),
+                (kwargs["testssl_batch"], int),
+                (
+                    ""
+                    if not kwargs["testssl_archive"]
+                    else kwargs["testssl_archive"],
+                    str,
+                ),
+                (kwargs["testssl_shards"], int),
+                (kwargs["triage"], bool),
+                (kwargs["dex_jobs"], int),
+                (kwargs["incremental"], bool),
+                (kwargs["tlsfuzzer_concurrency"], int),
+                (kwargs["tlsfuzzer_batch"], int),
             ]
         )
+        assert kwargs["jobs"] >= 1, "The number of jobs must be at least 1."
+        assert kwargs["cache_ttl"] > 0, "The cache TTL must be positive."
+        assert (
+            kwargs["http_concurrency"] >= 1
+        ), "The HTTP concurrency must be at least 1."
+        assert kwargs["testssl_batch"] >= 0, "The testssl batch can't be negative."
+        assert kwargs["testssl_shards"] >= 1, "The testssl shards must be at least 1."
+        assert kwargs["dex_jobs"] >= 1, "The DEX jobs must be at least 1."
+        assert (
+            kwargs["tlsfuzzer_concurrency"] >= 1
+        ), "The tlsfuzzer concurrency must be at least 1."
+        assert kwargs["tlsfuzzer_batch"] >= 0, "The tlsfuzzer batch can't be negative."
+        assert not (
+            kwargs["type_of_analysis"] == self.Analysis.CONFIGURATION
+            and isinstance(kwargs["hostname_or_path"], list)
+            and kwargs.get("apply_fix")
+        ), "Many configurations can only be fixed in place, use --apply-fix alone."
         kwargs["to_exclude"] = list(map(str.lower, kwargs["to_exclude"]))
         # set outputfilename if not already set
         if "output" not in kwargs or not kwargs["output"]:  # if not output
@@ -199,33 +320,6 @@ class Core:
             self.__input_dict["configuration"] if not modules else modules
         ).output()
 
-    def __is_testssl(self, module: object) -> bool:
-        """
-        Checks if the module is a testssl module
-
-        :param module: module to check
-        :type module: object
-        :return: True if the module is a testssl module
-        :rtype: bool
-        """
-        return isinstance(module, Testssl_base)
-
-    def __add_testssl_args(self, module: Testssl_base, testssl_args: list) -> list:
-        """
-        Adds testssl arguments from the module
-
-        :param module: module to add arguments from
-        :type module: Testssl_base
-        :param testssl_args: list of arguments
-        :type testssl_args: list
-        :return: list of arguments
-        :rtype: list
-
-        """
-        if self.__is_testssl(module):
-            testssl_args += module._arguments
-        return testssl_args
-
     def __conf_analysis(
         self,
         path,
@@ -253,7 +347,12 @@ class Core:
         :return: configuration
         :rtype: dict
         """
-        conf = Configuration(path, port=port)
+        conf = Configuration(
+            path,
+            port=port,
+            cache=self.__input_dict["cache"],
+            cache_ttl=self.__input_dict["cache_ttl"],
+        )
         if self.__input_dict["apply_fix"] != "":
             results = conf.fix(
                 loaded_modules,
@@ -271,38 +370,7 @@ class Core:
             )
         return results
 
-    def __preanalysis_testssl(
-        self, testssl_args: list, type_of_analysis: Analysis, hostname: str, port: str
-    ):
-        """
-        Preanalysis of testssl
-
-        :param testssl_args: arguments for testssl
-        :type testssl_args: list
-        :param type_of_analysis: type of analysis
-        :type type_of_analysis: Analysis
-        :param hostname: hostname
-        :type hostname: str
-        :param port: port to use
-        :type port: str
-        :return: preanalysis
-        :rtype: dict
-        """
-        if testssl_args and (
-            type_of_analysis == self.Analysis.HOST
-            or type_of_analysis == self.Analysis.DOMAINS
-        ):
-            self.__logging.debug(
-                f"Starting preanalysis testssl with args {testssl_args}..."
-            )
-            Testssl().run(
-                hostname=f"{hostname}:{port}",
-                args=testssl_args,
-                force=True,  # this should solve for multiple scans on the same IP with different ports
-            )
-            self.__logging.debug(f"Preanalysis testssl done.")
-
-    def __load_modules(self, parsed_configuration: dict) -> (dict, dict, list):
+    def __load_modules(self, parsed_configuration: dict) -> (dict, dict):
         """
         Loads the modules
 
@@ -314,7 +382,6 @@ class Core:
 
         loaded_modules = {}
         loaded_arguments = {}
-        testssl_args = []
         for name, module_args in parsed_configuration.items():
             if name not in self.__input_dict["to_exclude"]:
                 Module, args = module_args
@@ -328,12 +395,85 @@ class Core:
 
                 loaded_modules[name] = Module()
                 loaded_arguments[name] = args.copy()
-                testssl_args = self.__add_testssl_args(
-                    loaded_modules[name], testssl_args
-                )
             else:
                 self.__logging.debug(f"Module {name} excluded, skipping..")
-        return loaded_modules, loaded_arguments, testssl_args
+        return loaded_modules, loaded_arguments
+
+    def __run_module(
+        self,
+        name: str,
+        module: object,
+        type_of_analysis: Analysis,
+        hostname_or_path: str,
+        loaded_arguments: dict,
+        port=None,
+    ) -> dict:
+        """
+        Run a single module
+
+        :param name: name of the module
+        :type name: str
+        :param module: loaded module
+        :type module: object
+        :param type_of_analysis: type of analysis
+        :type type_of_analysis: Analysis
+        :param hostname_or_path: hostname or path to the file
+        :type hostname_or_path: str
+        :param loaded_arguments: arguments for the modules
+        :type loaded_arguments: dict
+        :param port: port to use
+        :type port: str
+        :return: results of the module
+        :rtype: dict
+        """
+        if type_of_analysis != self.Analysis.APK:  # server analysis
+            hostname_or_path_type = "hostname"
+        else:  # android analysis
+            hostname_or_path_type = "path"
+        if hostname_or_path_type not in loaded_arguments[name]:
+            loaded_arguments[name][hostname_or_path_type] = hostname_or_path
+        args = loaded_arguments[name]
+        if type_of_analysis != self.Analysis.APK:  # server analysis
+            args["port"] = port  # set the port
+        self.__logging.info(f"{Color.CBEIGE}Running {name} module...")
+        return module.run(**args)
+
+    def __triage(self, loaded_modules: dict, path: str) -> list:
+        """
+        Find the Android modules that can't apply to an APK, without decompiling it
+
+        The symbols declared by each module with ``_triggers()`` are searched in the
+        string tables of the DEX files. A module none of whose symbols appear can't
+        find anything. If the APK can't be read, no module is skipped.
+
+        :param loaded_modules: loaded modules
+        :type loaded_modules: dict
+        :param path: path of the APK
+        :type path: str
+        :return: names of the modules to skip
+        :rtype: list
+        """
+        triggers = {
+            name: module._triggers()
+            for name, module in loaded_modules.items()
+            if hasattr(module, "_triggers") and module._triggers() is not None
+        }
+        if not triggers:
+            return []
+        try:
+            with Apk(path) as apk:
+                found = apk.find(set().union(*triggers.values()))
+        except (ValueError, IndexError, OSError, zlib.error, struct.error) as e:
+            self.__logging.warning(f"Triage of {path} failed, running all modules: {e}")
+            return []
+        skipped = [
+            name for name, symbols in triggers.items() if found.isdisjoint(symbols)
+        ]
+        if skipped:
+            self.__logging.info(
+                f"Skipping {', '.join(skipped)}: their classes aren't in {path}."
+            )
+        return skipped
 
     def __run_analysis(
         self,
@@ -344,7 +484,7 @@ class Core:
         port=None,
     ) -> dict:
         """
-        Run the analysis
+        Run the analysis, executing each planned data source once before the modules needing it
 
         :param loaded_modules: loaded modules
         :type loaded_modules: dict
@@ -359,39 +499,85 @@ class Core:
         :return: results
         :rtype: dict
         """
-        results = {}
-        if type_of_analysis != self.Analysis.APK:  # server analysis
-            hostname_or_path_type = "hostname"
-        else:  # android analysis
-            hostname_or_path_type = "path"
-        for name, module in loaded_modules.items():
-            if hostname_or_path_type not in loaded_arguments[name]:
-                loaded_arguments[name][hostname_or_path_type] = hostname_or_path
-            args = loaded_arguments[name]
-            if type_of_analysis != self.Analysis.APK:  # server analysis
-                args["port"] = port  # set the port
-            self.__logging.info(f"{Color.CBEIGE}Running {name} module...")
-            results[name] = module.run(**args)
-        return results
+        skipped = []
+        if type_of_analysis == self.Analysis.APK and self.__input_dict["triage"]:
+            skipped = self.__triage(loaded_modules, hostname_or_path)
+        results = {name: {} for name in skipped}
+        plan = Planner(
+            {
+                name: module
+                for name, module in loaded_modules.items()
+                if name not in skipped
+            },
+            cache=self.__input_dict["cache"],
+            cache_ttl=self.__input_dict["cache_ttl"],
+            batched=self.__input_dict["type_of_analysis"] == self.Analysis.DOMAINS
+            and self.__input_dict["testssl_batch"] > 0,
+            archive=self.__input_dict["testssl_archive"],
+            shards=self.__input_dict["testssl_shards"],
+            dex_jobs=self.__input_dict["dex_jobs"],
+            incremental=self.__input_dict["incremental"],
+            tlsfuzzer_concurrency=self.__input_dict["tlsfuzzer_concurrency"],
+            tlsfuzzer_prefetched=self.__input_dict["type_of_analysis"]
+            == self.Analysis.DOMAINS
+            and self.__input_dict["tlsfuzzer_batch"] > 0,
+        )
+        for name in loaded_modules:
+            if plan.dependencies(name):  # the data sources are run by the plan
+                loaded_arguments[name].setdefault("force", False)
+        for name in plan.execute(
+            hostname_or_path, port, parallel=self.__input_dict["parallel"]
+        ):
+            results[name] = self.__run_module(
+                name,
+                loaded_modules[name],
+                type_of_analysis,
+                hostname_or_path,
+                loaded_arguments,
+                port,
+            )
+        return {
+            name: results[name] for name in loaded_modules
+        }  # keep the modules order
 
-    def __call_output_modules(self, res: dict):
+    def __read_stream(self, path: str):
+        """
+        Read the results stream, loading again the modules of each host
+
+        :param path: path of the results stream
+        :type path: str
+        :return: generator of (hostname, loaded modules, results) tuples
+        :rtype: Generator
+        """
+        parsed_configuration = self.__cache[self.__input_dict["configuration"]]
+        instances = {}  # the modules are only needed by the output, one is enough
+        for hostname, names, results in Result_stream.read(path):
+            loaded_modules = {}
+            for name in names:
+                if name not in instances:
+                    Module, _ = parsed_configuration[name]
+                    instances[name] = Module()
+                loaded_modules[name] = instances[name]
+            yield hostname, loaded_modules, results
+
+    def __call_output_modules(self, stream_path: str):
 
         """
         Call output modules
 
-        :param res: results
-        :type res: dict
-        :loaded_modules: loaded modules
-        :type loaded_modules: dict
+        :param stream_path: path of the results stream
+        :type stream_path: str
         """
 
-        if (
+        if self.__input_dict["output_type"] == self.Report.RAW:
+            self.__logging.info(f"Raw results saved at {stream_path}")
+        elif (
             self.__input_dict["output_type"] == self.Report.HTML
             or self.__input_dict["output_type"] == self.Report.PDF
         ):
             Report_module().run(
                 path=self.__input_dict["output"],
-                results=res,
+                results=self.__read_stream(stream_path),
                 mode=Report_module.Mode.MODULES
                 if "group_by" in self.__input_dict
                 and self.__input_dict["group_by"] == "module"
@@ -422,7 +608,7 @@ class Core:
 
     def __wrap_execution(
         self,
-        res: dict,
+        stream: Result_stream,
         domain: str,
         type_of_analysis: Analysis,
         configuration: str,
@@ -439,20 +625,291 @@ class Core:
                     type_of_analysis, host, configuration, port
                 )
                 for vhost, value in raw_res.items():  # unpack the results
-                    if vhost not in res:
-                        res[vhost] = {}
-                    res[vhost]["results"] = value.copy()
-                    res[vhost][
-                        "loaded_modules"
-                    ] = loaded_modules  # to make it work report-wise
                     # we need a dict of loaded modules for each vhost
+                    stream.write(vhost, loaded_modules, value)
             else:
-                if host not in res:
-                    res[host] = {}
-                (
-                    res[host]["loaded_modules"],
-                    res[host]["results"],
-                ) = self.__exec_anaylsis(type_of_analysis, host, configuration, port)
+                if tuple(link_sep(host)) in self.__completed:
+                    self.__logging.info(f"Skipping {host}, already in the journal.")
+                    continue
+                loaded_modules, results = self.__exec_anaylsis(
+                    type_of_analysis, host, configuration, port
+                )
+                stream.write(host, loaded_modules, results)
+
+    def __exec_pool(
+        self,
+        stream: Result_stream,
+        domains: list,
+        type_of_analysis: Analysis,
+        configuration: str,
+        port: str = None,
+    ):
+        """
+        Execute the analysis of each domain on a bounded pool of workers
+
+        The analysis is mostly spent waiting on external tools and on the network,
+        so threads are enough to overlap the scans of different hosts.
+
+        :param stream: results stream, written as soon as each domain is done
+        :type stream: Result_stream
+        :param domains: domains to analyze
+        :type domains: list
+        :param type_of_analysis: type of analysis
+        :type type_of_analysis: Analysis
+        :param configuration: configuration
+        :type configuration: str
+        :param port: port to use
+        :type port: str
+        """
+        jobs = self.__input_dict["jobs"]
+        self.__logging.info(f"Analyzing {len(domains)} domains with {jobs} jobs.")
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            futures = {
+                executor.submit(
+                    self.__wrap_execution,
+                    stream,
+                    domain,
+                    type_of_analysis,
+                    configuration,
+                    port,
+                ): domain
+                for domain in domains
+            }
+            for future in as_completed(futures):
+                future.result()  # raise the exception of the worker, if any
+                self.__logging.debug(f"Analysis of {futures[future]} completed.")
+
+    def __exec_apks(self, stream: Result_stream, apks: list, configuration: str):
+        """
+        Execute the analysis of a batch of APKs on a bounded pool of processes
+
+        The analysis of an APK is CPU bound, so each worker is a process. The
+        workers are reused, the modules are imported once for each of them.
+
+        :param stream: results stream, written as soon as each APK is done
+        :type stream: Result_stream
+        :param apks: paths of the APKs to analyze
+        :type apks: list
+        :param configuration: configuration
+        :type configuration: str
+        """
+        jobs = self.__input_dict["jobs"]
+        pending = [apk for apk in apks if tuple(link_sep(apk)) not in self.__completed]
+        if len(pending) < len(apks):
+            self.__logging.info(
+                f"Skipping {len(apks) - len(pending)} APKs, already in the journal."
+            )
+        apks = pending
+        self.__logging.info(f"Analyzing {len(apks)} APKs with {jobs} jobs.")
+        if jobs == 1:
+            for apk in apks:
+                self.__wrap_execution(stream, apk, self.Analysis.APK, configuration)
+            return
+        loaded_modules, _ = self.__load_modules(self.__cache[configuration])
+        options = {
+            "configuration": self.__configuration,
+            "to_exclude": self.__input_dict["to_exclude"],
+            "parallel": self.__input_dict["parallel"],
+            "cache": self.__input_dict["cache"],
+            "cache_ttl": self.__input_dict["cache_ttl"],
+            "triage": self.__input_dict["triage"],
+            "dex_jobs": self.__input_dict["dex_jobs"],
+            "incremental": self.__input_dict["incremental"],
+        }
+        # spawn, forking a process with running threads isn't safe
+        with ProcessPoolExecutor(
+            max_workers=jobs, mp_context=get_context("spawn")
+        ) as executor:
+            futures = {
+                executor.submit(
+                    _analyze_file,
+                    apk,
+                    self.Analysis.APK,
+                    options,
+                    logging.getLogger().level,
+                ): apk
+                for apk in apks
+            }
+            for future in as_completed(futures):
+                for path, names, results in future.result():
+                    stream.write(
+                        path, {name: loaded_modules[name] for name in names}, results
+                    )
+                self.__logging.debug(f"Analysis of {futures[future]} completed.")
+
+    def __exec_configurations(
+        self, stream: Result_stream, paths: list, configuration: str
+    ):
+        """
+        Execute the analysis of many configuration files on a bounded pool of processes
+
+        The results of all the files go in the same report, the name of each vhost
+        starts with the path of its file. A file that can't be analyzed is reported
+        in the log and skipped.
+
+        :param stream: results stream, written as soon as each file is done
+        :type stream: Result_stream
+        :param paths: paths of the configuration files
+        :type paths: list
+        :param configuration: configuration
+        :type configuration: str
+        """
+        jobs = self.__input_dict["jobs"]
+        self.__logging.info(f"Analyzing {len(paths)} configurations with {jobs} jobs.")
+        if jobs == 1:
+            for path in paths:
+                try:
+                    loaded_modules, raw_res = self.__exec_anaylsis(
+                        self.Analysis.CONFIGURATION, path, configuration
+                    )
+                except Exception as e:
+                    self.__logging.error(f"Couldn't analyze {path}: {e}")
+                    continue
+                for vhost, value in raw_res.items():
+                    stream.write(f"{path}: {vhost}", loaded_modules, value)
+            return
+        loaded_modules, _ = self.__load_modules(self.__cache[configuration])
+        options = {
+            "configuration": self.__configuration,
+            "to_exclude": self.__input_dict["to_exclude"],
+            "apply_fix": self.__input_dict["apply_fix"],
+            "openssl_version": self.__input_dict["openssl_version"],
+            "ignore_openssl": self.__input_dict["ignore_openssl"],
+            "cache": self.__input_dict["cache"],
+            "cache_ttl": self.__input_dict["cache_ttl"],
+        }
+        # spawn, forking a process with running threads isn't safe
+        with ProcessPoolExecutor(
+            max_workers=jobs, mp_context=get_context("spawn")
+        ) as executor:
+            futures = {
+                executor.submit(
+                    _analyze_file,
+                    path,
+                    self.Analysis.CONFIGURATION,
+                    options,
+                    logging.getLogger().level,
+                ): path
+                for path in paths
+            }
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    vhosts = future.result()
+                except Exception as e:
+                    self.__logging.error(f"Couldn't analyze {path}: {e}")
+                    continue
+                for vhost, names, results in vhosts:
+                    stream.write(
+                        f"{path}: {vhost}",
+                        {name: loaded_modules[name] for name in names},
+                        results,
+                    )
+                self.__logging.debug(f"Analysis of {path} completed.")
+
+    def __prefetchable(self, domains: list) -> list:
+        """
+        Filter the domains whose data can be collected in advance
+
+        :param domains: domains to analyze
+        :type domains: list
+        :return: the domains without wildcards and not already in the journal
+        :rtype: list
+        """
+        return [
+            domain
+            for domain in domains
+            if not has_wildcard(domain)  # enumerated later
+            and tuple(link_sep(domain)) not in self.__completed
+        ]
+
+    def __prefetch_window(self) -> int:
+        """
+        Domains whose data is collected in advance, before analyzing them
+
+        The window is bounded, so the prefetched data doesn't pile up in the caches
+        and the results of each window are written to the journal before the next.
+
+        :return: size of the window
+        :rtype: int
+        """
+        window = self.__input_dict["http_concurrency"] * self.__prefetch_rounds
+        if self.__input_dict["tlsfuzzer_batch"]:
+            window = min(window, self.__input_dict["tlsfuzzer_batch"])
+        return window
+
+    def __prefetch(self, domains: list, configuration: str):
+        """
+        Collect the data of a window of domains in one pass, if the modules need it:
+        the HTTP(S) probes and, in tlsfuzzer batch mode, the tlsfuzzer scripts
+
+        :param domains: domains to analyze
+        :type domains: list
+        :param configuration: configuration
+        :type configuration: str
+        """
+        loaded_modules, _ = self.__load_modules(self.__cache[configuration])
+        plan = Planner(loaded_modules)
+        domains = self.__prefetchable(domains)
+        if plan.https_types():
+            Https().prefetch(
+                domains,
+                plan.https_types(),
+                concurrency=self.__input_dict["http_concurrency"],
+                timeout=self.__input_dict["http_timeout"],
+            )
+        if self.__input_dict["tlsfuzzer_batch"] and plan.tlsfuzzer_scripts():
+            self.__logging.info(f"Running tlsfuzzer on {len(domains)} domains..")
+            Tlsfuzzer().run_hosts(
+                hostnames=[":".join(link_sep(domain)) for domain in domains],
+                scripts=plan.tlsfuzzer_scripts(),
+                force=True,
+                concurrency=self.__input_dict["tlsfuzzer_concurrency"],
+            )
+
+    def __prefetch_batch(self, domains: list, configuration: str):
+        """
+        Scan a batch of domains with a single testssl.sh mass testing run, if the
+        batch mode is on and the modules need it
+
+        :param domains: domains of the batch
+        :type domains: list
+        :param configuration: configuration
+        :type configuration: str
+        """
+        loaded_modules, _ = self.__load_modules(self.__cache[configuration])
+        plan = Planner(loaded_modules)
+        domains = self.__prefetchable(domains)
+        if self.__input_dict["testssl_batch"] and plan.testssl_arguments():
+            self.__logging.info(f"Scanning {len(domains)} domains with testssl.sh..")
+            Testssl().run_batch(
+                hostnames=[":".join(link_sep(domain)) for domain in domains],
+                args=plan.testssl_arguments(),
+                force=True,
+                cache=self.__input_dict["cache"],
+                cache_ttl=self.__input_dict["cache_ttl"],
+                keys=plan.testssl_keys(),
+                archive=self.__input_dict["testssl_archive"],
+            )
+
+    def __stream_path(self) -> (str, bool):
+        """
+        Path of the results stream: the journal to resume, the raw output or a
+        temporary file removed once the report is generated
+
+        :return: path of the JSONL file and whether it is temporary
+        :rtype: tuple
+        """
+        if self.__input_dict["resume"]:
+            return self.__input_dict["resume"], False
+        if self.__input_dict["output_type"] == self.Report.RAW:
+            if not Path("results").exists():
+                mkdir("results")
+            stem = Path(self.__input_dict["output"]).stem
+            return f"results{sep}{stem}.jsonl", False
+        descriptor, path = tempfile.mkstemp(prefix="tlsa_", suffix=".jsonl")
+        close(descriptor)
+        return path, True
 
     def __exec(
         self,
@@ -474,19 +931,68 @@ class Core:
         :type port: str
         """
 
-        res = {}
-        if type_of_analysis == self.Analysis.DOMAINS:
-            self.__logging.info("Executing multiple domain analysis.")
-            for domain in hostname_or_path:
-                self.__wrap_execution(
-                    res, domain, type_of_analysis, configuration, port
-                )
-        else:
-            self.__wrap_execution(
-                res, hostname_or_path, type_of_analysis, configuration, port
+        if self.__input_dict["resume"] and Path(self.__input_dict["resume"]).exists():
+            # each (host, port) pair written in the journal is done
+            self.__completed = {
+                tuple(link_sep(hostname))
+                for hostname, _, _ in Result_stream.read(self.__input_dict["resume"])
+            }
+            self.__logging.info(
+                f"Resuming analysis, {len(self.__completed)} hosts already done."
             )
-        self.__logging.info(f"Generating output..")
-        self.__call_output_modules(res)
+        stream_path, temporary = self.__stream_path()
+        try:
+            with Result_stream(
+                stream_path, append=self.__input_dict["resume"] is not None
+            ) as stream:
+                if type_of_analysis == self.Analysis.DOMAINS:
+                    self.__logging.info("Executing multiple domain analysis.")
+                    batch = self.__input_dict["testssl_batch"] or max(
+                        1, len(hostname_or_path)
+                    )
+                    window = self.__prefetch_window()
+                    for i in range(0, len(hostname_or_path), batch):
+                        chunk = hostname_or_path[i : i + batch]
+                        self.__prefetch_batch(chunk, configuration)
+                        for j in range(0, len(chunk), window):
+                            domains = chunk[j : j + window]
+                            self.__prefetch(domains, configuration)
+                            if self.__input_dict["jobs"] > 1:
+                                self.__exec_pool(
+                                    stream,
+                                    domains,
+                                    type_of_analysis,
+                                    configuration,
+                                    port,
+                                )
+                            else:
+                                for domain in domains:
+                                    self.__wrap_execution(
+                                        stream,
+                                        domain,
+                                        type_of_analysis,
+                                        configuration,
+                                        port,
+                                    )
+                elif type_of_analysis == self.Analysis.APK and isinstance(
+                    hostname_or_path, list
+                ):
+                    self.__logging.info("Executing multiple APK analysis.")
+                    self.__exec_apks(stream, hostname_or_path, configuration)
+                elif type_of_analysis == self.Analysis.CONFIGURATION and isinstance(
+                    hostname_or_path, list
+                ):
+                    self.__logging.info("Executing multiple configuration analysis.")
+                    self.__exec_configurations(stream, hostname_or_path, configuration)
+                else:
+                    self.__wrap_execution(
+                        stream, hostname_or_path, type_of_analysis, configuration, port
+                    )
+            self.__logging.info(f"Generating output..")
+            self.__call_output_modules(stream_path)
+        finally:
+            if temporary:
+                remove(stream_path)
 
     def __exec_anaylsis(
         self,
@@ -518,10 +1024,7 @@ class Core:
 
         self.__logging.info(f"Loading modules..")
         # loading modules
-        loaded_modules, loaded_arguments, testssl_args = self.__load_modules(
-            parsed_configuration
-        )
-        # preanalysis if needed
+        loaded_modules, loaded_arguments = self.__load_modules(parsed_configuration)
         self.__logging.info(f"Running analysis..")
         if type_of_analysis == self.Analysis.CONFIGURATION:
             results = self.__conf_analysis(
@@ -531,10 +1034,6 @@ class Core:
                 ignore_openssl=self.__input_dict["ignore_openssl"],
             )  # TODO: better output report
         else:
-            self.__preanalysis_testssl(
-                testssl_args, type_of_analysis, hostname_or_path, port
-            )
-
             results = self.__run_analysis(
                 loaded_modules,
                 type_of_analysis,
@@ -576,3 +1075,35 @@ class Core:
             if module in b_res and b_res[module]:
                 out[module] = value
         return out
+
+
+def _analyze_file(
+    path: str, type_of_analysis: Core.Analysis, options: dict, level: int
+) -> list:
+    """
+    Analyze an APK or a configuration file in a worker process of a batch analysis.
+
+    :param path: path of the file
+    :type path: str
+    :param type_of_analysis: type of analysis, APK or CONFIGURATION
+    :type type_of_analysis: Core.Analysis
+    :param options: options of the Core of the batch
+    :type options: dict
+    :param level: logging level of the batch
+    :type level: int
+    :return: list of (path or vhost, names of the modules, results) tuples
+    :rtype: list
+    """
+    logging.basicConfig(level=level)
+    name = f"batch_{uuid.uuid4().hex}"
+    Core(
+        hostname_or_path=path,
+        output=f"{name}.raw",  # only the results stream, read back here
+        type_of_analysis=type_of_analysis,
+        **options,
+    )
+    stream_path = f"results{sep}{name}.jsonl"
+    try:
+        return list(Result_stream.read(stream_path))
+    finally:
+        remove(stream_path)
@@ -0,0 +1,346 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from enum import Enum
+
+from modules.android.wrappers.mallodroid import Mallodroid
+from modules.android.wrappers.super import Super
+from modules.server.wrappers.https_hsts import Https
+from modules.server.wrappers.testssl import Testssl
+from modules.server.wrappers.tlsfuzzer import Tlsfuzzer
+from utils.logger import Logger
+
+
+class Planner:
+    """
+    Data source planner.
+
+    Each module declares the data sources it needs with ``_sources()``. The planner
+    builds a per-host DAG where each distinct source is a node, executed exactly once,
+    and each module depends on the nodes of its sources. The modules then read the
+    results from the caches of the wrappers.
+    """
+
+    class Source(Enum):
+        """
+        Enum class for the different data sources
+        """
+
+        TESTSSL = 0
+        TLSFUZZER = 1
+        HTTPS = 2
+        SUPER = 3
+        MALLODROID = 4
+
+    def __init__(
+        self,
+        loaded_modules: dict,
+        cache: bool = False,
+        cache_ttl=86400,
+        batched: bool = False,
+        archive: str = None,
+        shards: int = 1,
+        dex_jobs: int = 1,
+        incremental: bool = False,
+        tlsfuzzer_concurrency: int = 4,
+        tlsfuzzer_prefetched: bool = False,
+    ):
+        """
+        :param loaded_modules: loaded modules
+        :type loaded_modules: dict
+        :param cache: use the persistent on-disk cache of the data sources
+        :type cache: bool
+        :param cache_ttl: seconds before a result in the on-disk cache expires
+        :type cache_ttl: int
+        :param batched: the testssl.sh results were already collected by a batch scan
+        :type batched: bool
+        :param archive: folder where to archive the complete testssl.sh output
+        :type archive: str
+        :param shards: concurrent testssl.sh runs splitting the checks of a host
+        :type shards: int
+        :param dex_jobs: processes analyzing the DEX files of a multidex APK
+        :type dex_jobs: int
+        :param incremental: reuse the Mallodroid findings of a previous build of the
+            same package with the same DEX files
+        :type incremental: bool
+        :param tlsfuzzer_concurrency: tlsfuzzer scripts to run at the same time
+        :type tlsfuzzer_concurrency: int
+        :param tlsfuzzer_prefetched: the tlsfuzzer scripts were already run for all
+            the hosts
+        :type tlsfuzzer_prefetched: bool
+        """
+        self.__logging = Logger("Planner")
+        self.__cache = cache
+        self.__cache_ttl = cache_ttl
+        self.__batched = batched
+        self.__archive = archive
+        self.__shards = shards
+        self.__dex_jobs = dex_jobs
+        self.__incremental = incremental
+        self.__tlsfuzzer_concurrency = tlsfuzzer_concurrency
+        self.__tlsfuzzer_prefetched = tlsfuzzer_prefetched
+        self.__nodes = {}  # node -> list of module names
+        self.__dependencies = {}  # module name -> list of nodes
+        self.__testssl_args = []
+        self.__testssl_keys = []
+        self.__tlsfuzzer_scripts = []
+        self.__super_rules = {}  # SUPER arguments -> rule names, None for all
+        self.__plan(loaded_modules)
+
+    def __plan(self, loaded_modules: dict):
+        """
+        Build the DAG of the data sources.
+
+        :param loaded_modules: loaded modules
+        :type loaded_modules: dict
+        """
+        for name, module in loaded_modules.items():
+            self.__dependencies[name] = []
+            sources = module._sources() if hasattr(module, "_sources") else []
+            for kind, key in sources:
+                if kind == self.Source.TESTSSL:
+                    # testssl.sh arguments are merged in a single scan
+                    args, keys = key
+                    self.__extend(self.__testssl_args, args)
+                    if not keys:
+                        # a module reading any finding needs all of them
+                        self.__testssl_keys = None
+                    elif self.__testssl_keys is not None:
+                        self.__extend(self.__testssl_keys, keys)
+                    key = None
+                elif kind == self.Source.TLSFUZZER:
+                    # the scripts of all the modules share a single pool of runs
+                    self.__extend(self.__tlsfuzzer_scripts, [key])
+                    key = None
+                elif kind == self.Source.SUPER:
+                    # a single SUPER scan runs the rules of all the modules
+                    key, rules = key
+                    self.__merge_rules(key, rules)
+                node = (kind, key)
+                if node not in self.__nodes:
+                    self.__nodes[node] = []
+                self.__nodes[node].append(name)
+                if node not in self.__dependencies[name]:
+                    self.__dependencies[name].append(node)
+        self.__logging.debug(f"Planned data sources: {list(self.__nodes.keys())}")
+
+    def __extend(self, destination: list, values):
+        """
+        Extend a list, skipping the values already in it.
+
+        :param destination: list to extend
+        :type destination: list
+        :param values: values to add
+        """
+        for value in values:
+            if value not in destination:
+                destination.append(value)
+
+    def __merge_rules(self, args: tuple, rules: tuple):
+        """
+        Add the rules of a module to the SUPER scan with the given arguments.
+
+        :param args: arguments of the SUPER scan
+        :type args: tuple
+        :param rules: rule names, None for all the rules
+        :type rules: tuple
+        """
+        if rules is None or (
+            args in self.__super_rules and self.__super_rules[args] is None
+        ):
+            self.__super_rules[args] = None
+        else:
+            self.__extend(self.__super_rules.setdefault(args, []), rules)
+
+    def nodes(self) -> dict:
+        """
+        Obtain the nodes of the DAG.
+
+        :return: dict of nodes and the names of the modules that need them
+        :rtype: dict
+        """
+        return self.__nodes
+
+    def dependencies(self, name: str) -> list:
+        """
+        Obtain the nodes needed by a module.
+
+        :param name: name of the module
+        :type name: str
+        :return: list of nodes
+        :rtype: list
+        """
+        return self.__dependencies.get(name, [])
+
+    def testssl_arguments(self) -> list:
+        """
+        Obtain the merged testssl.sh arguments.
+
+        :return: list of arguments
+        :rtype: list
+        """
+        return self.__testssl_args
+
+    def tlsfuzzer_scripts(self) -> list:
+        """
+        Obtain the merged tlsfuzzer scripts.
+
+        :return: list of tuples with the script name and its arguments
+        :rtype: list
+        """
+        return [(script, list(args)) for script, args in self.__tlsfuzzer_scripts]
+
+    def https_types(self) -> list:
+        """
+        Obtain the types of HTTP(S) probes needed by the modules.
+
+        :return: list of Https types, one for each scheme
+        :rtype: list
+        """
+        return [
+            Https.HTTPS if key == "http" else Https.HSTSSET
+            for kind, key in self.__nodes
+            if kind == self.Source.HTTPS
+        ]
+
+    def testssl_keys(self) -> list:
+        """
+        Obtain the testssl.sh finding IDs needed by the modules.
+
+        :return: list of finding IDs, None to keep all of them
+        :rtype: list
+        """
+        return self.__testssl_keys
+
+    def __run_node(
+        self,
+        node: tuple,
+        hostname_or_path: str,
+        port: str = None,
+        parallel: bool = False,
+    ):
+        """
+        Execute a node, filling the cache of its wrapper.
+
+        :param node: node to execute
+        :type node: tuple
+        :param hostname_or_path: hostname or path to the file
+        :type hostname_or_path: str
+        :param port: port to use
+        :type port: str
+        :param parallel: the node runs concurrently with the other nodes
+        :type parallel: bool
+        """
+        kind, key = node
+        self.__logging.debug(f"Running data source {kind.name} {key if key else ''}..")
+        if kind == self.Source.TESTSSL:
+            self.__logging.debug(
+                f"Starting preanalysis testssl with args {self.__testssl_args}..."
+            )
+            Testssl().run(
+                hostname=f"{hostname_or_path}:{port}",
+                args=self.__testssl_args,
+                # this should solve for multiple scans on the same IP with different ports
+                force=not self.__batched,
+                cache=self.__cache,
+                cache_ttl=self.__cache_ttl,
+                keys=self.__testssl_keys,  # only the findings read by the modules
+                archive=self.__archive,
+                shards=self.__shards,
+            )
+            self.__logging.debug(f"Preanalysis testssl done.")
+        elif kind == self.Source.TLSFUZZER:
+            Tlsfuzzer().run(
+                hostname=hostname_or_path,
+                port=port,
+                scripts=self.tlsfuzzer_scripts(),
+                # the scripts can be already run by Tlsfuzzer.run_hosts
+                force=not self.__tlsfuzzer_prefetched,
+                concurrency=self.__tlsfuzzer_concurrency,
+            )
+        elif kind == self.Source.HTTPS:
+            https = Https()
+            https.run(
+                hostname=hostname_or_path,
+                port=port,
+                type=https.HTTPS if key == "http" else https.HSTSSET,
+                force=False,  # the probe can be already done by Https.prefetch
+            )
+        elif kind == self.Source.SUPER:
+            Super().run(
+                path=hostname_or_path,
+                args=list(key),
+                rules=self.__super_rules[key],
+                cache=self.__cache,
+                cache_ttl=self.__cache_ttl,
+            )
+        elif kind == self.Source.MALLODROID:
+            Mallodroid().run(
+                path=hostname_or_path,
+                args=list(key),
+                cache=self.__cache,
+                cache_ttl=self.__cache_ttl,
+                # androguard is CPU bound, it gets its own process
+                process=parallel,
+                dex_jobs=self.__dex_jobs,
+                incremental=self.__incremental,
+            )
+        else:
+            raise NotImplementedError(f"Data source {kind} not implemented.")
+
+    def __ready(self, done: set, pending: list) -> list:
+        """
+        Obtain the modules whose data sources are all done.
+
+        :param done: executed nodes
+        :type done: set
+        :param pending: names of the modules not yet returned
+        :type pending: list
+        :return: names of the ready modules
+        :rtype: list
+        """
+        ready = [
+            name
+            for name in pending
+            if all(node in done for node in self.__dependencies[name])
+        ]
+        for name in ready:
+            pending.remove(name)
+        return ready
+
+    def execute(
+        self, hostname_or_path: str, port: str = None, parallel: bool = False
+    ):
+        """
+        Execute the plan, yielding each module name as soon as its sources are done.
+
+        :param hostname_or_path: hostname or path to the file
+        :type hostname_or_path: str
+        :param port: port to use
+        :type port: str
+        :param parallel: run the nodes concurrently
+        :type parallel: bool
+        :return: generator of module names
+        :rtype: Generator
+        """
+        done = set()
+        pending = list(self.__dependencies.keys())
+        for name in self.__ready(done, pending):  # modules without sources
+            yield name
+        if parallel and len(self.__nodes) > 1:
+            with ThreadPoolExecutor(max_workers=len(self.__nodes)) as executor:
+                futures = {
+                    executor.submit(
+                        self.__run_node, node, hostname_or_path, port, True
+                    ): node
+                    for node in self.__nodes
+                }
+                for future in as_completed(futures):
+                    future.result()  # raise the exception of the node, if any
+                    done.add(futures[future])
+                    for name in self.__ready(done, pending):
+                        yield name
+        else:
+            for node in self.__nodes:
+                self.__run_node(node, hostname_or_path, port)
+                done.add(node)
+                for name in self.__ready(done, pending):
+                    yield name
@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from enum import Enum
 from os import mkdir
 
@@ -43,7 +44,8 @@ class Report:
         :type kwargs: dict
 
         :Keyword Arguments:
-        * *results* (dict) -- Dictionary containing the results of the scan.
+        * *results* (dict or Iterable) -- Dictionary containing the results of the scan,
+          or iterable of (hostname, loaded modules, results) tuples.
         * *path* (string) -- Path to the report.
         * *mode* (Mode) -- Report mode.
         * *stix* (bool) -- If True, the report will be in STIX format.
@@ -118,7 +120,7 @@ class Report:
         self, mode: Mode, results: dict, modules: list, date: datetime.date
     ):
         """
-        Generates the report using jinja2.
+        Generates the report using jinja2, as a stream to write in the output file.
 
         :param mode: Report mode.
         :type mode: Mode
@@ -143,26 +145,71 @@ class Report:
             to_process["results"] = self.__hosts_report_formatter(results)
         else:
             raise ValueError(f"Unknown mode: {mode}")
-        return template.render(**to_process)
+        return template.stream(**to_process)
 
-    def __extract_results(self, res: dict) -> tuple:
+    def __iterate_results(self, res: dict):
         """
-        Extracts the results from the input dictionary.
+        Iterates over the input dictionary, one host at a time.
 
         :param res: Input dictionary.
         :type res: dict
-        :return: Tuple containing the results and the modules.
-        :rtype: tuple
+        :return: generator of (hostname, loaded modules, results) tuples
+        :rtype: Generator
         """
         # due to the fact that the results are in a dict with the loaded_modules, we have to extract the results
         # by removing the loaded_modules
-        modules = {}
         for hostname in res:
             if "loaded_modules" in res[hostname]:
-                modules.update(res[hostname]["loaded_modules"].copy())
-                del res[hostname]["loaded_modules"]
-                res[hostname] = res[hostname]["results"]
-        return res, modules
+                yield hostname, res[hostname]["loaded_modules"], res[hostname][
+                    "results"
+                ]
+            else:
+                yield hostname, {}, res[hostname]
+
+    def __split_mitigations(self, results: dict) -> dict:
+        """
+        Divides the raw results of each module of a host from its mitigation.
+
+        :param results: Results of the host.
+        :type results: dict
+        :return: Results of the host, with the raw results under the "raw" key.
+        :rtype: dict
+        """
+        for module in results:
+            raw = results[module].copy()
+            if "mitigation" in raw:
+                del raw["mitigation"]
+            for mitigation in rec_search_key("mitigation", results[module]):
+                if mitigation is not None:
+                    results[
+                        module
+                    ] = (
+                        mitigation.copy()
+                    )  # i'm expecting only one mitigation per module, is it ok?
+            results[module]["raw"] = raw
+        return results
+
+    def __extract_results(self, res) -> tuple:
+        """
+        Extracts the results from the input, one host at a time.
+
+        :param res: Input dictionary,
+            or iterable of (hostname, loaded modules, results) tuples.
+        :type res: dict or Iterable
+        :return: Tuple containing the results and the modules.
+        :rtype: tuple
+        """
+        if isinstance(res, dict):
+            res = self.__iterate_results(res)
+        modules = {}
+        results = {}
+        for hostname, loaded_modules, host_results in res:
+            modules.update(loaded_modules)
+            host_results = pruner({hostname: host_results})  # prune empty results
+            if hostname in host_results:
+                # now, we want to divide raw from mitigations
+                results[hostname] = self.__split_mitigations(host_results[hostname])
+        return results, modules
 
     def run(self, **kwargs):
         """
@@ -172,7 +219,10 @@ class Report:
         :type kwargs: dict
 
         :Keyword Arguments:
-        * *results* (dict) -- Dictionary containing the results of the scan.
+        * *results* (dict or Iterable) -- Dictionary containing the results of the scan,
+          or iterable of (hostname, loaded modules, results) tuples, read one host at a
+          time. The formatted results of all the hosts are kept until the report is
+          rendered: the templates and the STIX bundle need all of them.
         * *path* (string) -- Path to the report.
         * *mode* (Mode) -- Report mode.
         * *stix* (bool) -- If True, the report will be generated in STIX format.
@@ -190,7 +240,7 @@ class Report:
         Validator(
             [
                 (path, str),
-                (self.__input_dict["results"], dict),
+                (self.__input_dict["results"], Iterable),
                 (self.__input_dict["mode"], self.Mode),
                 (self.__input_dict["stix"], bool),
             ]
@@ -211,32 +261,13 @@ class Report:
         results, modules = self.__extract_results(
             self.__input_dict["results"]
         )  # obtain results removing loaded_modules
-        results = pruner(results)  # prune empty results
-        # now, we want to divide raw from mitigations
-        for hostname in results:
-            for module in results[hostname]:
-                raw = results[hostname][module].copy()
-                if "mitigation" in raw:
-                    del raw["mitigation"]
-                for mitigation in rec_search_key(
-                    "mitigation", results[hostname][module]
-                ):
-                    if mitigation is not None:
-                        results[hostname][
-                            module
-                        ] = (
-                            mitigation.copy()
-                        )  # i'm expecting only one mitigation per module, is it ok?
-                results[hostname][module]["raw"] = raw
         with open(output_path, "w") as f:
-            f.write(
-                self.__jinja2__report(
-                    mode=self.__input_dict["mode"],
-                    modules=list(modules.keys()),
-                    results=results,
-                    date=datetime.now().replace(microsecond=0),
-                )
-            )
+            self.__jinja2__report(
+                mode=self.__input_dict["mode"],
+                modules=list(modules.keys()),
+                results=results,
+                date=datetime.now().replace(microsecond=0),
+            ).dump(f)
         self.__logging.debug("Checking if needs pdf...")
 
         if self.__path.suffix.lower() == ".pdf":
@@ -16,6 +16,7 @@ class Beast(Testssl_base):
         Sets the arguments for the testssl command
         """
         self._arguments = ["-A"]
+        self._keys = ["BEAST"]
 
     # to override
     def _worker(self, results):
@@ -26,4 +27,4 @@ class Beast(Testssl_base):
         :return: dict
         :rtype: dict
         """
-        return self._obtain_results(results, ["BEAST"])
+        return self._obtain_results(results, self._keys)
@@ -16,6 +16,7 @@ class Breach(Testssl_base):
         Sets the arguments for the testssl command
         """
         self._arguments = ["-B"]
+        self._keys = ["BREACH"]
 
     # to override
     def _worker(self, results):
@@ -26,4 +27,4 @@ class Breach(Testssl_base):
         :return: dict
         :rtype: dict
         """
-        return self._obtain_results(results, ["BREACH"])
+        return self._obtain_results(results, self._keys)
@@ -16,6 +16,7 @@ class Ccs_injection(Testssl_base):
         Sets the arguments for the testssl command
         """
         self._arguments = ["-I"]
+        self._keys = ["CCS"]
 
     # to override
     def _worker(self, results):
@@ -26,4 +27,4 @@ class Ccs_injection(Testssl_base):
         :return: dict
         :rtype: dict
         """
-        return self._obtain_results(results, ["CCS"])
+        return self._obtain_results(results, self._keys)
@@ -18,6 +18,7 @@ class Certificate_transparency(Testssl_base):
         Sets the arguments for the testssl command
         """
         self._arguments = ["-S"]
+        self._keys = ["certificate_transparency"]
 
     # to override
     def _worker(self, results):
@@ -28,4 +29,4 @@ class Certificate_transparency(Testssl_base):
         :return: dict
         :rtype: dict
         """
-        return self._obtain_results(results, ["certificate_transparency"])
+        return self._obtain_results(results, self._keys)
@@ -20,6 +20,7 @@ class Crime(Testssl_base):
         Sets the arguments for the testssl command
         """
         self._arguments = ["-C"]
+        self._keys = ["CRIME_TLS"]
         
     def _set_mitigations(self, result: dict, key: str, condition: bool) -> dict:
         """
@@ -49,4 +50,4 @@ class Crime(Testssl_base):
         :return: dict
         :rtype: dict
         """
-        return self._obtain_results(results, ["CRIME_TLS"])
+        return self._obtain_results(results, self._keys)
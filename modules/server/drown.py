@@ -35,6 +35,7 @@ class Drown(Testssl_base):
         Sets the arguments for the testssl command
         """
         self._arguments = ["-D"]
+        self._keys = ["DROWN", "DROWN_hint"]
 
     # to override
     def _worker(self, results):
@@ -45,4 +46,4 @@ class Drown(Testssl_base):
         :return: dict
         :rtype: dict
         """
-        return self._obtain_results(results, ["DROWN", "DROWN_hint"])
+        return self._obtain_results(results, self._keys)
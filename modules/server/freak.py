@@ -15,6 +15,7 @@ class Freak(Testssl_base):
         Sets the arguments for the testssl command
         """
         self._arguments = ["-F"]
+        self._keys = ["FREAK"]
 
     # to override
     def _worker(self, results):
@@ -25,4 +26,4 @@ class Freak(Testssl_base):
         :return: dict
         :rtype: dict
         """
-        return self._obtain_results(results, ["FREAK"])
+        return self._obtain_results(results, self._keys)
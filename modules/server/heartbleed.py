@@ -16,6 +16,7 @@ class Heartbleed(Testssl_base):
         Sets the arguments for the testssl command
         """
         self._arguments = ["-H"]
+        self._keys = ["heartbleed"]
 
     # to override
     def _worker(self, results):
@@ -26,4 +27,4 @@ class Heartbleed(Testssl_base):
         :return: dict
         :rtype: dict
         """
-        return self._obtain_results(results, ["heartbleed"])
+        return self._obtain_results(results, self._keys)
@@ -2,6 +2,7 @@ from utils.validation import Validator
 from utils.urls import url_domain, port_parse
 from utils.mitigations import load_mitigation
 from modules.server.wrappers.https_hsts import Https
+from modules.planner import Planner
 
 
 class Hsts_base:
@@ -39,7 +40,7 @@ class Hsts_base:
 
         :Keyword Arguments:
             * **hostname** (*str*) -- the hostname to be used for the analysis
-            * **force** (*bool*) -- force the analysis to be run, default is True
+            * **force** (*bool*) -- ignore the cached probe of the host, default is False
             * **port** (*str*) -- the port to be used for the analysis
             * **type** (*str*) -- the type of analysis to be done
         """
@@ -73,6 +74,16 @@ class Hsts_base:
         """
         raise NotImplementedError("This method should be reimplemented!")
 
+    def _sources(self):
+        """
+        Declares the data sources needed by the analysis.
+
+        :return: the HTTP probe needed, by scheme
+        :rtype: list
+        """
+        scheme = "http" if self._arguments == self._instance.HTTPS else "https"
+        return [(Planner.Source.HTTPS, scheme)]
+
     # to override
     def _worker(self, results):
         """
@@ -136,7 +147,7 @@ class Hsts_base:
 
         :Keyword Arguments:
             * **hostname** (*str*) -- the hostname to be used for the analysis
-            * **force** (*bool*) -- force the analysis to be run, default is True
+            * **force** (*bool*) -- ignore the cached probe of the host, default is False
             * **port** (*str*) -- the port to be used for the analysis
             * **type** (*str*) -- the type of analysis to be done
 
@@ -159,7 +170,7 @@ class Hsts_base:
                 hostname=self._input_dict["hostname"],
                 port=self._input_dict["port"],
                 type=self._arguments,
-                force=self._input_dict.get("force", True),
+                force=self._input_dict.get("force", False),
             )
         )
         return self.output()
@@ -15,6 +15,7 @@ class Logjam(Testssl_base):
         Sets the arguments for the testssl command
         """
         self._arguments = ["-J"]
+        self._keys = ["LOGJAM", "LOGJAM-common_primes"]
 
     def _set_mitigations(self, result: dict, key: str, condition: bool) -> dict:
         """
@@ -42,4 +43,4 @@ class Logjam(Testssl_base):
         :return: dict
         :rtype: dict
         """
-        return self._obtain_results(results, ["LOGJAM", "LOGJAM-common_primes"])
+        return self._obtain_results(results, self._keys)
@@ -16,6 +16,7 @@ class Lucky13(Testssl_base):
         Sets the arguments for the testssl command
         """
         self._arguments = ["-L"]
+        self._keys = ["LUCKY13"]
 
     # to override
     def _worker(self, results):
@@ -26,4 +27,4 @@ class Lucky13(Testssl_base):
         :return: dict
         :rtype: dict
         """
-        return self._obtain_results(results, ["LUCKY13"])
+        return self._obtain_results(results, self._keys)
@@ -35,6 +35,7 @@ class Nomore(Testssl_base):
         Sets the arguments for the testssl command
         """
         self._arguments = ["-4"]
+        self._keys = ["RC4"]
 
     # to override
     def _worker(self, results):
@@ -45,4 +46,4 @@ class Nomore(Testssl_base):
         :return: dict
         :rtype: dict
         """
-        return self._obtain_results(results, ["RC4"])
+        return self._obtain_results(results, self._keys)
@@ -12,6 +12,13 @@ class Pfs(Testssl_base):
     # to override
     def _set_arguments(self):
         self._arguments = ["-f"]
+        self._keys = [
+            "PFS_ciphers",
+            "PFS_ECDHE_curves",
+            "DH_groups",
+            "pre_128cipher",
+            "PFS",
+        ]
 
     def _set_mitigations(self, result: dict, key: str, condition: bool) -> dict:
         """
@@ -39,7 +46,4 @@ class Pfs(Testssl_base):
         :return: dict
         :rtype: dict
         """
-        return self._obtain_results(
-            results,
-            ["PFS_ciphers", "PFS_ECDHE_curves", "DH_groups", "pre_128cipher", "PFS"],
-        )
+        return self._obtain_results(results, self._keys)
@@ -36,6 +36,7 @@ class Poodle(Testssl_base):
         Sets the arguments for the testssl command
         """
         self._arguments = ["-O"]
+        self._keys = ["POODLE_SSL", "fallback_SCSV"]
 
     # to override
     def _worker(self, results):
@@ -46,4 +47,4 @@ class Poodle(Testssl_base):
         :return: dict
         :rtype: dict
         """
-        return self._obtain_results(results, ["POODLE_SSL", "fallback_SCSV"])
+        return self._obtain_results(results, self._keys)
@@ -36,6 +36,7 @@ class Renegotiation(Testssl_base):
         Sets the arguments for the testssl command
         """
         self._arguments = ["-R"]
+        self._keys = ["secure_renego", "secure_client_renego"]
 
     # to override
     def _worker(self, results):
@@ -46,4 +47,4 @@ class Renegotiation(Testssl_base):
         :return: dict
         :rtype: dict
         """
-        return self._obtain_results(results, ["secure_renego", "secure_client_renego"])
+        return self._obtain_results(results, self._keys)
@@ -16,6 +16,7 @@ class Robot(Testssl_base):
         Sets the arguments for the testssl command
         """
         self._arguments = ["-BB"]
+        self._keys = ["ROBOT"]
 
     # to override
     def _worker(self, results):
@@ -26,4 +27,4 @@ class Robot(Testssl_base):
         :return: dict
         :rtype: dict
         """
-        return self._obtain_results(results, ["ROBOT"])
+        return self._obtain_results(results, self._keys)
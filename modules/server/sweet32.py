@@ -17,6 +17,7 @@ class Sweet32(Testssl_base):
         Sets the arguments for the testssl command
         """
         self._arguments = ["-W"]
+        self._keys = ["SWEET32"]
 
     # to override
     def _worker(self, results):
@@ -27,4 +28,4 @@ class Sweet32(Testssl_base):
         :return: dict
         :rtype: dict
         """
-        return self._obtain_results(results, ["SWEET32"])
+        return self._obtain_results(results, self._keys)
@@ -3,6 +3,7 @@ from utils.validation import Validator
 from utils.urls import url_domain, port_parse
 from utils.mitigations import load_mitigation
 import logging
+from modules.planner import Planner
 
 
 class Testssl_base:
@@ -15,6 +16,7 @@ class Testssl_base:
     def __init__(self):
         self._input_dict = {}
         self._arguments = []
+        self._keys = []
         self._instance = Testssl()
         self._output_dict = {}
         self._mitigations = {}
@@ -63,6 +65,17 @@ class Testssl_base:
         """
         raise NotImplementedError("This method should be reimplemented!")
 
+    def _sources(self) -> list:
+        """
+        This method is used to declare the data sources needed by the analysis.
+
+        :return: The testssl.sh arguments and the finding IDs read by the analysis.
+        :rtype: list
+        """
+        return [
+            (Planner.Source.TESTSSL, (tuple(self._arguments), tuple(self._keys)))
+        ]
+
     # to override
     def _worker(self, results):
         """
@@ -116,20 +129,13 @@ class Testssl_base:
                         out["key"].append(key)
         return out
 
-    def run(self, **kwargs):
+    def __prepare(self, **kwargs) -> dict:
         """
-        This method is used to run the analysis.
+        This method is used to set the input and obtain the arguments of the testssl.sh wrapper.
 
-        :param kwargs:
+        :param kwargs: See :func:`run`
         :type kwargs: dict
-
-        :Keyword Arguments:
-            * *hostname* (``str``) -- Hostname to be analyzed.
-            * *port* (``str``) -- Port to be analyzed.
-            * *force* (``bool``) -- Force the analysis.
-            * *keys* (``list``) -- List of keys to be analyzed.
-
-        :return: The results of the analysis.
+        :return: The arguments of the wrapper.
         :rtype: dict
         """
         self.input(**kwargs)
@@ -146,12 +152,43 @@ class Testssl_base:
         logging.debug(
             f"Executing analysis in {self._input_dict['hostname']} with args {self._arguments}"
         )
+        return {
+            "hostname": self._input_dict["hostname"],
+            "args": self._arguments,
+            "force": self._input_dict.get("force", False),
+        }
+
+    def run(self, **kwargs):
+        """
+        This method is used to run the analysis.
+
+        :param kwargs:
+        :type kwargs: dict
+
+        :Keyword Arguments:
+            * *hostname* (``str``) -- Hostname to be analyzed.
+            * *port* (``str``) -- Port to be analyzed.
+            * *force* (``bool``) -- Force the analysis.
+            * *keys* (``list``) -- List of keys to be analyzed.
+
+        :return: The results of the analysis.
+        :rtype: dict
+        """
+        self._output_dict = self._worker(self._instance.run(**self.__prepare(**kwargs)))
+        return self.output()
+
+    async def run_async(self, **kwargs):
+        """
+        This method is the awaitable version of run.
+
+        :param kwargs: See :func:`run`
+        :type kwargs: dict
+
+        :return: The results of the analysis.
+        :rtype: dict
+        """
         self._output_dict = self._worker(
-            self._instance.run(
-                hostname=self._input_dict["hostname"],
-                args=self._arguments,
-                force=self._input_dict.get("force", False),
-            )
+            await self._instance.run_async(**self.__prepare(**kwargs))
         )
         return self.output()
 
@@ -38,6 +38,7 @@ class Three_shake(Testssl_base):
         Sets the arguments for the testssl command
         """
         self._arguments = ["-S"]
+        self._keys = ["TLS_extensions"]
 
     # to override
     def _worker(self, results):
@@ -48,4 +49,4 @@ class Three_shake(Testssl_base):
         :return: dict
         :rtype: dict
         """
-        return self._obtain_results(results, ["TLS_extensions"])
+        return self._obtain_results(results, self._keys)
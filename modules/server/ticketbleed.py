@@ -17,6 +17,7 @@ class Ticketbleed(Testssl_base):
         Sets the arguments for the testssl command
         """
         self._arguments = ["-T"]
+        self._keys = ["ticketbleed"]
 
     # to override
     def _worker(self, results):
@@ -27,4 +28,4 @@ class Ticketbleed(Testssl_base):
         :return: dict
         :rtype: dict
         """
-        return self._obtain_results(results, ["ticketbleed"])
+        return self._obtain_results(results, self._keys)
@@ -2,8 +2,9 @@ from modules.server.wrappers.tlsfuzzer import Tlsfuzzer
 from utils.validation import Validator
 from utils.urls import url_domain, port_parse
 from utils.mitigations import load_mitigation
-from utils.counter import count_occurrencies as grep
+from utils.counter import Matcher
 import logging
+from modules.planner import Planner
 
 
 class Tlsfuzzer_base:
@@ -11,6 +12,8 @@ class Tlsfuzzer_base:
     Interface for TLSFuzzer Vulnerability Analysis
     """
 
+    __matchers = {}  # (module class, script) -> Matcher
+
     def __init__(self):
         self._input_dict = {}
         self._arguments = []
@@ -69,6 +72,18 @@ class Tlsfuzzer_base:
         """
         raise NotImplementedError("This method should be reimplemented!")
 
+    def _sources(self):
+        """
+        Declare the data sources needed by the analysis
+
+        :return: one source for each script with its arguments
+        :rtype: list
+        """
+        return [
+            (Planner.Source.TLSFUZZER, (script, tuple(args)))
+            for script, args in self._arguments
+        ]
+
     # to override
     def _worker(self, results):
         """
@@ -84,6 +99,29 @@ class Tlsfuzzer_base:
         """
         raise NotImplementedError("This method should be reimplemented!")
 
+    def __matcher(self, script: str, list_of_checks: dict) -> Matcher:
+        """
+        Obtain the matcher of the checks of a script, compiled once per module class
+
+        :param script: script whose output is checked
+        :type script: str
+        :param list_of_checks: checks of the script with their safe values
+        :type list_of_checks: dict
+        :return: matcher of the sanity check and of the checks
+        :rtype: Matcher
+        """
+        words = ["sanity"] + [
+            check
+            for check in list_of_checks
+            if check not in ["sanity", "MITIGATION"]
+        ]
+        key = (self.__class__, script)
+        matcher = self.__matchers.get(key)
+        if matcher is None or matcher.words() != words:
+            matcher = Matcher(words)
+            self.__matchers[key] = matcher
+        return matcher
+
     def _obtain_results(self, results: dict, keys: dict):
         """
         Obtain results from the analysis
@@ -99,17 +137,18 @@ class Tlsfuzzer_base:
         out = {}
         for script, list_of_checks in keys.items():
             assert script in results, f"Script {script} missing in results!"
-            if grep("sanity", results[script]) == 2:
+            # every check is counted in a single pass of the output
+            matcher = self.__matcher(script, list_of_checks)
+            occurrencies = matcher.count(results[script])
+            if occurrencies["sanity"] == 2:
                 # self.__logging.debug(results[script])
                 set_mitigations = False
                 for check, safe_value in list_of_checks.items():
                     if check != "MITIGATION":
                         out[check] = {}
-                        string_to_grep = check
-                        occurrencies = grep(string_to_grep, results[script])
-                        if occurrencies > safe_value:
+                        if occurrencies[check] > safe_value:
                             self.__logging.debug(
-                                f"Found {occurrencies} occurrencies of {check}"
+                                f"Found {occurrencies[check]} occurrencies of {check}"
                                 f" with script {script} (safe value is <={safe_value})"
                             )
                             set_mitigations = True
@@ -127,22 +166,14 @@ class Tlsfuzzer_base:
                 self.__logging.info(f"Ignoring {script} analysis.\n")
         return out
 
-    def run(self, **kwargs):
+    def __prepare(self, **kwargs) -> dict:
         """
-        Run the analysis
+        Set the input and obtain the arguments of the tlsfuzzer wrapper
 
-        :param kwargs:
+        :param kwargs: See :func:`run`
         :type kwargs: dict
-
-        :Keyword Arguments:
-            * *hostname* (``str``) -- Hostname to be tested
-            * *port* (``str``) -- Port to be tested
-            * *force* (``bool``) -- Force the analysis
-            * *scripts* (``list``) -- List of scripts to be executed
-
-        :return: results of the analysis
+        :return: arguments of the wrapper
         :rtype: dict
-
         """
         self.input(**kwargs)
 
@@ -161,14 +192,45 @@ class Tlsfuzzer_base:
             f"Executing analysis in {self._input_dict['hostname']} in port {self._input_dict['port']} with scripts "
             f"{', '.join([s[0] for s in self._arguments])}"
         )
+        return {
+            "hostname": self._input_dict["hostname"],
+            "port": self._input_dict["port"],
+            "scripts": self._arguments,
+            "force": self._input_dict.get("force", False),
+        }
+
+    def run(self, **kwargs):
+        """
+        Run the analysis
 
+        :param kwargs:
+        :type kwargs: dict
+
+        :Keyword Arguments:
+            * *hostname* (``str``) -- Hostname to be tested
+            * *port* (``str``) -- Port to be tested
+            * *force* (``bool``) -- Force the analysis
+            * *scripts* (``list``) -- List of scripts to be executed
+
+        :return: results of the analysis
+        :rtype: dict
+
+        """
+        self._output_dict = self._worker(self._instance.run(**self.__prepare(**kwargs)))
+        return self.output()
+
+    async def run_async(self, **kwargs):
+        """
+        Awaitable version of run
+
+        :param kwargs: See :func:`run`
+        :type kwargs: dict
+
+        :return: results of the analysis
+        :rtype: dict
+        """
         self._output_dict = self._worker(
-            self._instance.run(
-                hostname=self._input_dict["hostname"],
-                port=self._input_dict["port"],
-                scripts=self._arguments,
-                force=self._input_dict.get("force", False),
-            )
+            await self._instance.run_async(**self.__prepare(**kwargs))
         )
         return self.output()
 
@@ -1,13 +1,21 @@
+import asyncio
+import hashlib
 import logging
+import mmap
+import struct
+import threading
 
 from utils.logger import Logger
 from utils.validation import Validator
-from utils.urls import url_domain, port_parse
+from utils.urls import url_domain, port_parse, link_sep
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
 import os.path
-from os import sep
+from os import sep, getpid, replace
 from base64 import b64decode
-from json import loads
+from json import loads, dumps
 
 
 class Parse:
@@ -18,6 +26,18 @@ class Parse:
     __path_moz = f"dependencies{sep}nsSTSPreloadList.inc"
     __path_gog = f"dependencies{sep}transport_security_state_static.json"
 
+    @classmethod
+    def source(cls, moz=True) -> str:
+        """
+        Path of the file to parse
+
+        :param moz: True for the mozilla file, False for the google file
+        :type moz: bool
+        :return: path of the file
+        :rtype: str
+        """
+        return cls.__path_moz if moz else cls.__path_gog
+
     def __init__(self, moz=True):
         """
         :param moz: True if the mozilla file is to be parsed, False if the google file is to be parsed
@@ -85,6 +105,179 @@ class Parse:
         return self.__cache
 
 
+class Preload_index:
+    """
+    Compiled index of the Mozilla and Google HSTS preload lists.
+
+    The index is a file of fixed size records, sorted by the hash of the domain.
+    It's memory mapped, so the pages are shared by all the processes using it and
+    nothing is parsed at lookup time. It's rebuilt when a source file changes.
+    """
+
+    __path_index = f"dependencies{sep}hsts_preload.idx"
+    __magic = b"TLSAHSTS"
+    __header = struct.Struct(">8s32sQ")  # magic, signature of the sources, records
+    __record = struct.Struct(">QB")  # hash of the domain, flags
+    __instance = None
+    __lock = threading.Lock()
+    # flags
+    MOZ = 1
+    MOZ_SUBDOMAINS = 2
+    GOG = 4
+    GOG_SUBDOMAINS = 8
+
+    def __init__(self):
+        self.__logging = Logger("HSTS_Index")
+        signature = self.__signature()
+        if not self.__is_valid(signature):
+            self.__build(signature)
+        with open(self.__path_index, "rb") as file:
+            self.__map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        _, _, self.__size = self.__header.unpack_from(self.__map, 0)
+
+    @classmethod
+    def load(cls):
+        """
+        Obtain the index, loaded once per process.
+
+        :return: the index
+        :rtype: Preload_index
+        """
+        with cls.__lock:
+            if cls.__instance is None:
+                cls.__instance = cls()
+            return cls.__instance
+
+    def __signature(self) -> bytes:
+        """
+        Signature of the sources, changes if any of them is modified.
+
+        :return: digest of the path, size and modification time of the sources
+        :rtype: bytes
+        :raise FileNotFoundError: If a source file is missing
+        """
+        stats = []
+        for moz in (True, False):
+            path = Parse.source(moz)
+            if not os.path.exists(path):
+                raise FileNotFoundError(
+                    f"The file provided for {'mozilla' if moz else 'google'} "
+                    f"HSTS doesn't exist."
+                )
+            stat = os.stat(path)
+            stats.append((path, stat.st_size, stat.st_mtime_ns))
+        return hashlib.sha256(dumps(stats).encode()).digest()
+
+    def __is_valid(self, signature: bytes) -> bool:
+        """
+        Check if the index exists and was built from the current sources.
+
+        :param signature: signature of the sources
+        :type signature: bytes
+        :return: True if the index can be used
+        :rtype: bool
+        """
+        if not os.path.exists(self.__path_index):
+            return False
+        with open(self.__path_index, "rb") as file:
+            header = file.read(self.__header.size)
+        if len(header) != self.__header.size:
+            return False
+        magic, index_signature, _ = self.__header.unpack(header)
+        return magic == self.__magic and index_signature == signature
+
+    @staticmethod
+    def __hash(domain: str) -> int:
+        """
+        Hash of a domain.
+
+        :param domain: the domain
+        :type domain: str
+        :return: 64 bit hash
+        :rtype: int
+        """
+        return int.from_bytes(
+            hashlib.blake2b(domain.lower().encode(), digest_size=8).digest(), "big"
+        )
+
+    def __build(self, signature: bytes):
+        """
+        Parse the sources and write the index.
+
+        :param signature: signature of the sources
+        :type signature: bytes
+        """
+        self.__logging.info("Compiling the HSTS preload lists..")
+        records = {}
+        for moz in (True, False):
+            for name, value in Parse(moz=moz).output().items():
+                if moz:
+                    flags = self.MOZ | (
+                        self.MOZ_SUBDOMAINS if value.strip() == "1" else 0
+                    )
+                else:
+                    flags = self.GOG | (
+                        self.GOG_SUBDOMAINS
+                        if value.get("include_subdomains", False)
+                        else 0
+                    )
+                key = self.__hash(name)
+                records[key] = records.get(key, 0) | flags
+        # written to a temp file and renamed, other processes never see it half done
+        temp_path = f"{self.__path_index}.{getpid()}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(self.__header.pack(self.__magic, signature, len(records)))
+            for key in sorted(records):
+                file.write(self.__record.pack(key, records[key]))
+        replace(temp_path, self.__path_index)
+        self.__logging.debug(f"HSTS preload index built with {len(records)} domains.")
+
+    def __flags(self, domain: str) -> int:
+        """
+        Binary search of a domain in the index.
+
+        :param domain: the domain
+        :type domain: str
+        :return: the flags of the domain, 0 if not found
+        :rtype: int
+        """
+        key = self.__hash(domain)
+        low, high = 0, self.__size
+        while low < high:
+            middle = (low + high) // 2
+            found, flags = self.__record.unpack_from(
+                self.__map, self.__header.size + middle * self.__record.size
+            )
+            if found == key:
+                return flags
+            elif found < key:
+                low = middle + 1
+            else:
+                high = middle
+        return 0
+
+    def is_preloaded(self, domain: str) -> bool:
+        """
+        Check if a domain is preloaded, directly or by a parent domain that includes
+        its subdomains.
+
+        :param domain: the domain
+        :type domain: str
+        :return: True if preloaded
+        :rtype: bool
+        """
+        domain = domain.lower().rstrip(".")
+        if self.__flags(domain):
+            return True
+        labels = domain.split(".")
+        for i in range(1, len(labels)):  # also the TLDs, e.g. dev
+            if self.__flags(".".join(labels[i:])) & (
+                self.MOZ_SUBDOMAINS | self.GOG_SUBDOMAINS
+            ):
+                return True
+        return False
+
+
 class Https:
     """
     Analyze the results of the request and return the results by choosing the right method asked
@@ -95,9 +288,11 @@ class Https:
     HSTSPRELOAD = 2
     SERVERINFO = 3
     __cache = {}
-    __preloaded_moz = {}
-    __preloaded_gog = {}
     __output = {}
+    __session = None
+    __session_lock = threading.Lock()
+    __pool_hosts = 100  # hosts with a pool of connections kept alive
+    __pool_per_host = 4  # connections for each host
     __headers = {
         "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_10_1) "
         "AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -170,14 +365,6 @@ class Https:
             )
             if "port" not in self.__input_dict:
                 self.__input_dict["port"] = "443"
-            port_to_add = (
-                ":" + port_parse(self.__input_dict["port"])
-                if self.__input_dict[  # self.__input_dict["type"] != self.HTTPS and
-                    "port"
-                ]
-                != "443"
-                else ""
-            )
             Validator(
                 [
                     (self.__input_dict["hostname"], str),
@@ -186,10 +373,10 @@ class Https:
                 ]
             )
             # request
-            link = (
-                f'{"http" if self.__input_dict["type"] == self.HTTPS else "https"}://'
-                f'{self.__input_dict["hostname"]}'
-                f"{port_to_add}"
+            link = self.__link(
+                self.__input_dict["hostname"],
+                self.__input_dict["port"],
+                self.__input_dict["type"],
             )
             self.__output[link] = self.__worker(
                 link,
@@ -199,6 +386,136 @@ class Https:
 
         return self.output(hostname=link)
 
+    def __link(self, hostname: str, port: str, type: int) -> str:
+        """
+        Internal method to build the link to probe
+
+        :param hostname: hostname to analyze
+        :type hostname: str
+        :param port: port to analyze
+        :type port: str
+        :param type: type of HSTS
+        :type type: int
+        :return: the link
+        :rtype: str
+        """
+        port_to_add = (
+            ":" + port_parse(port)
+            if port != "443"  # self.__input_dict["type"] != self.HTTPS and
+            else ""
+        )
+        return f'{"http" if type == self.HTTPS else "https"}://{hostname}{port_to_add}'
+
+    def prefetch(
+        self,
+        hostnames: list,
+        types: list,
+        concurrency: int = 100,
+        timeout: int = 5,
+        max_redirects: int = 0,
+    ):
+        """
+        Probe a batch of hosts concurrently, filling the cache used by run
+
+        :param hostnames: hostnames to probe, with the port if not 443
+        :type hostnames: list
+        :param types: types of HSTS that will be analyzed, one probe for each scheme
+        :type types: list
+        :param concurrency: maximum number of probes at the same time
+        :type concurrency: int
+        :param timeout: seconds before a probe fails
+        :type timeout: int
+        :param max_redirects: redirects to follow, default 0 as in run
+        :type max_redirects: int
+        """
+        Validator(
+            [
+                (hostnames, list),
+                (types, list),
+                (concurrency, int),
+                (timeout, int),
+                (max_redirects, int),
+            ]
+        )
+        links = {}  # ordered set
+        for hostname in hostnames:
+            hostname, port = link_sep(hostname)
+            for type in types:
+                links[self.__link(url_domain(hostname), port, type)] = None
+        links = list(links)
+        self.__logging.info(
+            f"Probing {len(links)} links with {concurrency} concurrent requests.."
+        )
+        asyncio.run(self.__prefetch(links, concurrency, timeout, max_redirects))
+
+    async def __prefetch(
+        self, links: list, concurrency: int, timeout: int, max_redirects: int
+    ):
+        """
+        Internal method to probe the links concurrently
+
+        :param links: links to probe
+        :type links: list
+        :param concurrency: maximum number of probes at the same time
+        :type concurrency: int
+        :param timeout: seconds before a probe fails
+        :type timeout: int
+        :param max_redirects: redirects to follow
+        :type max_redirects: int
+        """
+        to_probe = iter(links)  # shared by the workers
+        connector = aiohttp.TCPConnector(
+            limit=concurrency, limit_per_host=self.__pool_per_host
+        )
+        async with aiohttp.ClientSession(
+            connector=connector,
+            headers=self.__headers,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as session:
+
+            async def worker():
+                for link in to_probe:
+                    self.__cache[link] = await self.__probe_async(
+                        session, link, max_redirects
+                    )
+
+            await asyncio.gather(*[worker() for _ in range(concurrency)])
+
+    async def __probe_async(
+        self, session: aiohttp.ClientSession, link: str, max_redirects: int
+    ) -> requests.Response:
+        """
+        Internal method to send the request without blocking the event loop
+
+        :param session: the aiohttp session
+        :type session: aiohttp.ClientSession
+        :param link: link to probe
+        :type link: str
+        :param max_redirects: redirects to follow
+        :type max_redirects: int
+        :return: the response, a default response if the connection failed
+        :rtype: requests.Response
+        """
+        response = requests.Response()  # default response
+        try:
+            async with session.head(
+                link,
+                allow_redirects=max_redirects > 0,
+                max_redirects=max(max_redirects, 1),
+            ) as async_response:
+                # same attributes of a response of requests
+                response.status_code = async_response.status
+                response.reason = async_response.reason
+                response.headers = CaseInsensitiveDict(async_response.headers)
+                response.url = str(async_response.url)
+                response.request = requests.Request("HEAD", response.url).prepare()
+                response._content = b""
+        except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
+            self.__logging.warning(
+                f"I can't connect to {link}: {str(ex) or type(ex).__name__}"
+            )
+        return response
+
     def __chose_results(self, type: int, response: requests.Response):
         """
         Internal method to choose the right results
@@ -221,25 +538,69 @@ class Https:
         elif type == self.HSTSSET:
             return "strict-transport-security" in response.headers
         else:
-            if not self.__preloaded_moz:
-                self.__logging.debug("Preloading mozilla hsts..")
-                self.__preloaded_moz = Parse().output()
-            if not self.__preloaded_gog:
-                self.__logging.debug("Preloading google hsts..")
-                self.__preloaded_gog = Parse(moz=False).output()
+            index = Preload_index.load()
             if response.request:
                 parsed_url = url_domain(response.request.url)
                 self.__logging.debug(f"url : {parsed_url} parsed")
             else:
                 parsed_url = None
-            return (
-                parsed_url in self.__preloaded_moz or parsed_url in self.__preloaded_gog
-            )
+            return parsed_url is not None and index.is_preloaded(parsed_url)
+
+    @classmethod
+    def __get_session(cls) -> requests.Session:
+        """
+        Internal method to obtain the session shared by all the probes
+
+        The connections are kept alive and pooled, with a limited number of
+        connections for each host.
+
+        :return: the shared session
+        :rtype: requests.Session
+        """
+        with cls.__session_lock:
+            if cls.__session is None:
+                session = requests.Session()
+                session.headers.update(cls.__headers)
+                adapter = HTTPAdapter(
+                    pool_connections=cls.__pool_hosts,
+                    pool_maxsize=cls.__pool_per_host,
+                    pool_block=True,  # wait for a free connection to the host
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                cls.__session = session
+            return cls.__session
+
+    def __probe(self, link: str) -> requests.Response:
+        """
+        Internal method to send the request
+
+        :param link: link to probe
+        :type link: str
+        :return: the response, a default response if the connection failed
+        :rtype: requests.Response
+        """
+        try:
+            return self.__get_session().head(link, timeout=5)
+        except requests.exceptions.SSLError as ex:
+            self.__logging.error(f"I can't connect to SSL/TLS:\n{ex}")
+        except (
+            requests.exceptions.ConnectTimeout,
+            requests.exceptions.ConnectTimeout,
+            requests.exceptions.ConnectionError,
+        ) as ex:
+            self.__logging.error(f"I can't connect to host:\n{ex}")
+        self.__logging.warning(
+            "The HTTPS_HSTS analysis cannot proceed and result will be set as vulnerable."
+        )
+        return requests.Response()  # default response
 
     def __worker(self, link: str, type: int, force: bool):
         """
         Internal method to run the analysis
 
+        A single probe of the link serves all the types of analysis.
+
         :param link: link to analyze
         :type link: str
         :param type: type of HSTS
@@ -249,37 +610,12 @@ class Https:
         :return: dict results
         :rtype: dict
         """
-        if force:
-            try:
-
-                self.__cache[link] = requests.head(
-                    link, headers=self.__headers, timeout=5
-                )
-            except requests.exceptions.SSLError as ex:
-                self.__logging.error(f"I can't connect to SSL/TLS:\n{ex}")
-                self.__logging.warning(
-                    "The HTTPS_HSTS analysis cannot proceed and result will be set as vulnerable."
-                )
-                return self.__chose_results(
-                    type, requests.Response()
-                )  # default response
-            except (
-                requests.exceptions.ConnectTimeout,
-                requests.exceptions.ConnectTimeout,
-                requests.exceptions.ConnectionError,
-            ) as ex:
-                self.__logging.error(f"I can't connect to host:\n{ex}")
-                self.__logging.warning(
-                    "The HTTPS_HSTS analysis cannot proceed and result will be set as vulnerable."
-                )
-                return self.__chose_results(
-                    type, requests.Response()
-                )  # default response
-        else:
-            if link not in self.__cache:
-                self.__worker(link, type, force=True)
+        if force or link not in self.__cache:
+            self.__cache[link] = self.__probe(link)
         response = self.__cache[link]
-        if response.ok:
+        if response.status_code is None:  # default response, the probe failed
+            return self.__chose_results(type, response)
+        elif response.ok:
             return self.__chose_results(type, response)
         else:
             self.__logging.warning(
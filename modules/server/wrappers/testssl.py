@@ -1,11 +1,19 @@
+import asyncio
+import gzip
 import json
+import shutil
 import subprocess
 import sys
-from os import sep, devnull, path, remove
+import tempfile
+from datetime import datetime
+from os import sep, devnull, path, remove, makedirs
 import uuid
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from utils.validation import Validator
 from utils.urls import url_strip, link_sep, validate_ip
+from utils.async_subprocess import run_command
+from utils.cache import Disk_cache
 
 
 class Parser:
@@ -14,17 +22,53 @@ class Parser:
     The results are parsed and grouped by IP/SITE.
     """
 
-    def __init__(self, to_parse: dict):
+    def __init__(self, to_parse, keys: list = None):
         """
         Init method.
-        :param to_parse: Raw JSON output of testssl.sh, given as a python dict.
-        :type to_parse: dict
+        :param to_parse: Raw JSON output of testssl.sh, given as a list of findings
+            or as an iterable of findings (see :func:`iterate`).
+        :type to_parse: list or Iterable
+        :param keys: IDs of the findings to keep, default None to keep them all.
+        :type keys: list
         """
         self.__results = to_parse
+        self.__keys = set(keys) if keys else None
         self.__output = {}
         self.__ip_output = {}
         self.__parse()
 
+    @staticmethod
+    def iterate(file, chunk_size: int = 65536):
+        """
+        Parse the JSON array written by testssl.sh incrementally, one finding at a
+        time, without loading the whole file.
+
+        :param file: File with the JSON output of testssl.sh, opened in text mode.
+        :param chunk_size: Characters read at a time.
+        :type chunk_size: int
+        :return: generator of findings
+        :rtype: Generator
+        """
+        decoder = json.JSONDecoder()
+        buffer = ""
+        for chunk in iter(lambda: file.read(chunk_size), ""):
+            buffer += chunk
+            position = 0
+            while True:
+                # skip the array delimiters between the findings
+                while position < len(buffer) and buffer[position] in "[, \t\r\n":
+                    position += 1
+                if position == len(buffer) or buffer[position] == "]":
+                    break
+                try:
+                    finding, position = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:  # incomplete, read the next chunk
+                    break
+                yield finding
+            buffer = buffer[position:]
+        if buffer.strip() not in ("", "]"):
+            logging.warning("Truncated testssl.sh JSON output, last finding ignored.")
+
     def __parse(self):  # parse method
         for result in self.__results:  # for each result
             site, ip = result["ip"].rsplit("/", 1)  # split ip, it usually is website/ip
@@ -42,6 +86,8 @@ class Parser:
                 ):  # same for the previous comment, but with the IP
                     self.__output[site][ip] = {}  # ip inizialization
                 self.__ip_output[ip] = site  # reverse cache
+                if self.__keys is not None and result["id"] not in self.__keys:
+                    continue  # no module asked for it
                 id = result["id"]  # obtain ID
                 result.pop("id", None)  # Remove ID from results
                 result.pop("ip", None)  # Remove IP from results
@@ -63,12 +109,37 @@ class Testssl:
 
     __cache = {}
     __ip_cache = {}
+    __version = "3.0.4"
+    # temp files on tmpfs, if available
+    __temp = "/dev/shm" if path.isdir("/dev/shm") else tempfile.gettempdir()
+    # flags of the checks, split between the runs of a sharded scan
+    __checks = set(
+        "-e --each-cipher -E --cipher-per-proto -s --std --standard -f --fs --pfs "
+        "--nsa --forward-secrecy -p --protocols -g --grease -S --server-defaults "
+        "-P --server-preference --preference -x --single-cipher -c "
+        "--client-simulation -h --header --headers -U --vulnerable -H --heartbleed "
+        "-I --ccs --ccs-injection -T --ticketbleed -BB --robot -R --renegotiation "
+        "-C --compression --crime -B --breach -O --poodle -Z --tls-fallback -W "
+        "--sweet32 -A --beast -L --lucky13 -WS --winshock -F --freak -J --logjam "
+        "-D --drown -4 --rc4 --appelbaum".split()
+    )
+    # checks and options followed by a separate value
+    __with_value = set(
+        "-x --single-cipher -t --starttls --xmpphost --mx --ip --file --add-ca "
+        "--proxy --reqheader --basicauth --connect-timeout --openssl-timeout "
+        "--openssl --mapping --color --debug --severity --warnings --logfile "
+        "--jsonfile --jsonfile-pretty --csvfile --htmlfile --outfile --outFile "
+        "--outprefix".split()
+    )
 
     def __init__(self):
         """
         Loads testssl variables.
         """
-        self.__testssl = f"dependencies{sep}3.0.4{sep}testssl.sh-3.0.4{sep}testssl.sh"
+        self.__testssl = (
+            f"dependencies{sep}{self.__version}{sep}"
+            f"testssl.sh-{self.__version}{sep}testssl.sh"
+        )
         self.__input_dict = {}
 
     def input(self, **kwargs):
@@ -87,6 +158,16 @@ class Testssl:
           Add ``--IP=one`` to testssl.sh executable calls, default *True*
         * *clean* (``bool``) --
           clear the cache, default *False*
+        * *cache* (``bool``) --
+          use the persistent on-disk cache, default *False*
+        * *cache_ttl* (``int``) --
+          seconds before a result in the on-disk cache expires, default *86400*
+        * *keys* (``list of str``) --
+          IDs of the findings to keep, default *None* to keep all of them
+        * *archive* (``str``) --
+          folder where to save the complete JSON output, compressed, default *None*
+        * *shards* (``int``) --
+          split the checks in this many concurrent testssl.sh runs, default *1*
         """
         self.__input_dict = kwargs
 
@@ -163,6 +244,61 @@ class Testssl:
                     )  # if present, merge
         self.__ip_cache.update(ip_cache)
 
+    def __set_defaults(self):
+        """
+        Set the default values of the optional parameters shared by run and run_batch.
+        """
+        self.__input_dict.setdefault("cache", False)
+        self.__input_dict.setdefault("cache_ttl", 86400)
+        if self.__input_dict.get("keys") is None:
+            self.__input_dict["keys"] = []  # keep all the findings
+        self.__input_dict.setdefault("archive", None)
+        self.__input_dict.setdefault("shards", 1)
+
+    def __prepare_input(self, **kwargs) -> (str, list, bool, bool, bool):
+        """
+        Set and validate the input of run and run_async.
+
+        :return: hostname, args, force, one and clean parameters.
+        :rtype: tuple
+        :raise AssertionError: If hostname parameter is not found.
+        """
+        self.input(**kwargs)
+        if "hostname" not in self.__input_dict:
+            raise AssertionError("IP or hostname args not found.")
+        # initialization of parameters
+        self.__input_dict["hostname"] = url_strip(
+            self.__input_dict["hostname"], strip_www=True
+        )
+        args = self.__input_dict["args"] if "args" in self.__input_dict else []
+        force = self.__input_dict["force"] if "force" in self.__input_dict else False
+        one = self.__input_dict["one"] if "one" in self.__input_dict else True
+        clean = self.__input_dict["clean"] if "clean" in self.__input_dict else False
+        self.__set_defaults()
+        Validator(
+            [
+                (self.__input_dict["hostname"], str),
+                (args, list),
+                (force, bool),
+                (one, bool),
+                (clean, bool),
+                (self.__input_dict["shards"], int),
+                (self.__input_dict["cache"], bool),
+                (self.__input_dict["cache_ttl"], int),
+                (self.__input_dict["keys"], list),
+                (
+                    ""
+                    if not self.__input_dict["archive"]
+                    else self.__input_dict["archive"],
+                    str,
+                ),
+            ]
+        )
+        assert self.__input_dict["shards"] >= 1, "The shards must be at least 1."
+        if clean:
+            self.__clean_cache()
+        return str(self.__input_dict["hostname"]), args, force, one, clean
+
     def run(self, **kwargs) -> dict:
         """
 
@@ -180,62 +316,445 @@ class Testssl:
           Add ``--IP=one`` to testssl.sh executable calls, default *True*
         * *clean* (``bool``) --
           clear the cache, default *False*
+        * *cache* (``bool``) --
+          use the persistent on-disk cache, default *False*
+        * *cache_ttl* (``int``) --
+          seconds before a result in the on-disk cache expires, default *86400*
+        * *keys* (``list of str``) --
+          IDs of the findings to keep, default *None* to keep all of them
+        * *archive* (``str``) --
+          folder where to save the complete JSON output, compressed, default *None*
+        * *shards* (``int``) --
+          split the checks in this many concurrent testssl.sh runs, default *1*
 
         :return: Parsed results.
         :rtype: dict
         :raise AssertionError: If hostname parameter is not found.
         """
+        hostname, args, force, one, clean = self.__prepare_input(**kwargs)
+        self.__scan_hostname(hostname, args, force, one)
+        return self.output(hostname=hostname)
+
+    def run_batch(self, **kwargs) -> dict:
+        """
+        Scan a batch of hosts with a single testssl.sh mass testing run.
+
+        The startup of testssl.sh is paid once for the whole batch, the combined
+        results are split by host by the Parser.
+        :param kwargs: See below
+
+        :Keyword Arguments:
+        * *hostnames* (``list of str``) --
+          The hostnames of the websites to analyze. Can be IPs or Names (DNS)
+        * *args* (``list of str``) --
+          Raw arguments for testssl.sh executable, the same for each host
+        * *force* (``bool``) --
+          Force rescan by ignoring cached results , Default *False*
+        * *one* (``bool``) --
+          Add ``--IP=one`` to testssl.sh executable calls, default *True*
+        * *parallel* (``bool``) --
+          Scan the hosts of the batch in parallel, default *True*
+        * *cache* (``bool``) --
+          use the persistent on-disk cache, default *False*
+        * *cache_ttl* (``int``) --
+          seconds before a result in the on-disk cache expires, default *86400*
+        * *keys* (``list of str``) --
+          IDs of the findings to keep, default *None* to keep all of them
+        * *archive* (``str``) --
+          folder where to save the complete JSON output, compressed, default *None*
+
+        :return: Parsed results of each hostname.
+        :rtype: dict
+        :raise AssertionError: If hostnames parameter is not found.
+        """
         self.input(**kwargs)
-        if "hostname" not in self.__input_dict:
-            raise AssertionError("IP or hostname args not found.")
-        else:  # initialization of parameters
-            self.__input_dict["hostname"] = url_strip(
-                self.__input_dict["hostname"], strip_www=True
-            )
-            args = self.__input_dict["args"] if "args" in self.__input_dict else []
-            force = (
-                self.__input_dict["force"] if "force" in self.__input_dict else False
-            )
-            one = self.__input_dict["one"] if "one" in self.__input_dict else True
-            clean = (
-                self.__input_dict["clean"] if "clean" in self.__input_dict else False
-            )
-            Validator(
-                [
-                    (self.__input_dict["hostname"], str),
-                    (args, list),
-                    (force, bool),
-                    (one, bool),
-                    (clean, bool),
-                ]
-            )
-            self.__scan(
-                str(self.__input_dict["hostname"]),
-                args=args,
-                force=force,
-                one=one,
-                clean=clean,
-            )
-        return self.output(hostname=self.__input_dict["hostname"])
+        if "hostnames" not in self.__input_dict:
+            raise AssertionError("IPs or hostnames args not found.")
+        hostnames = [
+            url_strip(hostname, strip_www=True)
+            for hostname in self.__input_dict["hostnames"]
+        ]
+        args = self.__input_dict["args"] if "args" in self.__input_dict else []
+        force = self.__input_dict["force"] if "force" in self.__input_dict else False
+        one = self.__input_dict["one"] if "one" in self.__input_dict else True
+        parallel = self.__input_dict.get("parallel", True)
+        self.__set_defaults()
+        Validator(
+            [
+                (hostnames, list),
+                (args, list),
+                (force, bool),
+                (one, bool),
+                (parallel, bool),
+                (self.__input_dict["cache"], bool),
+                (self.__input_dict["cache_ttl"], int),
+                (self.__input_dict["keys"], list),
+                (
+                    ""
+                    if not self.__input_dict["archive"]
+                    else self.__input_dict["archive"],
+                    str,
+                ),
+            ]
+        )
+        to_scan = [
+            hostname
+            for hostname in hostnames
+            if self.__needs_scan(hostname, force)
+            and not self.__load_from_disk(hostname, args, one)
+        ]
+        if to_scan:
+            file_name = uuid.uuid4().hex
+            with open(f"{self.__temp}{sep}{file_name}.txt", "w") as command_file:
+                for hostname in to_scan:  # a line for each testssl.sh run
+                    command_file.write(
+                        " ".join(self.__options(hostname, args, one)) + "\n"
+                    )
+            with open(devnull, "w") as null:
+                try:
+                    subprocess.run(
+                        self.__batch_command(file_name, parallel),
+                        stderr=sys.stderr,
+                        stdout=self.__stdout(null),
+                        check=True,  # check call equivalent
+                        text=True,  # text as an input
+                        input="yes",  # if asked, write 'yes' on each prompt
+                    )
+                except subprocess.CalledProcessError as c:
+                    logging.debug(c)
+            remove(f"{self.__temp}{sep}{file_name}.txt")
+            results = self.__load_results(file_name)
+            if results is not None:
+                for hostname in to_scan:
+                    self.__save_to_disk(
+                        hostname, args, one, self.__results_of(hostname, *results)
+                    )
+        return {hostname: self.output(hostname=hostname) for hostname in hostnames}
 
-    def __scan(self, hostname: str, args: [str], force: bool, one: bool, clean: bool):
+    def __results_of(self, hostname: str, cache: dict, ip_cache: dict) -> tuple:
         """
-        Scan internal module
+        Extract the results of a host from the results of a batch.
+
         :param hostname: Hostname or IP
         :type hostname: str
+        :param cache: parsed results of the batch
+        :type cache: dict
+        :param ip_cache: reverse cache of the batch
+        :type ip_cache: dict
+        :return: parsed results and reverse cache of the host, None if missing
+        :rtype: tuple
+        """
+        hostname = link_sep(hostname)[0]
+        if validate_ip(hostname):
+            if hostname not in ip_cache:
+                return None
+            site = ip_cache[hostname]
+            return {site: {hostname: cache[site][hostname]}}, {hostname: site}
+        elif hostname not in cache:
+            return None
+        return {hostname: cache[hostname]}, {ip: hostname for ip in cache[hostname]}
+
+    def __batch_command(self, file_name: str, parallel: bool) -> list:
+        """
+        Build the testssl.sh mass testing command.
+
+        :param file_name: Name of the command file and of the temp JSON file.
+        :type file_name: str
+        :param parallel: Run the lines of the command file in parallel.
+        :type parallel: bool
+        :return: The command to execute.
+        :rtype: list
+        """
+        logging.debug(f"Starting testssl mass testing, saving result to {file_name}")
+        cmd = [
+            "bash",
+            self.__testssl,
+            f"--jsonfile={self.__temp}{sep}{file_name}.json",
+            f"--file={self.__temp}{sep}{file_name}.txt",
+        ]
+        if parallel:
+            cmd.append("--parallel")
+        return cmd
+
+    async def run_async(self, **kwargs) -> dict:
+        """
+        Awaitable version of run, testssl.sh is executed without blocking the event loop.
+
+        :param kwargs: See :func:`run`
+
+        :return: Parsed results.
+        :rtype: dict
+        :raise AssertionError: If hostname parameter is not found.
+        """
+        hostname, args, force, one, clean = self.__prepare_input(**kwargs)
+        if self.__needs_scan(hostname, force) and not self.__load_from_disk(
+            hostname, args, one
+        ):
+            shards = self.__shard(args)
+            file_names = [uuid.uuid4().hex for _ in shards]
+            with open(devnull, "w") as null:
+                await asyncio.gather(
+                    *[
+                        run_command(
+                            self.__command(hostname, shard, one, file_name),
+                            input="yes",  # if asked, write 'yes' on each prompt
+                            stdout=self.__stdout(null),
+                            stderr=sys.stderr,
+                        )
+                        for shard, file_name in zip(shards, file_names)
+                    ]
+                )
+            self.__save_to_disk(hostname, args, one, self.__load_shards(file_names))
+        return self.output(hostname=hostname)
+
+    def __shard(self, args: [str]) -> list:
+        """
+        Split the checks in groups, each one scanned by a different testssl.sh run.
+
+        Only the known check flags are split, with their value if they have one,
+        such as '-x ECDHE'. The other arguments, such as '--fast', '-t smtp' or
+        '--warnings=batch', are options given to every run.
+
         :param args: Raw args for testssl.sh
         :type args: list of str
+        :return: list of groups of args
+        :rtype: list
+        """
+        options, checks = [], []
+        position = 0
+        while position < len(args):
+            arg = args[position]
+            taken = [arg]
+            if arg in self.__with_value and position + 1 < len(args):
+                taken.append(args[position + 1])
+            (checks if arg in self.__checks else options).append(taken)
+            position += len(taken)
+        shards = min(self.__input_dict["shards"], len(checks))
+        if shards <= 1:
+            return [args]
+        logging.debug(f"Splitting the scan in {shards} testssl.sh runs")
+        options = [arg for option in options for arg in option]
+        return [
+            options + [arg for check in checks[i::shards] for arg in check]
+            for i in range(shards)
+        ]
+
+    def __load_shards(self, file_names: [str]) -> tuple:
+        """
+        Load the results of the runs of a scan, merging them.
+
+        :param file_names: Names of the temp files of the runs.
+        :type file_names: list of str
+        :return: merged results and reverse cache, None if a temp file is missing
+        :rtype: tuple
+        """
+        merged, merged_ip = {}, {}
+        try:
+            for file_name in file_names:
+                results = self.__load_results(file_name)
+                if results is None:
+                    return None
+                cache, ip_cache = results
+                for site in cache:
+                    for ip in cache[site]:
+                        merged.setdefault(site, {}).setdefault(ip, {}).update(
+                            cache[site][ip]
+                        )
+                merged_ip.update(ip_cache)
+        finally:
+            # the runs not loaded, after a missing or broken one, leave their files
+            for file_name in file_names:
+                if path.exists(f"{self.__temp}{sep}{file_name}.json"):
+                    remove(f"{self.__temp}{sep}{file_name}.json")
+        return merged, merged_ip
+
+    def __needs_scan(self, hostname: str, force: bool) -> bool:
+        """
+        Check if the hostname has to be scanned.
+
+        :param hostname: Hostname or IP
+        :type hostname: str
         :param force: Force the rescan, ignore the cached result.
         :type force: bool
+        :return: True if forced or if the hostname (or IP) is not in cache.
+        :rtype: bool
+        """
+        if force:
+            return True
+        elif not validate_ip(hostname):
+            return link_sep(hostname)[0] not in self.__cache
+        else:  # if it's an ip, check for it in reverse cache
+            return link_sep(hostname)[0] not in self.__ip_cache
+
+    def __disk_key(self, hostname: str, args: [str], one: bool) -> str:
+        """
+        Key of a scan in the on-disk cache.
+
+        :param hostname: Hostname or IP, with the port
+        :type hostname: str
+        :param args: Raw args for testssl.sh
+        :type args: list of str
         :param one: Add '--IP=one' to testssl.sh calls.
         :type one: bool
-        :param clean: Clear the cache.
-        :type clean: bool
+        :return: the key
+        :rtype: str
+        """
+        # the order of the arguments does not change the scan
+        return Disk_cache.key(
+            hostname,
+            sorted(set(args)),
+            one,
+            self.__version,
+            sorted(set(self.__input_dict["keys"])),  # the findings kept
+        )
 
+    def __load_from_disk(self, hostname: str, args: [str], one: bool) -> bool:
         """
-        if clean:
-            self.__clean_cache()
-        self.__scan_hostname(hostname, args, force, one)
+        Load the results of a previous scan from the on-disk cache, if enabled.
+
+        :param hostname: Hostname or IP, with the port
+        :type hostname: str
+        :param args: Raw args for testssl.sh
+        :type args: list of str
+        :param one: Add '--IP=one' to testssl.sh calls.
+        :type one: bool
+        :return: True if the results were found
+        :rtype: bool
+        """
+        if not self.__input_dict["cache"]:
+            return False
+        results = Disk_cache("testssl").get(self.__disk_key(hostname, args, one))
+        if results is None:
+            return False
+        logging.debug(f"Loaded testssl results of {hostname} from the disk cache")
+        self.__update_cache(*results)
+        return True
+
+    def __save_to_disk(self, hostname: str, args: [str], one: bool, results: tuple):
+        """
+        Save the results of a scan in the on-disk cache, if enabled.
+
+        :param hostname: Hostname or IP, with the port
+        :type hostname: str
+        :param args: Raw args for testssl.sh
+        :type args: list of str
+        :param one: Add '--IP=one' to testssl.sh calls.
+        :type one: bool
+        :param results: parsed results and reverse cache, None if the scan failed
+        :type results: tuple
+        """
+        if self.__input_dict["cache"] and results is not None:
+            disk_cache = Disk_cache("testssl")
+            disk_cache.evict()  # drop the expired scans
+            disk_cache.set(
+                self.__disk_key(hostname, args, one),
+                results,
+                ttl=self.__input_dict["cache_ttl"],
+            )
+
+    def __stdout(self, null):
+        """
+        Where to redirect the output of testssl.sh.
+
+        :param null: File opened on the null device.
+        :return: stdout if the user asked for debug mode, else the null device.
+        """
+        return (
+            sys.stdout
+            if logging.getLogger().isEnabledFor(
+                logging.DEBUG
+            )  # if the user asked for debug mode, let him see the output.
+            else null  # else /dev/null
+        )
+
+    def __command(self, hostname: str, args: [str], one: bool, file_name: str) -> list:
+        """
+        Build the testssl.sh command.
+
+        :param hostname: Hostname or IP
+        :type hostname: str
+        :param args: Raw args for testssl.sh
+        :type args: list of str
+        :param one: Add '--IP=one' to testssl.sh calls.
+        :type one: bool
+        :param file_name: Name of the temp file where to save the JSON results.
+        :type file_name: str
+        :return: The command to execute.
+        :rtype: list
+        """
+        logging.debug("Starting testssl analysis")
+        logging.debug(f"Scanning {hostname}, saving result to temp file {file_name}")
+        cmd = [
+            "bash",
+            self.__testssl,
+            f"--jsonfile={self.__temp}{sep}{file_name}.json",
+        ]
+        return cmd + self.__options(hostname, args, one)
+
+    def __options(self, hostname: str, args: [str], one: bool) -> list:
+        """
+        Build the options of a testssl.sh run, a line of a mass testing command file.
+
+        :param hostname: Hostname or IP
+        :type hostname: str
+        :param args: Raw args for testssl.sh
+        :type args: list of str
+        :param one: Add '--IP=one' to testssl.sh calls.
+        :type one: bool
+        :return: The options, ending with the hostname.
+        :rtype: list
+        """
+        options = []
+        if one and not validate_ip(hostname):
+            logging.debug("Scanning with --IP=one..")
+            options.append(f"--ip=one")
+        if args:
+            logging.debug(f"Scanning with personalized args: {args}")
+            for arg in args:
+                options.append(arg)
+        options.append(hostname)
+        return options
+
+    def __load_results(self, file_name: str) -> tuple:
+        """
+        Load the results of testssl.sh in the cache and remove the temp file.
+
+        :param file_name: Name of the temp file where the JSON results were saved.
+        :type file_name: str
+        :return: parsed results and reverse cache, None if the temp file is missing
+        :rtype: tuple
+        """
+        if path.exists(
+            f"{self.__temp}{sep}{file_name}.json"
+        ):  # load the temp file results
+            self.__archive(file_name)
+            with open(
+                f"{self.__temp}{sep}{file_name}.json", "r"
+            ) as file:  # parse the temp file while reading it
+                cache, ip_cache = Parser(
+                    Parser.iterate(file), keys=self.__input_dict["keys"]
+                ).output()
+                self.__update_cache(cache, ip_cache)
+            remove(f"{self.__temp}{sep}{file_name}.json")
+            return cache, ip_cache
+        return None
+
+    def __archive(self, file_name: str):
+        """
+        Save a compressed copy of the complete JSON output, if asked.
+
+        :param file_name: Name of the temp file where the JSON results were saved.
+        :type file_name: str
+        """
+        if self.__input_dict["archive"]:
+            makedirs(self.__input_dict["archive"], exist_ok=True)
+            date = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+            name = f"{date}_{file_name}.json.gz"
+            with open(f"{self.__temp}{sep}{file_name}.json", "rb") as source:
+                with gzip.open(
+                    f"{self.__input_dict['archive']}{sep}{name}", "wb"
+                ) as destination:
+                    shutil.copyfileobj(source, destination)
 
     def __scan_hostname(self, hostname: str, args: [str], force: bool, one: bool):
         """
@@ -249,63 +768,43 @@ class Testssl:
         :param one: Add '--IP=one' to testssl.sh calls.
         :type one: bool
         """
-        if force:
-            logging.debug("Starting testssl analysis")
-            file_name = uuid.uuid4().hex
-            logging.debug(
-                f"Scanning {hostname}, saving result to temp file {file_name}"
-            )
-            with open(devnull, "w") as null:
-                cmd = [
-                    "bash",
-                    self.__testssl,
-                    f"--jsonfile=dependencies{sep}{file_name}.json",
-                ]
-                if one and not validate_ip(hostname):
-                    logging.debug("Scanning with --IP=one..")
-                    cmd.append(f"--ip=one")
-                if args:
-                    logging.debug(f"Scanning with personalized args: {args}")
-                    for arg in args:
-                        cmd.append(arg)
-                cmd.append(hostname)
-                try:
-                    subprocess.run(
-                        cmd,
-                        stderr=sys.stderr,
-                        stdout=(
-                            sys.stdout
-                            if logging.getLogger().isEnabledFor(
-                                logging.DEBUG
-                            )  # if the user asked for debug mode, let him see the output.
-                            else null  # else /dev/null
-                        ),
-                        check=True,  # check call equivalent
-                        text=True,  # text as an input
-                        input="yes",  # if asked, write 'yes' on each prompt
-                    )
-                except subprocess.CalledProcessError as c:
-                    logging.debug(c)
-                if path.exists(
-                    f"dependencies{sep}{file_name}.json"
-                ):  # load the temp file results
-                    with open(
-                        f"dependencies{sep}{file_name}.json", "r"
-                    ) as file:  # load temp file
-                        data = file.read()
-                        cache, ip_cache = Parser(json.loads(data)).output()
-                        self.__update_cache(cache, ip_cache)
-                    remove(f"dependencies{sep}{file_name}.json")
-        else:
-            if not validate_ip(
-                hostname
-            ):  # recursive: if force : false, check if in cache. if not, recursive call
-                if link_sep(hostname)[0] not in self.__cache:
-                    self.__scan_hostname(
-                        hostname, args=args, force=True, one=one
-                    )  # with force = True
-            else:
-                if (
-                    link_sep(hostname)[0] not in self.__ip_cache
-                ):  # if it's an ip, check for it in reverse proxy
-                    self.__scan_hostname(hostname, args=args, force=True, one=one)
+        if self.__needs_scan(hostname, force) and not self.__load_from_disk(
+            hostname, args, one
+        ):
+            shards = self.__shard(args)
+            file_names = [uuid.uuid4().hex for _ in shards]
+            if len(shards) == 1:
+                self.__execute(hostname, args, one, file_names[0])
+            else:  # the runs of the shards wait on testssl.sh, threads are enough
+                with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+                    for future in [
+                        executor.submit(self.__execute, hostname, shard, one, file_name)
+                        for shard, file_name in zip(shards, file_names)
+                    ]:
+                        future.result()
+            self.__save_to_disk(hostname, args, one, self.__load_shards(file_names))
+
+    def __execute(self, hostname: str, args: [str], one: bool, file_name: str):
+        """
+        Run testssl.sh
+        :param hostname: Hostname or IP
+        :type hostname: str
+        :param args: Raw args for testssl.sh
+        :type args: list of str
+        :param one: Add '--IP=one' to testssl.sh calls.
+        :type one: bool
+        :param file_name: Name of the temp file where to save the JSON results.
+        :type file_name: str
+        """
+        with open(devnull, "w") as null:
+            try:
+                subprocess.run(
+                    self.__command(hostname, args, one, file_name),
+                    stderr=sys.stderr,
+                    stdout=self.__stdout(null),
+                    check=True,  # check call equivalent
+                    text=True,  # text as an input
+                    input="yes",  # if asked, write 'yes' on each prompt
+                )
+            except subprocess.CalledProcessError as c:
+                logging.debug(c)
@@ -1,12 +1,18 @@
+import asyncio
+import atexit
 import logging
 import subprocess
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-from utils.urls import url_domain
+from utils.urls import url_domain, link_sep
 from utils.validation import Validator
+from utils.async_subprocess import run_command
+from utils.zygote import Zygote
 from pathlib import Path
-from os.path import sep
-from os import remove
-from shutil import copyfile
+from os.path import sep, pathsep
+from os import environ
 
 
 class Tlsfuzzer:
@@ -17,6 +23,18 @@ class Tlsfuzzer:
     """
 
     __cache = {}
+    __cache_lock = threading.Lock()
+    __root = Path(f"dependencies{sep}tlsfuzzer")
+    __zygote = None  # None if not started yet, False if unavailable
+    __zygote_lock = threading.Lock()
+    __preload = [
+        "tlslite.api",
+        "tlsfuzzer.runner",
+        "tlsfuzzer.messages",
+        "tlsfuzzer.expect",
+        "tlsfuzzer.helpers",
+        "tlsfuzzer.utils",
+    ]
 
     def __init__(self):
         self.__input_dict = {}
@@ -34,6 +52,9 @@ class Tlsfuzzer:
             * *scripts* (``list``) -- Scripts to run.
             * *port* (``str``) -- Port to connect to.
             * *force* (``bool``) -- Force to run the script by ignoring cache.
+            * *concurrency* (``int``) -- Scripts to run at the same time, default 4.
+            * *zygote* (``bool``) -- Fork the scripts from a preloaded interpreter,
+              default True.
         """
         self.__input_dict = kwargs
 
@@ -62,41 +83,55 @@ class Tlsfuzzer:
             logging.debug(output)
             return output
 
-    def run(self, **kwargs):
-
+    def __prepare_input(self, **kwargs) -> (str, list, bool, str, list, int):
         """
-        Run tlsfuzzer.
-
-        :param kwargs:
-        :type kwargs: dict
-
-        :Keyword Arguments:
-            * *hostname* (``str``) -- Hostname to analyze.
-            * *scripts* (``list``) -- Scripts to run.
-            * *port* (``str``) -- Port to connect to.
-            * *force* (``bool``) -- Force to run the script by ignoring cache.
-
-        :return: dict -- Output of tlsfuzzer.
-        :rtype: dict
+        Set and validate the input of run and run_async.
 
+        :return: hostname, scripts paths with arguments, force, port, script names and
+            concurrency.
+        :rtype: tuple
         """
         self.input(**kwargs)
         if "hostname" not in self.__input_dict:
             raise AssertionError("IP or hostname args not found.")
-        elif "scripts" not in self.__input_dict:
-            raise AssertionError("Script list args not found.")
         self.__input_dict["hostname"] = url_domain(self.__input_dict["hostname"])
-        scripts = self.__input_dict["scripts"]
-
-        force = self.__input_dict["force"] if "force" in self.__input_dict else False
         Validator(
             [
                 (self.__input_dict["hostname"], str),
                 (self.__input_dict["port"] if "port" in self.__input_dict else "", str),
+            ]
+        )
+        path_scripts, script_names, force, concurrency = self.__prepare_scripts()
+        return (
+            self.__input_dict["hostname"],
+            path_scripts,
+            force,
+            self.__input_dict.get("port", "443"),
+            script_names,
+            concurrency,
+        )
+
+    def __prepare_scripts(self) -> (list, list, bool, int):
+        """
+        Validate the scripts and the options shared by run, run_async and run_hosts.
+
+        :return: scripts paths with arguments, script names, force and concurrency.
+        :rtype: tuple
+        """
+        if "scripts" not in self.__input_dict:
+            raise AssertionError("Script list args not found.")
+        scripts = self.__input_dict["scripts"]
+        force = self.__input_dict["force"] if "force" in self.__input_dict else False
+        concurrency = self.__input_dict.get("concurrency", 4)
+        Validator(
+            [
                 (force, bool),
                 (scripts, list),
+                (concurrency, int),
+                (self.__input_dict.get("zygote", True), bool),
             ]
         )
+        assert concurrency >= 1, "The concurrency must be at least 1."
         path_scripts = []
         validate = Validator()
         # parse list of tuples
@@ -111,31 +146,149 @@ class Tlsfuzzer:
             validate.list(script_args)
 
             script_name = (
-                script_name[-3] if script_name.endswith(".py") else script_name
+                script_name[:-3] if script_name.endswith(".py") else script_name
             )
             script_names.append(script_name)
-            tmp_path = Path(
-                f"dependencies{sep}tlsfuzzer{sep}scripts{sep}{script_name}.py"
-            )
+            tmp_path = Path(f"{self.__root}{sep}scripts{sep}{script_name}.py")
             if not tmp_path.exists():
                 raise FileNotFoundError(f"file {script_name} not found.")
-            dest = copyfile(
-                str(tmp_path.absolute()), f"{tmp_path.parents[1]}{sep}{tmp_path.name}"
-            )  # copy file for tlsfuzzer workaround
-            tmp_path = Path(dest)
             path_scripts.append((tmp_path, script_args))
+        return path_scripts, script_names, force, concurrency
+
+    def run(self, **kwargs):
+
+        """
+        Run tlsfuzzer.
+
+        :param kwargs:
+        :type kwargs: dict
+
+        :Keyword Arguments:
+            * *hostname* (``str``) -- Hostname to analyze.
+            * *scripts* (``list``) -- Scripts to run.
+            * *port* (``str``) -- Port to connect to.
+            * *force* (``bool``) -- Force to run the script by ignoring cache.
+            * *concurrency* (``int``) -- Scripts to run at the same time, default 4.
+            * *zygote* (``bool``) -- Fork the scripts from a preloaded interpreter,
+              default True.
+
+        :return: dict -- Output of tlsfuzzer.
+        :rtype: dict
 
+        """
+        (
+            hostname,
+            path_scripts,
+            force,
+            port,
+            script_names,
+            concurrency,
+        ) = self.__prepare_input(**kwargs)
         self.__worker(
-            self.__input_dict["hostname"],
+            [
+                (hostname, port, script)
+                for script in self.__pending_scripts(hostname, path_scripts, force)
+            ],
+            concurrency,
+        )
+        return self.output(hostname=hostname, scripts=script_names)
+
+    def run_hosts(self, **kwargs) -> dict:
+        """
+        Run the same scripts on many hosts, sharing a single pool of runs.
+
+        :param kwargs:
+        :type kwargs: dict
+
+        :Keyword Arguments:
+            * *hostnames* (``list``) -- Hostnames to analyze, with the port if not 443.
+            * *scripts* (``list``) -- Scripts to run.
+            * *force* (``bool``) -- Force to run the script by ignoring cache.
+            * *concurrency* (``int``) -- Scripts to run at the same time, default 4.
+            * *zygote* (``bool``) -- Fork the scripts from a preloaded interpreter,
+              default True.
+
+        :return: dict -- Output of tlsfuzzer for each hostname.
+        :rtype: dict
+        """
+        self.input(**kwargs)
+        if "hostnames" not in self.__input_dict:
+            raise AssertionError("IPs or hostnames args not found.")
+        Validator([(self.__input_dict["hostnames"], list)])
+        path_scripts, script_names, force, concurrency = self.__prepare_scripts()
+        runs = []
+        hostnames = []
+        for hostname in self.__input_dict["hostnames"]:
+            hostname, port = link_sep(hostname)
+            hostname = url_domain(hostname)
+            hostnames.append(hostname)
+            for script in self.__pending_scripts(hostname, path_scripts, force):
+                runs.append((hostname, port, script))
+        self.__worker(runs, concurrency)
+        return {
+            hostname: self.output(hostname=hostname, scripts=script_names)
+            for hostname in hostnames
+        }
+
+    async def run_async(self, **kwargs):
+        """
+        Awaitable version of run, the scripts are executed without blocking the event loop.
+
+        :param kwargs: See :func:`run`
+        :type kwargs: dict
+
+        :return: dict -- Output of tlsfuzzer.
+        :rtype: dict
+        """
+        (
+            hostname,
             path_scripts,
             force,
-            port=self.__input_dict["port"],
+            port,
+            script_names,
+            concurrency,
+        ) = self.__prepare_input(**kwargs)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def execute(script: tuple):
+            script_name, script_args = script
+            command = self.__command(hostname, script, port)
+            async with semaphore:
+                with tempfile.TemporaryDirectory(prefix="tlsfuzzer_") as folder:
+                    zygote = self.__start_zygote()
+                    return_code = None
+                    if zygote:
+                        try:
+                            return_code = await asyncio.wrap_future(
+                                self.__submit(zygote, command, folder)
+                            )
+                            output = self.__read_output(folder)
+                        except ChildProcessError as e:
+                            logging.warning(f"{e} Running {script_name} directly.")
+                    if return_code is None:
+                        return_code, output = await run_command(
+                            command,
+                            capture_output=True,
+                            cwd=folder,
+                            env=self.__environment(),
+                        )
+            if return_code:
+                logging.debug(
+                    f"Command {script_name} returned non-zero exit status {return_code}."
+                )
+            self.__store(hostname, script_name, output)
+
+        await asyncio.gather(
+            *[
+                execute(script)
+                for script in self.__pending_scripts(hostname, path_scripts, force)
+            ]
         )
-        return self.output(hostname=self.__input_dict["hostname"], scripts=script_names)
+        return self.output(hostname=hostname, scripts=script_names)
 
-    def __worker(self, hostname: str, scripts: list, force: bool, port="443"):
+    def __pending_scripts(self, hostname: str, scripts: list, force: bool) -> list:
         """
-        Internal worker for run.
+        Obtain the scripts that have to be executed.
 
         :param hostname: Hostname to analyze.
         :type hostname: str
@@ -143,59 +296,194 @@ class Tlsfuzzer:
         :type scripts: list
         :param force: Force to run the script by ignoring cache.
         :type force: bool
+        :return: all the scripts if forced or not cached, else the scripts which are not in cache.
+        :rtype: list
+        """
+        if force or hostname not in self.__cache:
+            return scripts
+        difference = [
+            script
+            for script in scripts
+            if script[0].stem not in self.__cache[hostname]
+        ]  # remove what is already cached
+        if difference:
+            logging.debug(
+                "[TLSFuzzer Caching System] I've found results. Here the scripts which are not in cache"
+            )
+            logging.debug(difference)
+        return difference
+
+    def __command(self, hostname: str, script: tuple, port: str) -> list:
+        """
+        Build the command of a script.
+
+        :param hostname: Hostname to analyze.
+        :type hostname: str
+        :param script: Script path and its arguments.
+        :type script: tuple
         :param port: Port to connect to.
         :type port: str
+        :return: The command to execute.
+        :rtype: list
         """
-        if force:
-            for script in scripts:
-
-                script_name, script_args = script
-                cmd = [
-                    "python3",
-                    f"{script_name}",
-                    "-h",
-                    f"{hostname}",
-                    "-p",
-                    f"{port}",
-                ]
-                cmd += script_args
-                logging.debug(
-                    f"Calling {script_name} for {hostname}{' with args ' + ' '.join(script_args) if script_args else ''} ..."
-                )
-                try:
-                    output = subprocess.check_output(cmd).decode()
-                except subprocess.CalledProcessError as c:
-                    logging.debug(c)
-                    output = c.output.decode()
-                if (
-                    script_name.exists()
-                ):  # workaround, remove temp file moved to the root of tlsfuzzer
-                    remove(str(script_name.absolute()))
-                if hostname not in self.__cache:
-                    self.__cache[hostname] = {}
-                self.__cache[hostname][script_name.stem] = output
-        else:
-            script_args = {}
-            for script in scripts:  # prepare index dict
-                script_name, script_arguments = script
-                script_args[script_name.stem] = script
+        script_name, script_args = script
+        cmd = [
+            "python3",
+            f"{script_name.absolute()}",
+            "-h",
+            f"{hostname}",
+            "-p",
+            f"{port}",
+        ]
+        # the script runs in a temp folder, the paths given as arguments must be absolute
+        cmd += [
+            str(Path(arg).absolute()) if Path(arg).exists() else arg
+            for arg in script_args
+        ]
+        logging.debug(
+            f"Calling {script_name} for {hostname}{' with args ' + ' '.join(script_args) if script_args else ''} ..."
+        )
+        return cmd
+
+    def __store(self, hostname: str, script_name: Path, output: str):
+        """
+        Store the output of a script in the cache.
+
+        :param hostname: Hostname analyzed.
+        :type hostname: str
+        :param script_name: Path of the script executed.
+        :type script_name: Path
+        :param output: Output of the script.
+        :type output: str
+        """
+        with self.__cache_lock:
             if hostname not in self.__cache:
-                self.__worker(hostname, scripts, force=True)
-            elif set(list(script_args.keys())) != set(
-                list(self.__cache[hostname].keys())
+                self.__cache[hostname] = {}
+            self.__cache[hostname][script_name.stem] = output
+
+    def __environment(self) -> dict:
+        """
+        Environment of the scripts, tlsfuzzer is imported from its root.
+
+        :return: the environment variables
+        :rtype: dict
+        """
+        environment = environ.copy()
+        environment["PYTHONPATH"] = pathsep.join(
+            [str(self.__root.absolute())]
+            + ([environ["PYTHONPATH"]] if "PYTHONPATH" in environ else [])
+        )
+        return environment
+
+    def __start_zygote(self):
+        """
+        Obtain the zygote shared by the scripts, starting it if needed.
+
+        :return: the zygote, None if disabled or unavailable
+        :rtype: Zygote
+        """
+        if not self.__input_dict.get("zygote", True) or not Zygote.supported():
+            return None
+        with self.__zygote_lock:
+            if Tlsfuzzer.__zygote is None or (
+                Tlsfuzzer.__zygote and not Tlsfuzzer.__zygote.alive()
             ):
-                difference_keys = list(
-                    set(list(script_args.keys()))
-                    - set(list(self.__cache[hostname].keys()))
-                )  # remove what is already cached
-                difference = [script_args[key] for key in difference_keys]
-                logging.debug(
-                    "[TLSFuzzer Caching System] I've found results. Here the scripts which are not in cache"
-                )
-                logging.debug(difference)
-                self.__worker(hostname, difference, force=True)
-                for key, value in script_args.items():
-                    if value[
-                        0
-                    ].exists():  # workaround, remove temp file moved to the root of tlsfuzzer
-                        remove(str(value[0].absolute()))
+                try:
+                    zygote = Zygote(self.__preload, env=self.__environment())
+                    missing = set(self.__preload) - set(zygote.preloaded())
+                    if missing:  # a partial preload, run the scripts directly
+                        zygote.close()
+                        raise ChildProcessError(
+                            f"can't import {', '.join(sorted(missing))}."
+                        )
+                    Tlsfuzzer.__zygote = zygote
+                    atexit.register(Tlsfuzzer.__zygote.close)
+                except (OSError, ChildProcessError) as e:
+                    logging.warning(f"Tlsfuzzer zygote unavailable: {e}")
+                    Tlsfuzzer.__zygote = False
+            return Tlsfuzzer.__zygote or None
+
+    def __submit(self, zygote: Zygote, command: list, folder: str):
+        """
+        Run a command built by __command in a child of the zygote.
+
+        :param zygote: the zygote
+        :type zygote: Zygote
+        :param command: the command, the interpreter is skipped
+        :type command: list
+        :param folder: working directory, where the output is saved
+        :type folder: str
+        :return: future of the exit code
+        :rtype: concurrent.futures.Future
+        """
+        _, script, *args = command
+        return zygote.submit(script, args, folder, f"{folder}{sep}output")
+
+    def __read_output(self, folder: str) -> str:
+        """
+        Read the output of a script run by the zygote.
+
+        :param folder: working directory of the script
+        :type folder: str
+        :return: the stdout of the script
+        :rtype: str
+        """
+        with open(f"{folder}{sep}output", "r", errors="replace") as file:
+            return file.read()
+
+    def __execute(self, hostname: str, script: tuple, port: str):
+        """
+        Run a script in its own temp folder and store its output.
+
+        :param hostname: Hostname to analyze.
+        :type hostname: str
+        :param script: Script path and its arguments.
+        :type script: tuple
+        :param port: Port to connect to.
+        :type port: str
+        """
+        command = self.__command(hostname, script, port)
+        with tempfile.TemporaryDirectory(prefix="tlsfuzzer_") as folder:
+            zygote = self.__start_zygote()
+            if zygote:
+                try:
+                    return_code = self.__submit(zygote, command, folder).result()
+                    if return_code:
+                        logging.debug(
+                            f"Command {script[0]} returned non-zero exit status {return_code}."
+                        )
+                    self.__store(hostname, script[0], self.__read_output(folder))
+                    return
+                except ChildProcessError as e:
+                    logging.warning(f"{e} Running {script[0]} directly.")
+            try:
+                output = subprocess.check_output(
+                    command,
+                    cwd=folder,
+                    env=self.__environment(),
+                ).decode()
+            except subprocess.CalledProcessError as c:
+                logging.debug(c)
+                output = c.output.decode()
+        self.__store(hostname, script[0], output)
+
+    def __worker(self, runs: list, concurrency: int):
+        """
+        Internal worker for run and run_hosts.
+
+        :param runs: (hostname, port, script) tuples to execute.
+        :type runs: list
+        :param concurrency: Scripts to run at the same time.
+        :type concurrency: int
+        """
+        if concurrency == 1 or len(runs) <= 1:
+            for hostname, port, script in runs:
+                self.__execute(hostname, script, port)
+            return
+        # the runs wait on the scripts, threads are enough
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for future in [
+                executor.submit(self.__execute, hostname, script, port)
+                for hostname, port, script in runs
+            ]:
+                future.result()
@@ -70,7 +70,8 @@ if __name__ == "__main__":
         "--file",
         type=str,
         action="store",
-        help="The configuration to analyze.",
+        help="The configuration to analyze, or a folder (all its .conf files) or a"
+        " glob pattern to audit many configurations in a single report.",
     )
     hostname_or_apk.add_argument(
         "-d",
@@ -91,7 +92,8 @@ if __name__ == "__main__":
         "--apk",
         type=str,
         action="store",
-        help="The apk path, target of the analysis.",
+        help="The apk path, target of the analysis.\nA folder, a glob pattern or a"
+        " manifest with a path on each line\nanalyze a batch of APKs in one report.",
     )
     parser.add_argument(
         "--apply-fix",
@@ -129,6 +131,136 @@ if __name__ == "__main__":
         nargs="+",
         help="List of modules to exclude" "\nFor example\n\t-e breach crime",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        action="store",
+        help="Number of hosts, APKs or configurations to analyze concurrently when"
+        " using -d or a batch of APKs with -a or of configurations with -f.",
+        default=1,
+    )
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Run the independent data sources of each analysis concurrently.",
+        default=False,
+    )
+    parser.add_argument(
+        "--dex-jobs",
+        type=int,
+        action="store",
+        dest="dex_jobs",
+        help="Processes analyzing the DEX files of a multidex APK with Mallodroid"
+        " (default 1, the whole APK at once).",
+        default=1,
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse the Mallodroid findings of a previous build of the same package"
+        " when its DEX files are unchanged (e.g. only resources or signature"
+        " changed); otherwise the whole APK is analyzed. SUPER always scans the"
+        " whole APK.",
+        default=False,
+    )
+    parser.add_argument(
+        "--no-triage",
+        action="store_false",
+        dest="triage",
+        help="Run all the Android modules, even those whose classes aren't in the APK.",
+        default=True,
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse the scan results and the parsed configurations saved on disk by"
+        " previous runs, if not expired.",
+        default=False,
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=int,
+        action="store",
+        dest="cache_ttl",
+        help="Seconds before a scan result saved on disk expires (default 86400).",
+        default=86400,
+    )
+    parser.add_argument(
+        "--http-concurrency",
+        type=int,
+        action="store",
+        dest="http_concurrency",
+        help="HTTP(S) probes sent at the same time when using -d (default 100).",
+        default=100,
+    )
+    parser.add_argument(
+        "--http-timeout",
+        type=int,
+        action="store",
+        dest="http_timeout",
+        help="Seconds before a HTTP(S) probe fails (default 5).",
+        default=5,
+    )
+    parser.add_argument(
+        "--testssl-batch",
+        type=int,
+        action="store",
+        dest="testssl_batch",
+        metavar="N",
+        help="Scan the domains of -d with a testssl.sh mass testing run "
+        "every N domains (default 0, one run for each domain).",
+        default=0,
+    )
+    parser.add_argument(
+        "--testssl-shards",
+        type=int,
+        action="store",
+        dest="testssl_shards",
+        metavar="N",
+        help="Split the testssl.sh checks of each host in N concurrent runs "
+        "(default 1).",
+        default=1,
+    )
+    parser.add_argument(
+        "--tlsfuzzer-concurrency",
+        type=int,
+        action="store",
+        dest="tlsfuzzer_concurrency",
+        metavar="N",
+        help="Run up to N tlsfuzzer scripts at the same time (default 4).",
+        default=4,
+    )
+    parser.add_argument(
+        "--tlsfuzzer-batch",
+        type=int,
+        action="store",
+        dest="tlsfuzzer_batch",
+        metavar="N",
+        help="When using -d, run the tlsfuzzer scripts of N domains at a time in a"
+        " single pool before analyzing them. Otherwise the scripts of each domain"
+        " run with its analysis (default 0).",
+        default=0,
+    )
+    parser.add_argument(
+        "--testssl-archive",
+        action="store",
+        dest="testssl_archive",
+        metavar="FOLDER",
+        help="Save the complete testssl.sh JSON output, compressed, in FOLDER. "
+        "Otherwise only the findings read by the modules are kept.",
+        default=None,
+    )
+    parser.add_argument(
+        "--resume",
+        action="store",
+        metavar="JOURNAL",
+        help="Journal (JSONL results) of the analysis, kept after the report: if it"
+        " exists, skip the hosts already in it, append the new ones and build the"
+        " report from it. Pass it from the first run to be able to resume; without"
+        " it, the results of an HTML/PDF report are streamed to a temporary file.",
+        default=None,
+    )
     parser.add_argument(
         "--stix",
         action="store_true",
@@ -0,0 +1,180 @@
+# run from the root folder: python -m pytest tests/apk_test.py
+import struct
+import tempfile
+import zipfile
+from os.path import sep
+
+from utils.apk import Apk
+
+
+def uleb128(value: int) -> bytes:
+    out = b""
+    while True:
+        byte, value = value & 0x7F, value >> 7
+        out += bytes([byte | (0x80 if value else 0)])
+        if not value:
+            return out
+
+
+def dex(strings: list) -> bytes:
+    """
+    A DEX file with only the header and the string table.
+    """
+    header = bytearray(0x70)
+    header[:8] = b"dex\n035\0"
+    ids, data = b"", b""
+    data_start = len(header) + 4 * len(strings)
+    for string in strings:
+        encoded = string.encode()
+        ids += struct.pack("<L", data_start + len(data))
+        data += uleb128(len(string)) + encoded + b"\0"
+    struct.pack_into("<2L", header, 0x38, len(strings), len(header))
+    return bytes(header) + ids + data
+
+
+def manifest(package: str, utf8: bool = True) -> bytes:
+    """
+    A binary XML manifest with only the <manifest> element and its attributes.
+    """
+    strings = ["versionCode", "package", "manifest", "android", package]
+    offsets, data = b"", b""
+    for string in strings:
+        offsets += struct.pack("<L", len(data))
+        if utf8:
+            encoded = string.encode()
+            data += bytes([len(string), len(encoded)]) + encoded + b"\0"
+        else:
+            data += struct.pack("<H", len(string)) + string.encode("utf-16-le")
+            data += b"\0\0"
+    data += b"\0" * (-len(data) % 4)
+    start = 28 + len(offsets)
+    pool = struct.pack(
+        "<2HL5L",
+        0x0001,
+        28,
+        start + len(data),
+        len(strings),
+        0,
+        0x100 if utf8 else 0,
+        start,
+        0,
+    )
+    pool += offsets + data
+    # versionCode=1, then package=<package>
+    attributes = struct.pack("<3L2HL", 0xFFFFFFFF, 0, 0xFFFFFFFF, 8, 0x10, 1)
+    attributes += struct.pack("<3L2HL", 0xFFFFFFFF, 1, 4, 8, 0x03, 4)
+    extension = struct.pack("<2L6H", 0xFFFFFFFF, 2, 20, 20, 2, 0, 0, 0)
+    element = struct.pack(
+        "<2HL2L", 0x0102, 16, 16 + len(extension) + len(attributes), 1, 0xFFFFFFFF
+    )
+    body = pool + element + extension + attributes
+    return struct.pack("<2HL", 0x0003, 8, 8 + len(body)) + body
+
+
+def build(folder: str, dexes: list, package="com.example.app", **options) -> str:
+    path = f"{folder}{sep}test.apk"
+    compression = options.get("compression", zipfile.ZIP_DEFLATED)
+    with zipfile.ZipFile(path, "w", compression) as apk:
+        binary = manifest(package, options.get("utf8", True))
+        apk.writestr("AndroidManifest.xml", binary)
+        apk.writestr("res/raw/cert.pem", b"not a DEX file")
+        for i, strings in enumerate(dexes):
+            name = "classes.dex" if i == 0 else f"classes{i + 1}.dex"
+            apk.writestr(name, dex(strings))
+    return path
+
+
+def test_entries():
+    with tempfile.TemporaryDirectory() as folder:
+        path = build(folder, [["La/Main;"], ["Lb/Other;"], ["Lc/Third;"]])
+        with Apk(path) as apk:
+            assert set(apk.names()) == {
+                "AndroidManifest.xml",
+                "res/raw/cert.pem",
+                "classes.dex",
+                "classes2.dex",
+                "classes3.dex",
+            }
+            assert apk.dex_files() == ["classes.dex", "classes2.dex", "classes3.dex"]
+            with zipfile.ZipFile(path) as reference:
+                for name in apk.names():
+                    assert apk.read(name) == reference.read(name)
+
+
+def test_stored():
+    with tempfile.TemporaryDirectory() as folder:
+        path = build(folder, [["La/Main;"]], compression=zipfile.ZIP_STORED)
+        with Apk(path) as apk:
+            assert Apk.dex_strings(apk.read("classes.dex")) == [b"La/Main;"]
+
+
+def test_package():
+    # the manifest string pool can be UTF-8 or UTF-16
+    for utf8 in (True, False):
+        with tempfile.TemporaryDirectory() as folder:
+            with Apk(build(folder, [[]], "it.fbk.tlsa", utf8=utf8)) as apk:
+                assert apk.package() == "it.fbk.tlsa"
+
+
+def test_find():
+    with tempfile.TemporaryDirectory() as folder:
+        path = build(
+            folder,
+            [
+                ["La/Main;", "hello"],
+                ["Ljavax/net/ssl/X509TrustManager;", "checkServerTrusted"],
+            ],
+        )
+        with Apk(path) as apk:
+            found = apk.find(
+                {"X509TrustManager", "net/ssl", "hello", "HostnameVerifier", "main"}
+            )
+        # substrings, ignoring the case, of the strings of any DEX file
+        assert found == {"X509TrustManager", "net/ssl", "hello", "main"}
+
+
+def test_dex_strings():
+    strings = ["", "a" * 200, "Lcom/example/Main;", "ünïcode"]
+    assert Apk.dex_strings(dex(strings)) == [string.encode() for string in strings]
+
+
+def test_corrupted():
+    valid = dex(["abc", "def"])
+    broken = [
+        b"not a dex file",
+        valid[:0x40],  # header cut before the string table
+        valid[:-5],  # last string not terminated
+    ]
+    out_of_range = bytearray(valid)
+    struct.pack_into("<L", out_of_range, 0x70, 10**6)  # string data offset
+    broken.append(bytes(out_of_range))
+    too_many = bytearray(valid)
+    struct.pack_into("<L", too_many, 0x38, 10**6)  # string table size
+    broken.append(bytes(too_many))
+    for data in broken:
+        try:
+            Apk.dex_strings(data)
+        except (ValueError, struct.error):
+            pass
+        else:
+            raise AssertionError(f"{data[:16]} should be refused")
+    with tempfile.TemporaryDirectory() as folder:
+        path = f"{folder}{sep}broken.apk"
+        with open(path, "wb") as file:
+            file.write(b"PK\x03\x04 not really a ZIP file")
+        try:
+            Apk(path)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("a file without central directory should be refused")
+
+
+if __name__ == "__main__":
+    test_entries()
+    test_stored()
+    test_package()
+    test_find()
+    test_dex_strings()
+    test_corrupted()
+    print("ok")
@@ -0,0 +1,53 @@
+# run from the root folder: python -m pytest tests/counter_test.py
+import random
+
+from utils.counter import Matcher, count_occurrencies
+
+# word and non-word characters, with the ones special in a regex or a set
+ALPHABET = "aab5_ -.]^\\("
+
+
+def random_text(rng: random.Random, length: int) -> str:
+    return "".join(rng.choice(ALPHABET) for _ in range(length))
+
+
+def test_fuzz():
+    rng = random.Random(0)
+    for _ in range(3000):
+        words = [random_text(rng, rng.randint(1, 4)) for _ in range(rng.randint(1, 6))]
+        text = random_text(rng, rng.randint(0, 60))
+        expected = {word: count_occurrencies(word, text) for word in words}
+        assert Matcher(words).count(text) == expected, (words, text)
+
+
+def test_tlsfuzzer_output():
+    # the checks of the tlsfuzzer modules, overlapping as in the script output
+    words = ["MD5 forced", "MD5", "sanity", "sanity ok", "Test end"]
+    text = "sanity ok\nMD5 forced\nMD5 forced sanity\nnot-MD5 MD5s sanity\nTest end"
+    expected = {word: count_occurrencies(word, text) for word in words}
+    assert Matcher(words).count(text) == expected
+    assert expected == {
+        "MD5 forced": 2,
+        "MD5": 3,
+        "sanity": 3,
+        "sanity ok": 1,
+        "Test end": 1,
+    }
+
+
+def test_words():
+    assert Matcher(["b", "a", "b"]).words() == ["b", "a"]
+    assert Matcher(["a", "a"]).count("a a") == {"a": 2}
+    try:
+        Matcher(["a", ""])
+    except AssertionError:
+        pass
+    else:
+        raise AssertionError("an empty word must be refused")
+
+
+if __name__ == "__main__":
+    test_fuzz()
+    test_tlsfuzzer_output()
+    test_words()
+    print("ok")
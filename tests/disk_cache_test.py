@@ -0,0 +1,79 @@
+# run from the root folder: python -m pytest tests/disk_cache_test.py
+import tempfile
+import time
+from multiprocessing import Pool
+
+from utils.cache import Disk_cache
+
+
+def test_get_set():
+    with tempfile.TemporaryDirectory() as folder:
+        cache = Disk_cache("test", folder)
+        key = Disk_cache.key("example.com:443", ["-p", "-e"])
+        assert cache.get(key) is None
+        assert cache.get(key, {}) == {}
+        cache.set(key, {"example.com": {"1.2.3.4": {"id": "ok"}}}, 60)
+        assert cache.get(key) == {"example.com": {"1.2.3.4": {"id": "ok"}}}
+        # another instance reads the same database
+        assert Disk_cache("test", folder).get(key) is not None
+        cache.delete(key)
+        assert cache.get(key) is None
+
+
+def test_key():
+    assert Disk_cache.key("a", {"x": 1, "y": 2}) == Disk_cache.key(
+        "a", {"y": 2, "x": 1}
+    )
+    assert Disk_cache.key("a", ["-p"]) != Disk_cache.key("a", ["-e"])
+    assert Disk_cache.key("a", "b") != Disk_cache.key("ab")
+
+
+def test_ttl():
+    with tempfile.TemporaryDirectory() as folder:
+        cache = Disk_cache("test", folder)
+        cache.set("short", 1, 0.2)
+        cache.set("long", 2, 60)
+        assert cache.get("short") == 1
+        time.sleep(0.3)
+        assert cache.get("short") is None
+        assert cache.get("long") == 2
+        assert cache.evict() == 1  # only the expired entry
+
+
+def test_evict():
+    with tempfile.TemporaryDirectory() as folder:
+        cache = Disk_cache("test", folder)
+        for i in range(10):
+            cache.set(str(i), "x" * 10, 60)
+            time.sleep(0.01)  # distinct creation times
+        assert cache.evict(max_entries=6) == 4
+        kept = [str(i) for i in range(10) if cache.get(str(i)) is not None]
+        assert kept == ["4", "5", "6", "7", "8", "9"]
+        # each value is 12 bytes of JSON, the 3 newest fit in 40 bytes
+        assert cache.evict(max_size=40) == 3
+        assert [str(i) for i in range(10) if cache.get(str(i))] == ["7", "8", "9"]
+        cache.clear()
+        assert cache.get("9") is None
+
+
+def _write(arguments: tuple) -> None:
+    folder, i = arguments
+    Disk_cache("test", folder).set(str(i), i, 60)
+
+
+def test_processes():
+    with tempfile.TemporaryDirectory() as folder:
+        Disk_cache("test", folder)
+        with Pool(4) as pool:
+            pool.map(_write, [(folder, i) for i in range(40)])
+        cache = Disk_cache("test", folder)
+        assert [cache.get(str(i)) for i in range(40)] == list(range(40))
+
+
+if __name__ == "__main__":
+    test_get_set()
+    test_key()
+    test_ttl()
+    test_evict()
+    test_processes()
+    print("ok")
@@ -0,0 +1,156 @@
+# run from the root folder: python -m pytest tests/planner_test.py
+import threading
+import time
+
+from modules.planner import Planner
+
+Source = Planner.Source
+
+
+class Module:
+    """
+    A module declaring its data sources, like the bases of the real modules.
+    """
+
+    def __init__(self, *sources):
+        self.sources = list(sources)
+
+    def _sources(self):
+        return self.sources
+
+
+def scan(args, keys=("id",)):
+    return Source.TESTSSL, (tuple(args), tuple(keys))
+
+
+MODULES = {
+    "certificate": object(),  # no data sources
+    "beast": Module(scan(["-A"])),
+    "breach": Module(scan(["-B", "-A"])),
+    "hsts_not_set": Module((Source.HTTPS, "https")),
+    "https_not_enforced": Module((Source.HTTPS, "http")),
+    "both": Module(scan(["-A"]), (Source.HTTPS, "https")),
+}
+
+
+class Recorder:
+    """
+    Replace the execution of the nodes, recording it.
+    """
+
+    def __init__(self, delay: float = 0):
+        self.delay = delay
+        self.done = []
+        self.running = 0
+        self.most_running = 0
+        self.lock = threading.Lock()
+        self.saved = Planner._Planner__run_node
+
+    def __call__(self, planner, node, hostname_or_path, port=None, parallel=False):
+        with self.lock:
+            self.running += 1
+            self.most_running = max(self.most_running, self.running)
+        time.sleep(self.delay)
+        with self.lock:
+            self.running -= 1
+            self.done.append(node)
+
+    def __enter__(self):
+        recorder = self
+        Planner._Planner__run_node = lambda *args: recorder(*args)
+        return self
+
+    def __exit__(self, *_):
+        Planner._Planner__run_node = self.saved
+
+
+def test_nodes():
+    plan = Planner(MODULES)
+    # one testssl.sh scan for all the modules, one probe for each scheme
+    assert set(plan.nodes()) == {
+        (Source.TESTSSL, None),
+        (Source.HTTPS, "https"),
+        (Source.HTTPS, "http"),
+    }
+    assert plan.nodes()[(Source.TESTSSL, None)] == ["beast", "breach", "both"]
+    assert plan.testssl_arguments() == ["-A", "-B"]
+    assert plan.dependencies("certificate") == []
+    assert plan.dependencies("both") == [
+        (Source.TESTSSL, None),
+        (Source.HTTPS, "https"),
+    ]
+
+
+def test_testssl_keys():
+    assert Planner(MODULES).testssl_keys() == ["id"]
+    modules = {
+        "beast": Module(scan(["-A"], ["BEAST"])),
+        "breach": Module(scan(["-B"], ["BREACH", "BEAST"])),
+    }
+    assert Planner(modules).testssl_keys() == ["BEAST", "BREACH"]
+    # a module without keys reads any finding: none can be dropped
+    everything = Module(scan(["-U"], ()))
+    for modules in (
+        {"all": everything, "beast": Module(scan(["-A"], ["BEAST"]))},
+        {"beast": Module(scan(["-A"], ["BEAST"])), "all": everything},
+    ):
+        assert Planner(modules).testssl_keys() is None
+
+
+def check_execution(parallel: bool, recorder: Recorder):
+    plan = Planner(MODULES)
+    yielded = []
+    for name in plan.execute("example.com", "443", parallel=parallel):
+        # a module is ready only when all its sources are done
+        assert all(node in recorder.done for node in plan.dependencies(name)), name
+        yielded.append(name)
+    assert sorted(yielded) == sorted(MODULES)
+    assert yielded[0] == "certificate"
+    # each source runs exactly once
+    assert sorted(map(str, recorder.done)) == sorted(map(str, plan.nodes()))
+
+
+def test_execute_serial():
+    with Recorder() as recorder:
+        check_execution(False, recorder)
+    assert recorder.most_running == 1
+
+
+def test_execute_parallel():
+    with Recorder(delay=0.2) as recorder:
+        started = time.monotonic()
+        check_execution(True, recorder)
+        elapsed = time.monotonic() - started
+    assert recorder.most_running == 3
+    assert elapsed < 0.5
+
+
+def test_failing_source():
+    def fail(*_):
+        raise ConnectionError("unreachable")
+
+    saved = Planner._Planner__run_node
+    Planner._Planner__run_node = fail
+    try:
+        for parallel in (False, True):
+            plan = Planner(MODULES)
+            names = []
+            try:
+                for name in plan.execute("example.com", "443", parallel=parallel):
+                    names.append(name)
+            except ConnectionError:
+                pass
+            else:
+                raise AssertionError("the error of a source must be raised")
+            assert names == ["certificate"]
+    finally:
+        Planner._Planner__run_node = saved
+
+
+if __name__ == "__main__":
+    test_nodes()
+    test_testssl_keys()
+    test_execute_serial()
+    test_execute_parallel()
+    test_failing_source()
+    print("ok")
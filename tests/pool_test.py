@@ -0,0 +1,75 @@
+# run from the root folder: python -m pytest tests/pool_test.py
+import threading
+import time
+from os import remove
+from os.path import sep
+
+from modules.core import Core
+from utils.stream import Result_stream
+
+DOMAINS = [f"h{i}.example.com" for i in range(7)]
+STREAM = f"results{sep}pool_test.jsonl"
+
+
+class SlowAnalysis:
+    """
+    Stand-in for the analysis of a host, waiting as if on the network.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+
+    # not a function, it replaces the method without being bound to the Core
+    def __call__(self, type_of_analysis, host, configuration, port=None):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(0.2)
+        with self.lock:
+            self.running -= 1
+        if host == DOMAINS[3]:
+            return {}, {"sloth": {"vulnerable": True}}
+        return {}, {"sloth": {}}
+
+
+def analyze(jobs: int) -> (SlowAnalysis, dict):
+    analysis = SlowAnalysis()
+    saved = Core._Core__exec_anaylsis, Core._Core__prefetch
+    Core._Core__exec_anaylsis = analysis
+    Core._Core__prefetch = lambda *_: None
+    try:
+        Core(
+            hostname_or_path=list(DOMAINS),
+            configuration=["sloth"],
+            output="pool_test.raw",
+            type_of_analysis=Core.Analysis.DOMAINS,
+            jobs=jobs,
+        )
+        results = {host: res for host, _, res in Result_stream.read(STREAM)}
+        remove(STREAM)
+    finally:
+        Core._Core__exec_anaylsis, Core._Core__prefetch = saved
+    return analysis, results
+
+
+def test_bounded_pool():
+    analysis, results = analyze(jobs=3)
+    assert analysis.peak == 3
+    # every host is written once, with its own results
+    assert sorted(results) == sorted(DOMAINS)
+    assert results[DOMAINS[3]] == {"sloth": {"vulnerable": True}}
+    assert all(results[host] == {"sloth": {}} for host in DOMAINS if host != DOMAINS[3])
+
+
+def test_serial():
+    analysis, results = analyze(jobs=1)
+    assert analysis.peak == 1
+    assert list(results) == DOMAINS  # in the order of the list
+
+
+if __name__ == "__main__":
+    test_bounded_pool()
+    test_serial()
+    print("ok")
@@ -0,0 +1,110 @@
+# run from the root folder: python -m pytest tests/preload_index_test.py
+import json
+import random
+import tempfile
+from base64 import b64encode
+from contextlib import contextmanager
+from os.path import sep
+
+from modules.server.wrappers.https_hsts import Parse, Preload_index
+
+MOZ = {"moz.example": "1", "exact.example": "0", "Mixed.Example": "0"}
+GOG = [
+    {"name": "gog.example", "include_subdomains": True},
+    {"name": "plain.example"},
+    {"name": "dev", "include_subdomains": True},
+]
+
+
+def write_sources(folder: str, moz: dict, gog: list):
+    with open(f"{folder}{sep}moz.inc", "w") as file:
+        file.write("%%\n")
+        file.writelines(f"{host}, {flag}\n" for host, flag in moz.items())
+        file.write("%%\n")
+    with open(f"{folder}{sep}gog.json", "wb") as file:
+        text = "// comment line\n" + json.dumps({"entries": gog})
+        file.write(b64encode(text.encode()))
+
+
+@contextmanager
+def sources(moz: dict = MOZ, gog: list = GOG):
+    """
+    Point the parser and the index to temporary files.
+    """
+    saved = (
+        Parse._Parse__path_moz,
+        Parse._Parse__path_gog,
+        Preload_index._Preload_index__path_index,
+    )
+    with tempfile.TemporaryDirectory() as folder:
+        write_sources(folder, moz, gog)
+        Parse._Parse__path_moz = f"{folder}{sep}moz.inc"
+        Parse._Parse__path_gog = f"{folder}{sep}gog.json"
+        Preload_index._Preload_index__path_index = f"{folder}{sep}index.idx"
+        try:
+            yield folder
+        finally:
+            (
+                Parse._Parse__path_moz,
+                Parse._Parse__path_gog,
+                Preload_index._Preload_index__path_index,
+            ) = saved
+
+
+def reference(domain: str) -> bool:
+    """
+    The lookup done by scanning the parsed lists.
+    """
+    moz = {host.lower(): flag.strip() == "1" for host, flag in MOZ.items()}
+    gog = {e["name"]: e.get("include_subdomains", False) for e in GOG}
+    domain = domain.lower().rstrip(".")
+    if domain in moz or domain in gog:
+        return True
+    labels = domain.split(".")
+    return any(
+        moz.get(".".join(labels[i:])) or gog.get(".".join(labels[i:]))
+        for i in range(1, len(labels))
+    )
+
+
+def test_lookup():
+    with sources():
+        index = Preload_index()
+        assert index.is_preloaded("moz.example")
+        assert index.is_preloaded("a.b.moz.example")
+        assert index.is_preloaded("exact.example")
+        assert not index.is_preloaded("sub.exact.example")
+        assert index.is_preloaded("GOG.example.")
+        assert index.is_preloaded("www.gog.example")
+        assert index.is_preloaded("plain.example")
+        assert not index.is_preloaded("www.plain.example")
+        assert index.is_preloaded("mixed.example")
+        assert index.is_preloaded("anything.dev")
+        assert not index.is_preloaded("example")
+        assert not index.is_preloaded("example.com")
+
+
+def test_fuzz():
+    rng = random.Random(0)
+    labels = ["www", "a", "moz", "gog", "exact", "plain", "mixed", "example", "dev"]
+    with sources():
+        index = Preload_index()
+        for _ in range(2000):
+            domain = ".".join(rng.choice(labels) for _ in range(rng.randint(1, 4)))
+            if rng.random() < 0.3:
+                domain = domain.upper()
+            assert index.is_preloaded(domain) == reference(domain), domain
+
+
+def test_rebuild():
+    with sources() as folder:
+        assert not Preload_index().is_preloaded("new.example")
+        write_sources(folder, dict(MOZ, **{"new.example": "0"}), GOG)
+        assert Preload_index().is_preloaded("new.example")
+
+
+if __name__ == "__main__":
+    test_lookup()
+    test_fuzz()
+    test_rebuild()
+    print("ok")
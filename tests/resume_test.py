@@ -0,0 +1,95 @@
+# run from the root folder: python -m pytest tests/resume_test.py
+import contextlib
+import json
+import tempfile
+import threading
+from os.path import sep
+
+from modules.core import Core
+from utils.stream import Result_stream
+
+HOSTS = ["a.example.com", "b.example.com", "c.example.com"]
+
+
+@contextlib.contextmanager
+def fake_analysis():
+    """
+    Replace the analysis of a host and the network prefetch, recording the hosts.
+    """
+    analyzed = []
+    lock = threading.Lock()
+
+    def analyze(self, type_of_analysis, hostname_or_path, configuration, port=None):
+        with lock:
+            analyzed.append(hostname_or_path)
+        return {}, {"sloth": {"host": hostname_or_path}}
+
+    names = ["_Core__exec_anaylsis", "_Core__prefetch", "_Core__prefetch_batch"]
+    saved = {name: getattr(Core, name) for name in names}
+    Core._Core__exec_anaylsis = analyze
+    Core._Core__prefetch = Core._Core__prefetch_batch = lambda *_: None
+    try:
+        yield analyzed
+    finally:
+        for name, method in saved.items():
+            setattr(Core, name, method)
+
+
+def journal(folder: str) -> str:
+    """
+    Journal of an analysis interrupted while writing the results of b.
+    """
+    path = f"{folder}{sep}journal.jsonl"
+    with Result_stream(path) as stream:
+        stream.write(HOSTS[0], {}, {"sloth": {"host": HOSTS[0]}})
+    with open(path, "a") as file:
+        file.write(json.dumps({"hostname": HOSTS[1], "modules": []})[:20])
+    return path
+
+
+def resume(jobs: int):
+    with tempfile.TemporaryDirectory() as folder, fake_analysis() as analyzed:
+        path = journal(folder)
+        Core(
+            hostname_or_path=list(HOSTS),
+            configuration=["sloth"],
+            output="resume_test.raw",
+            type_of_analysis=Core.Analysis.DOMAINS,
+            jobs=jobs,
+            resume=path,
+        )
+        hostnames = [hostname for hostname, _, _ in Result_stream.read(path)]
+    # only the hosts missing from the journal are analyzed, each once
+    assert sorted(analyzed) == HOSTS[1:]
+    assert hostnames[0] == HOSTS[0]
+    assert sorted(hostnames) == HOSTS
+
+
+def test_resume():
+    resume(jobs=1)
+
+
+def test_resume_pool():
+    resume(jobs=2)
+
+
+def test_nothing_left():
+    with tempfile.TemporaryDirectory() as folder, fake_analysis() as analyzed:
+        path = journal(folder)
+        Core(
+            hostname_or_path=HOSTS[:1],
+            configuration=["sloth"],
+            output="resume_test.raw",
+            type_of_analysis=Core.Analysis.DOMAINS,
+            resume=path,
+        )
+        hostnames = [hostname for hostname, _, _ in Result_stream.read(path)]
+    assert analyzed == []
+    assert hostnames == HOSTS[:1]
+
+
+if __name__ == "__main__":
+    test_resume()
+    test_resume_pool()
+    test_nothing_left()
+    print("ok")
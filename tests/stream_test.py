@@ -0,0 +1,123 @@
+# run from the root folder: python -m pytest tests/stream_test.py
+import re
+from os import remove
+from os.path import sep
+
+from modules.report import Report
+from utils.mitigations import load_mitigation
+from utils.stream import Result_stream
+
+STREAM = f"results{sep}stream_test.jsonl"
+DATE = re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}")
+
+
+def results():
+    """
+    Results of two hosts with the values that JSON can't represent as they are.
+    """
+    return {
+        "a.example.com": {
+            "sloth": {
+                "MD5 forced": {"mitigation": load_mitigation("SLOTH")},
+                ("TLSv1.2", 443): {"ciphers": {"DES-CBC3-SHA", "RC4-MD5"}},
+                0: ("first", ["second", ("third",)]),
+            }
+        },
+        "b.example.com": {"sloth": {"MD5 forced": {}, 1: [1.5, None, True]}},
+    }
+
+
+def write_stream():
+    with Result_stream(STREAM) as stream:
+        for hostname, host_results in results().items():
+            stream.write(hostname, {"sloth": None}, host_results)
+
+
+def render(name: str, source) -> str:
+    Report().run(
+        path=f"{name}.html", results=source, mode=Report.Mode.HOSTS, stix=False
+    )
+    path = f"results{sep}{name}.html"
+    with open(path, "r") as file:
+        html = file.read()
+    remove(path)
+    return DATE.sub("", html)
+
+
+def test_round_trip():
+    write_stream()
+    try:
+        read = {hostname: host for hostname, _, host in Result_stream.read(STREAM)}
+    finally:
+        remove(STREAM)
+    assert read == results()
+    assert isinstance(read["a.example.com"]["sloth"][0], tuple)
+
+
+def test_tagged_keys():
+    # a dict looking like a tagged object must not be mistaken for one
+    with Result_stream(STREAM) as stream:
+        stream.write("host", {}, {"m": {"__tuple__": [1]}, "n": {"__set__": []}})
+    try:
+        _, _, read = next(Result_stream.read(STREAM))
+    finally:
+        remove(STREAM)
+    assert read == {"m": {"__tuple__": [1]}, "n": {"__set__": []}}
+
+
+def test_frozenset():
+    # unlike a set, a frozenset can be a key and must stay hashable
+    ciphers = frozenset({"DES-CBC3-SHA", "RC4-MD5"})
+    with Result_stream(STREAM) as stream:
+        stream.write("host", {}, {"m": {ciphers: [ciphers], "s": {1, 2}}})
+    try:
+        _, _, read = next(Result_stream.read(STREAM))
+    finally:
+        remove(STREAM)
+    assert read == {"m": {ciphers: [ciphers], "s": {1, 2}}}
+    assert type(read["m"][ciphers][0]) is frozenset
+    assert type(read["m"]["s"]) is set
+
+
+def test_truncated_line():
+    write_stream()
+    with open(STREAM, "a") as file:
+        file.write('{"hostname": "c.example.com", "modu')
+    with Result_stream(STREAM, append=True) as stream:
+        stream.write("d.example.com", {}, {})
+    try:
+        hostnames = [hostname for hostname, _, _ in Result_stream.read(STREAM)]
+    finally:
+        remove(STREAM)
+    assert hostnames == ["a.example.com", "b.example.com", "d.example.com"]
+
+
+def test_same_report():
+    in_memory = render(
+        "stream_test_memory",
+        {
+            hostname: {"loaded_modules": {"sloth": None}, "results": host_results}
+            for hostname, host_results in results().items()
+        },
+    )
+    write_stream()
+    try:
+        streamed = render(
+            "stream_test_stream",
+            (
+                (hostname, {name: None for name in names}, host_results)
+                for hostname, names, host_results in Result_stream.read(STREAM)
+            ),
+        )
+    finally:
+        remove(STREAM)
+    assert streamed == in_memory
+
+
+if __name__ == "__main__":
+    test_round_trip()
+    test_tagged_keys()
+    test_frozenset()
+    test_truncated_line()
+    test_same_report()
+    print("ok")
@@ -0,0 +1,75 @@
+# run from the root folder: python -m pytest tests/testssl_parser_test.py
+import copy
+import io
+import json
+import random
+
+from modules.server.wrappers.testssl import Parser
+
+
+def findings(count: int = 200) -> list:
+    """
+    testssl.sh findings of two sites and a scan by IP, with awkward strings.
+    """
+    rng = random.Random(0)
+    ips = ["a.example.com/1.2.3.4", "b.example.com/5.6.7.8", "/9.9.9.9"]
+    return [
+        {
+            "id": f"check_{i % 17}",
+            "ip": ips[i % len(ips)],
+            "port": "443",
+            "severity": rng.choice(["OK", "LOW", "HIGH"]),
+            "finding": rng.choice(
+                ['quoted "]" and ","', "[not, an, array]", "ünïcode \\ esc", ""]
+            )
+            * rng.randint(1, 50),
+        }
+        for i in range(count)
+    ]
+
+
+def test_iterate_chunks():
+    expected = findings()
+    for indent in (None, 2):  # testssl.sh writes a pretty printed array
+        text = json.dumps(expected, indent=indent)
+        for chunk_size in (1, 7, 64, 4096, len(text) + 1):
+            parsed = list(Parser.iterate(io.StringIO(text), chunk_size=chunk_size))
+            assert parsed == expected, chunk_size
+
+
+def test_iterate_empty_and_truncated():
+    assert list(Parser.iterate(io.StringIO("[]"))) == []
+    assert list(Parser.iterate(io.StringIO(""))) == []
+    text = json.dumps(findings(10), indent=2)
+    truncated = text[: text.index('"id": "check_9"')]
+    assert list(Parser.iterate(io.StringIO(truncated), chunk_size=16)) == findings(9)
+
+
+def test_same_as_list():
+    text = json.dumps(findings(), indent=2)
+    from_list = Parser(json.loads(text)).output()
+    streamed = Parser(Parser.iterate(io.StringIO(text), chunk_size=100)).output()
+    assert streamed == from_list
+    cache, ip_cache = from_list
+    assert set(cache) == {"a.example.com", "b.example.com", "IP_SCANS"}
+    assert ip_cache["9.9.9.9"] == "IP_SCANS"
+
+
+def test_keys():
+    keys = ["check_1", "check_4"]
+    full, full_ip = Parser(copy.deepcopy(findings())).output()
+    kept, kept_ip = Parser(findings(), keys=keys).output()
+    assert kept_ip == full_ip  # the reverse cache doesn't depend on the keys
+    for site in full:
+        for ip in full[site]:
+            assert kept[site][ip] == {
+                key: value for key, value in full[site][ip].items() if key in keys
+            }
+
+
+if __name__ == "__main__":
+    test_iterate_chunks()
+    test_iterate_empty_and_truncated()
+    test_same_as_list()
+    test_keys()
+    print("ok")
@@ -0,0 +1,56 @@
+# run from the root folder: python -m pytest tests/testssl_shard_test.py
+from modules.server.wrappers import testssl as wrapper
+
+
+def shard(args: list, shards: int) -> list:
+    testssl = wrapper.Testssl()
+    testssl.input(shards=shards)
+    return testssl._Testssl__shard(args)
+
+
+def test_checks_split_once():
+    args = ["-p", "-e", "-U", "--heartbleed", "-S"]
+    runs = shard(args, 3)
+    assert len(runs) == 3
+    assert sorted(arg for run in runs for arg in run) == sorted(args)
+
+
+def test_options_in_every_run():
+    args = ["--fast", "-p", "-t", "smtp", "-e", "--ip", "1.2.3.4", "--sneaky", "-U"]
+    args += ["--warnings=batch", "-q"]
+    runs = shard(args, 2)
+    assert len(runs) == 2
+    for run in runs:
+        options = run[: run.index("-q") + 1]
+        assert options == [
+            "--fast",
+            "-t",
+            "smtp",
+            "--ip",
+            "1.2.3.4",
+            "--sneaky",
+            "--warnings=batch",
+            "-q",
+        ]
+    assert [run[len(options) :] for run in runs] == [["-p", "-U"], ["-e"]]
+
+
+def test_check_with_value():
+    runs = shard(["-x", "ECDHE-RSA-AES128-GCM-SHA256", "-p"], 2)
+    assert runs == [["-x", "ECDHE-RSA-AES128-GCM-SHA256"], ["-p"]]
+
+
+def test_no_split():
+    # one run, with the args as given
+    assert shard(["-p", "-e"], 1) == [["-p", "-e"]]
+    assert shard(["--fast", "-t", "smtp", "-p"], 4) == [["--fast", "-t", "smtp", "-p"]]
+    assert shard(["--fast"], 4) == [["--fast"]]
+    assert shard([], 4) == [[]]
+
+
+if __name__ == "__main__":
+    test_checks_split_once()
+    test_options_in_every_run()
+    test_check_with_value()
+    test_no_split()
+    print("ok")
@@ -0,0 +1,115 @@
+# run from the root folder: python -m pytest tests/zygote_test.py
+import os
+import tempfile
+import time
+from os.path import sep
+
+from utils.zygote import Zygote
+
+SCRIPTS = {
+    "ok.py": "print('hello')",
+    "code.py": "import sys; sys.exit(3)",
+    "message.py": "import sys; sys.exit('bad arguments')",
+    "error.py": "raise RuntimeError('broken')",
+    "killed.py": "import os, signal; os.kill(os.getpid(), signal.SIGTERM)",
+    "env.py": "import os, sys; print(os.getcwd()); print(sys.argv[1:]); "
+    "print(sys.path[0]); print(sys.path[1])",
+    "sibling.py": "import helper; print(helper.VALUE)",
+    "helper.py": "VALUE = 'from the folder of the script'",
+    "slow.py": "import time; time.sleep(0.5)",
+}
+
+
+def run(zygote: Zygote, folder: str, script: str, args: list = ()) -> (int, str):
+    output = f"{folder}{sep}{script}.out"
+    code = zygote.submit(f"{folder}{sep}{script}", list(args), folder, output)
+    code = code.result(timeout=10)
+    with open(output) as file:
+        return code, file.read()
+
+
+def start(folder: str) -> Zygote:
+    for name, source in SCRIPTS.items():
+        with open(f"{folder}{sep}{name}", "w") as file:
+            file.write(source)
+    env = dict(os.environ, PYTHONPATH=f"{folder}{sep}pythonpath")
+    return Zygote(["json", "no_such_module"], env=env)
+
+
+def test_exit_codes():
+    with tempfile.TemporaryDirectory() as folder:
+        zygote = start(folder)
+        try:
+            assert run(zygote, folder, "ok.py") == (0, "hello\n")
+            assert run(zygote, folder, "code.py")[0] == 3
+            assert run(zygote, folder, "message.py")[0] == 1
+            assert run(zygote, folder, "error.py")[0] == 1
+            assert run(zygote, folder, "killed.py")[0] == -15
+        finally:
+            zygote.close()
+
+
+def test_environment():
+    with tempfile.TemporaryDirectory() as folder:
+        work = f"{folder}{sep}work"
+        os.mkdir(work)
+        zygote = start(folder)
+        try:
+            output = f"{work}{sep}env.out"
+            code = zygote.submit(f"{folder}{sep}env.py", ["-x", 1], work, output)
+            assert code.result(timeout=10) == 0
+            with open(output) as file:
+                cwd, args, first, second = file.read().splitlines()
+            assert os.path.realpath(cwd) == os.path.realpath(work)
+            assert args == str(["-x", "1"])
+            # the folder of the script comes first, then the PYTHONPATH
+            assert first == folder
+            assert second == f"{folder}{sep}pythonpath"
+            assert run(zygote, folder, "sibling.py") == (
+                0,
+                "from the folder of the script\n",
+            )
+        finally:
+            zygote.close()
+
+
+def test_concurrent():
+    with tempfile.TemporaryDirectory() as folder:
+        zygote = start(folder)
+        try:
+            started = time.monotonic()
+            futures = [
+                zygote.submit(
+                    f"{folder}{sep}slow.py", [], folder, f"{folder}{sep}{i}.out"
+                )
+                for i in range(6)
+            ]
+            assert [future.result(timeout=10) for future in futures] == [0] * 6
+            # the children run at the same time
+            assert time.monotonic() - started < 2
+        finally:
+            zygote.close()
+
+
+def test_lifecycle():
+    with tempfile.TemporaryDirectory() as folder:
+        zygote = start(folder)
+        assert zygote.preloaded() == ["json"]
+        assert zygote.alive()
+        zygote.close()
+        assert not zygote.alive()
+        future = zygote.submit(f"{folder}{sep}ok.py", [], folder, f"{folder}{sep}o")
+        try:
+            future.result(timeout=10)
+        except ChildProcessError:
+            pass
+        else:
+            raise AssertionError("a closed zygote must not run scripts")
+
+
+if __name__ == "__main__":
+    test_exit_codes()
+    test_environment()
+    test_concurrent()
+    test_lifecycle()
+    print("ok")
@@ -5,7 +5,11 @@ from utils.logger import Logger
 from utils.colors import Color
 from utils.loader import load_configuration
 from utils.configuration import pretty
-from utils.loader import load_list_of_domains
+from utils.loader import (
+    load_list_of_domains,
+    load_list_of_apks,
+    load_list_of_configurations,
+)
 from modules.core import Core
 from os import listdir
 from os.path import isfile, join, sep
@@ -124,10 +128,18 @@ class Tlsa:
                 group_by=args.group_by,
                 apply_fix=args.apply_fix,
                 stix=args.stix,
+                parallel=args.parallel,
+                cache=args.cache,
+                cache_ttl=args.cache_ttl,
+                resume=args.resume,
+                testssl_archive=args.testssl_archive,
+                testssl_shards=args.testssl_shards,
+                tlsfuzzer_concurrency=args.tlsfuzzer_concurrency,
             )
         elif args.apk:
+            apks = load_list_of_apks(args.apk)
             Core(
-                hostname_or_path=args.apk,
+                hostname_or_path=apks if len(apks) > 1 else apks[0],
                 configuration=config_or_modules,
                 output=args.output,
                 output_type=self.__to_report_type(args.output_type),
@@ -135,6 +147,14 @@ class Tlsa:
                 type_of_analysis=Core.Analysis.APK,
                 group_by=args.group_by,
                 stix=args.stix,
+                jobs=args.jobs,
+                parallel=args.parallel,
+                cache=args.cache,
+                cache_ttl=args.cache_ttl,
+                resume=args.resume,
+                triage=args.triage,
+                dex_jobs=args.dex_jobs,
+                incremental=args.incremental,
             )
         elif args.domain_file:
             Core(
@@ -146,14 +166,29 @@ class Tlsa:
                 type_of_analysis=Core.Analysis.DOMAINS,
                 group_by=args.group_by,
                 stix=args.stix,
+                jobs=args.jobs,
+                parallel=args.parallel,
+                cache=args.cache,
+                cache_ttl=args.cache_ttl,
+                resume=args.resume,
+                http_concurrency=args.http_concurrency,
+                http_timeout=args.http_timeout,
+                testssl_batch=args.testssl_batch,
+                testssl_archive=args.testssl_archive,
+                testssl_shards=args.testssl_shards,
+                tlsfuzzer_concurrency=args.tlsfuzzer_concurrency,
+                tlsfuzzer_batch=args.tlsfuzzer_batch,
             )
         elif args.file:
             if isinstance(args.configuration, list):
                 self.__logging.warning(
                     "Ignoring module list. Try to exclude the modules with -e module1 module2"
                 )
+            configurations = load_list_of_configurations(args.file)
             Core(
-                hostname_or_path=args.file,
+                hostname_or_path=configurations
+                if len(configurations) > 1
+                else configurations[0],
                 configuration="default_file.json",
                 output=args.output,
                 output_type=self.__to_report_type(args.output_type),
@@ -164,6 +199,9 @@ class Tlsa:
                 stix=args.stix,
                 openssl_version=args.openssl,
                 ignore_openssl=args.ignore_openssl,
+                jobs=args.jobs,
+                cache=args.cache,
+                cache_ttl=args.cache_ttl,
             )
 
         else:  # must be args.list, unless argparse throws error.
@@ -0,0 +1,258 @@
+import mmap
+import re
+import struct
+import zlib
+
+from utils.logger import Logger
+
+
+class Apk:
+    """
+    Read-only view of an APK, memory-mapped.
+
+    Only the ZIP central directory, the manifest and the string tables of the DEX
+    files are read, nothing is decompiled.
+    """
+
+    __EOCD = b"PK\x05\x06"
+    __EOCD_SIZE = 22
+    __CENTRAL_ENTRY = struct.Struct("<4s6H3L5H2L")
+    __LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+    __DEX = re.compile(r"classes\d*\.dex")
+    __STORED = 0
+    __DEFLATED = 8
+    # chunk types of the binary XML
+    __XML = 0x0003
+    __STRING_POOL = 0x0001
+    __START_ELEMENT = 0x0102
+
+    def __init__(self, path: str):
+        """
+        :param path: path of the APK
+        :type path: str
+        :raise ValueError: if the APK isn't a valid ZIP file
+        """
+        self.__logging = Logger("APK")
+        self.__file = open(path, "rb")
+        try:
+            self.__map = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.__entries = self.__central_directory()
+        except (ValueError, struct.error) as e:
+            self.__file.close()
+            raise ValueError(f"{path} isn't a valid APK: {e}")
+
+    def __central_directory(self) -> dict:
+        """
+        Read the entries of the ZIP central directory.
+
+        :return: name -> (compression method, compressed size, local header offset)
+        :rtype: dict
+        """
+        # the end of central directory record is followed by a comment of at most 64KiB
+        start = max(0, len(self.__map) - self.__EOCD_SIZE - 0xFFFF)
+        eocd = self.__map.rfind(self.__EOCD, start)
+        if eocd < 0:
+            raise ValueError("end of central directory not found")
+        count, size, offset = struct.unpack_from("<2xH2L", self.__map, eocd + 8)
+        if offset == 0xFFFFFFFF:
+            raise ValueError("ZIP64 isn't supported")
+        entries = {}
+        position = offset
+        for _ in range(count):
+            fields = self.__CENTRAL_ENTRY.unpack_from(self.__map, position)
+            signature, method, compressed, local_offset = (
+                fields[0],
+                fields[4],
+                fields[8],
+                fields[16],
+            )
+            name_length, extra_length, comment_length = fields[10:13]
+            if signature != b"PK\x01\x02":
+                raise ValueError("corrupted central directory")
+            position += self.__CENTRAL_ENTRY.size
+            name = self.__map[position : position + name_length].decode(
+                "utf-8", "replace"
+            )
+            entries[name] = (method, compressed, local_offset)
+            position += name_length + extra_length + comment_length
+        return entries
+
+    def names(self) -> list:
+        """
+        Obtain the names of the files in the APK.
+
+        :return: the file names
+        :rtype: list
+        """
+        return list(self.__entries.keys())
+
+    def dex_files(self) -> list:
+        """
+        Obtain the names of the DEX files, more than one for multidex APKs.
+
+        :return: the DEX file names
+        :rtype: list
+        """
+        return [name for name in self.__entries if self.__DEX.fullmatch(name)]
+
+    def read(self, name: str) -> bytes:
+        """
+        Read a file of the APK.
+
+        :param name: name of the file
+        :type name: str
+        :return: the content of the file
+        :rtype: bytes
+        :raise ValueError: if the compression method isn't supported
+        """
+        method, compressed, offset = self.__entries[name]
+        signature, *_, name_length, extra_length = self.__LOCAL_HEADER.unpack_from(
+            self.__map, offset
+        )
+        if signature != b"PK\x03\x04":
+            raise ValueError(f"corrupted local header of {name}")
+        start = offset + self.__LOCAL_HEADER.size + name_length + extra_length
+        data = self.__map[start : start + compressed]
+        if method == self.__STORED:
+            return data
+        elif method == self.__DEFLATED:
+            return zlib.decompress(data, -zlib.MAX_WBITS)
+        raise ValueError(f"compression method {method} of {name} not supported")
+
+    def package(self) -> str:
+        """
+        Read the package name from the binary XML of the manifest.
+
+        :return: the package name
+        :rtype: str
+        :raise ValueError: if the manifest can't be read
+        """
+        manifest = self.read("AndroidManifest.xml")
+        if struct.unpack_from("<H", manifest)[0] != self.__XML:
+            raise ValueError("the manifest isn't binary XML")
+        strings = []
+        position = struct.unpack_from("<H", manifest, 2)[0]
+        while position < len(manifest):
+            kind, header, size = struct.unpack_from("<2HL", manifest, position)
+            if kind == self.__STRING_POOL:
+                strings = self.__string_pool(manifest, position)
+            elif kind == self.__START_ELEMENT:
+                # the first element is <manifest>, its attributes follow the header
+                start, length, count = struct.unpack_from(
+                    "<3H", manifest, position + header + 8
+                )
+                attribute = position + header + start
+                for _ in range(count):
+                    name, value = struct.unpack_from("<4x2L", manifest, attribute)
+                    if max(name, value) < len(strings) and strings[name] == "package":
+                        return strings[value]
+                    attribute += length
+                break
+            position += size
+        raise ValueError("package name not found in the manifest")
+
+    @staticmethod
+    def __string_pool(xml: bytes, position: int) -> list:
+        """
+        Read a string pool chunk of a binary XML file.
+
+        :param xml: content of the binary XML file
+        :type xml: bytes
+        :param position: offset of the chunk
+        :type position: int
+        :return: the strings
+        :rtype: list
+        """
+        header = struct.unpack_from("<H", xml, position + 2)[0]
+        count, _, flags, start = struct.unpack_from("<4L", xml, position + 8)
+        offsets = struct.unpack_from(f"<{count}L", xml, position + header)
+        strings = []
+        for offset in offsets:
+            offset += position + start
+            if flags & 0x100:  # UTF-8: length in characters, then in bytes
+                offset += 2 if xml[offset] & 0x80 else 1
+                length = xml[offset]
+                if length & 0x80:
+                    length = (length & 0x7F) << 8 | xml[offset + 1]
+                    offset += 1
+                offset += 1
+                strings.append(xml[offset : offset + length].decode("utf-8", "replace"))
+            else:  # UTF-16: length in code units
+                length = struct.unpack_from("<H", xml, offset)[0]
+                offset += 2
+                if length & 0x8000:
+                    extra = struct.unpack_from("<H", xml, offset)[0]
+                    length = (length & 0x7FFF) << 16 | extra
+                    offset += 2
+                strings.append(
+                    xml[offset : offset + 2 * length].decode("utf-16-le", "replace")
+                )
+        return strings
+
+    @staticmethod
+    def dex_strings(dex: bytes) -> list:
+        """
+        Read the string table of a DEX file.
+
+        The table includes the type descriptors, the class, method and field names
+        and the string constants. The strings are returned as raw MUTF-8.
+
+        :param dex: content of the DEX file
+        :type dex: bytes
+        :return: the strings
+        :rtype: list of bytes
+        :raise ValueError: if the file isn't a DEX file or its string table is corrupted
+        """
+        if dex[:4] != b"dex\n":
+            raise ValueError("not a DEX file")
+        size, offset = struct.unpack_from("<2L", dex, 0x38)
+        if offset + 4 * size > len(dex):
+            raise ValueError("string table out of the DEX file")
+        strings = []
+        for data_offset in struct.unpack_from(f"<{size}L", dex, offset):
+            if data_offset >= len(dex):
+                raise ValueError("string data out of the DEX file")
+            # skip the ULEB128 length in UTF-16 code units
+            while data_offset < len(dex) and dex[data_offset] & 0x80:
+                data_offset += 1
+            data_offset += 1
+            # raises ValueError if the string isn't terminated
+            strings.append(dex[data_offset : dex.index(b"\0", data_offset)])
+        return strings
+
+    def find(self, symbols: set) -> set:
+        """
+        Find which symbols appear in the strings of the DEX files.
+
+        A symbol is found if it is a substring of a string, ignoring the case.
+
+        :param symbols: symbols to find
+        :type symbols: set
+        :return: the symbols found
+        :rtype: set
+        """
+        pending = {symbol: symbol.lower().encode() for symbol in symbols}
+        found = set()
+        for name in self.dex_files():
+            table = b"\n".join(self.dex_strings(self.read(name))).lower()
+            for symbol, encoded in list(pending.items()):
+                if encoded in table:
+                    found.add(symbol)
+                    del pending[symbol]
+            self.__logging.debug(f"Searched {name}, found {found}")
+            if not pending:
+                break
+        return found
+
+    def close(self):
+        """
+        Close the APK.
+        """
+        self.__map.close()
+        self.__file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,44 @@
+import asyncio
+import logging
+
+
+async def run_command(
+    cmd: list,
+    input: str = None,
+    stdout=None,
+    stderr=None,
+    capture_output=False,
+    cwd: str = None,
+    env: dict = None,
+) -> (int, str):
+    """
+    Run a command without blocking the event loop.
+
+    :param cmd: The command to run, as a list of arguments.
+    :type cmd: list
+    :param input: String to write in the stdin of the process, default None.
+    :type input: str
+    :param stdout: File object where to redirect stdout, ignored if capture_output is True.
+    :param stderr: File object where to redirect stderr.
+    :param capture_output: Capture stdout and return it, default False.
+    :type capture_output: bool
+    :param cwd: Working directory of the process, default the current one.
+    :type cwd: str
+    :param env: Environment variables of the process, default the current ones.
+    :type env: dict
+    :return: The return code of the process and the captured output (empty if not captured).
+    :rtype: tuple
+    """
+    logging.debug(f"[ASYNC_SUBPROCESS] Running {' '.join(map(str, cmd))}")
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.PIPE if input is not None else None,
+        stdout=asyncio.subprocess.PIPE if capture_output else stdout,
+        stderr=stderr,
+        cwd=cwd,
+        env=env,
+    )
+    output, _ = await process.communicate(
+        input=input.encode() if input is not None else None
+    )
+    return process.returncode, output.decode() if output else ""
@@ -0,0 +1,181 @@
+import hashlib
+import json
+import sqlite3
+import time
+from contextlib import closing
+from functools import lru_cache
+from os import makedirs, sep, stat
+from os.path import abspath
+
+from utils.logger import Logger
+
+
+class Disk_cache:
+    """
+    Persistent key-value cache backed by SQLite.
+
+    Values are stored as JSON, each entry has its own time to live.
+    The database is opened for each operation, so the same cache can be used by
+    different threads and processes.
+    """
+
+    def __init__(self, name: str, folder: str = f"dependencies{sep}cache"):
+        """
+        :param name: name of the cache, used as the name of the database file
+        :type name: str
+        :param folder: folder where to save the database
+        :type folder: str
+        """
+        self.__logging = Logger("Disk_cache")
+        makedirs(folder, exist_ok=True)
+        self.__path = f"{folder}{sep}{name}.sqlite3"
+        with closing(self.__connect()) as connection, connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries "
+                "(key TEXT PRIMARY KEY, value TEXT, created REAL, expires REAL)"
+            )
+
+    def __connect(self) -> sqlite3.Connection:
+        """
+        Open the database.
+
+        :return: connection to the database
+        :rtype: sqlite3.Connection
+        """
+        return sqlite3.connect(self.__path, timeout=30)
+
+    @staticmethod
+    def key(*parts) -> str:
+        """
+        Build a key from the given parts.
+
+        :param parts: JSON serializable values identifying the entry
+        :return: hex digest of the parts
+        :rtype: str
+        """
+        return hashlib.sha256(
+            json.dumps(parts, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+    def get(self, key: str, default=None):
+        """
+        Obtain a value from the cache.
+
+        :param key: key of the entry
+        :type key: str
+        :param default: value to return if the entry is missing or expired
+        :return: the cached value or default
+        """
+        with closing(self.__connect()) as connection:
+            row = connection.execute(
+                "SELECT value FROM entries WHERE key = ? AND expires > ?",
+                (key, time.time()),
+            ).fetchone()
+        if row is None:
+            self.__logging.debug(f"Cache miss for {key}.")
+            return default
+        self.__logging.debug(f"Cache hit for {key}.")
+        return json.loads(row[0])
+
+    def set(self, key: str, value, ttl: int):
+        """
+        Store a value in the cache.
+
+        :param key: key of the entry
+        :type key: str
+        :param value: JSON serializable value
+        :param ttl: seconds before the entry expires
+        :type ttl: int
+        """
+        now = time.time()
+        with closing(self.__connect()) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), now, now + ttl),
+            )
+
+    def delete(self, key: str):
+        """
+        Remove an entry from the cache.
+
+        :param key: key of the entry
+        :type key: str
+        """
+        with closing(self.__connect()) as connection, connection:
+            connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def evict(self, max_entries: int = None, max_size: int = None) -> int:
+        """
+        Remove the expired entries and, if needed, the oldest ones.
+
+        :param max_entries: maximum number of entries to keep, default unlimited
+        :type max_entries: int
+        :param max_size: maximum size in bytes of the values kept, default unlimited
+        :type max_size: int
+        :return: number of removed entries
+        :rtype: int
+        """
+        with closing(self.__connect()) as connection, connection:
+            removed = connection.execute(
+                "DELETE FROM entries WHERE expires <= ?", (time.time(),)
+            ).rowcount
+            if max_entries is not None:
+                removed += connection.execute(
+                    "DELETE FROM entries WHERE key NOT IN "
+                    "(SELECT key FROM entries ORDER BY created DESC LIMIT ?)",
+                    (max_entries,),
+                ).rowcount
+            if max_size is not None:
+                # keep the newest entries while their total size fits
+                removed += connection.execute(
+                    "DELETE FROM entries WHERE key IN (SELECT key FROM "
+                    "(SELECT key, SUM(LENGTH(value)) OVER (ORDER BY created DESC) "
+                    "AS total FROM entries) WHERE total > ?)",
+                    (max_size,),
+                ).rowcount
+        return removed
+
+    def clear(self):
+        """
+        Remove all the entries.
+        """
+        with closing(self.__connect()) as connection, connection:
+            connection.execute("DELETE FROM entries")
+
+
+def file_digest(path: str) -> str:
+    """
+    SHA-256 of the content of a file.
+
+    The digest is computed once while the size and the modification time of the
+    file don't change.
+
+    :param path: path of the file
+    :type path: str
+    :return: hex digest of the file
+    :rtype: str
+    """
+    path = abspath(path)
+    info = stat(path)
+    return _file_digest(path, info.st_size, info.st_mtime_ns)
+
+
+@lru_cache(maxsize=1024)
+def _file_digest(path: str, size: int, mtime: int) -> str:
+    """
+    Compute the digest for :func:`file_digest`, cached by size and mtime.
+
+    :param path: absolute path of the file
+    :type path: str
+    :param size: size of the file
+    :type size: int
+    :param mtime: modification time of the file in ns
+    :type mtime: int
+    :return: hex digest of the file
+    :rtype: str
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
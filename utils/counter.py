@@ -13,3 +13,68 @@ def count_occurrencies(word: str, input_string: str) -> int:
     :rtype: str
     """
     return sum(1 for _ in re.finditer(r"\b%s\b" % re.escape(word), input_string))
+
+
+class Matcher:
+    """
+    Count the occurrences of many words in a single pass.
+
+    The words are compiled once in a single regex, each word is counted as in
+    :func:`count_occurrencies`, also when different words overlap.
+    """
+
+    def __init__(self, words: list):
+        """
+        :param words: The words to find.
+        :type words: list
+        """
+        assert all(words), "The words must not be empty."
+        self.__words = list(dict.fromkeys(words))
+        # the longest words first, the shorter ones at the same position are
+        # counted through their prefixes
+        ordered = sorted(self.__words, key=len, reverse=True)
+        self.__groups = ordered
+        # the first characters let the scan skip the positions without a word
+        first = "".join(sorted({re.escape(word[0]) for word in ordered}))
+        alternatives = "|".join(f"({re.escape(word)})" for word in ordered)
+        self.__regex = re.compile(r"(?=[%s])(?=\b(?:%s)\b)" % (first, alternatives))
+        self.__prefixes = {
+            word: [
+                other
+                for other in ordered
+                if other != word
+                and word.startswith(other)
+                and re.match(r"%s\b" % re.escape(other), word)
+            ]
+            for word in ordered
+        }
+
+    def words(self) -> list:
+        """
+        Obtain the words of the matcher.
+
+        :return: The words to find.
+        :rtype: list
+        """
+        return self.__words
+
+    def count(self, input_string: str) -> dict:
+        """
+        Count the occurrences of each word in a string.
+
+        :param input_string: The input string where to search
+        :type input_string: str
+        :return: Counted occurrences of each word.
+        :rtype: dict
+        """
+        counted = dict.fromkeys(self.__words, 0)
+        ends = dict.fromkeys(self.__words, 0)
+        for match in self.__regex.finditer(input_string):
+            word = self.__groups[match.lastindex - 1]
+            start = match.start()
+            for found in [word] + self.__prefixes[word]:
+                # as re.finditer, the occurrences of a word don't overlap
+                if start >= ends[found]:
+                    counted[found] += 1
+                    ends[found] = start + len(found)
+        return counted
@@ -1,5 +1,7 @@
 import importlib.util
 import json
+import zipfile
+from glob import glob
 from os.path import sep
 from pathlib import Path
 from pydoc import locate
@@ -125,3 +127,61 @@ def load_list_of_domains(path: str) -> [str]:
             url, port = link_sep(line)
             urls.append(f"{url_domain(url)}:{port}")
     return urls
+
+
+def load_list_of_apks(source: str) -> [str]:
+    """
+    Load a list of APKs from a folder, a glob pattern or a manifest.
+
+    A manifest is a text file with the path of an APK on each line, the relative
+    paths start from the folder of the manifest. An APK is returned as it is.
+
+    :param source: APK, folder, glob pattern or manifest.
+    :type source: str
+    :return: list of APK paths.
+    :rtype: list
+    """
+    path = Path(source)
+    if path.is_dir():
+        apks = sorted(str(apk) for apk in path.rglob("*.apk"))
+    elif path.is_file():
+        if zipfile.is_zipfile(path):  # a single APK
+            return [source]
+        apks = []
+        with path.open() as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    apk = Path(line)
+                    apks.append(str(apk if apk.is_absolute() else path.parent / apk))
+    else:
+        apks = sorted(glob(source, recursive=True))
+    assert apks, f"No APK found in {source}."
+    for apk in apks:
+        assert Path(apk).is_file(), f"Path {Path(apk).absolute()} not found."
+    return apks
+
+
+def load_list_of_configurations(source: str) -> [str]:
+    """
+    Load a list of Apache/Nginx configuration files from a folder or a glob pattern.
+
+    The files ending with ``.conf`` are searched in the subfolders of a folder, a
+    configuration file is returned as it is.
+
+    :param source: configuration file, folder or glob pattern.
+    :type source: str
+    :return: list of configuration paths.
+    :rtype: list
+    """
+    path = Path(source)
+    if path.is_file():
+        return [source]
+    elif path.is_dir():
+        configurations = sorted(str(conf) for conf in path.rglob("*.conf"))
+    else:
+        configurations = sorted(
+            conf for conf in glob(source, recursive=True) if Path(conf).is_file()
+        )
+    assert configurations, f"No configuration file found in {source}."
+    return configurations
@@ -0,0 +1,168 @@
+import json
+import threading
+from os import path as os_path
+
+from utils.logger import Logger
+
+
+class Result_stream:
+    """
+    JSONL sink of the analysis results.
+
+    Each line holds the results of a single host, written as soon as its analysis
+    is done, so that the results do not have to be kept in memory until the end
+    and are not lost if the analysis crashes. Tuples, sets and non-string keys are
+    tagged so that they are read back unchanged; other objects without a JSON
+    representation are saved as strings.
+    """
+
+    __TAGS = {"__items__", "__tuple__", "__set__", "__frozenset__"}
+
+    def __init__(self, path: str, append: bool = False):
+        """
+        :param path: path of the JSONL file
+        :type path: str
+        :param append: keep the lines already in the file, default False
+        :type append: bool
+        """
+        self.__logging = Logger("Result_stream")
+        self.__path = path
+        self.__lock = threading.Lock()
+        truncated = append and self.__is_truncated(path)
+        self.__file = open(path, "a" if append else "w")
+        if truncated:  # don't glue the next line to the truncated one
+            self.__file.write("\n")
+
+    def __is_truncated(self, path: str) -> bool:
+        """
+        Check if the last line of the file was left incomplete by a crash.
+
+        :param path: path of the JSONL file
+        :type path: str
+        :return: True if the file doesn't end with a newline
+        :rtype: bool
+        """
+        if not os_path.exists(path) or os_path.getsize(path) == 0:
+            return False
+        with open(path, "rb") as file:
+            file.seek(-1, 2)
+            return file.read(1) != b"\n"
+
+    def path(self) -> str:
+        """
+        Obtain the path of the stream.
+
+        :return: path of the JSONL file
+        :rtype: str
+        """
+        return self.__path
+
+    @staticmethod
+    def __encode(obj):
+        """
+        Convert the values that JSON would change into tagged objects, so that they
+        are read back unchanged: tuples, sets and dicts with non-string keys.
+
+        :param obj: object to convert
+        :return: the converted object
+        """
+        if isinstance(obj, dict):
+            plain = all(isinstance(k, str) for k in obj)
+            if plain and Result_stream.__TAGS.isdisjoint(obj):
+                return {k: Result_stream.__encode(v) for k, v in obj.items()}
+            return {
+                "__items__": [
+                    [Result_stream.__encode(k), Result_stream.__encode(v)]
+                    for k, v in obj.items()
+                ]
+            }
+        elif isinstance(obj, tuple):
+            return {"__tuple__": [Result_stream.__encode(v) for v in obj]}
+        elif isinstance(obj, frozenset):  # hashable, it can be a key
+            return {"__frozenset__": [Result_stream.__encode(v) for v in obj]}
+        elif isinstance(obj, set):
+            return {"__set__": [Result_stream.__encode(v) for v in obj]}
+        elif isinstance(obj, list):
+            return [Result_stream.__encode(v) for v in obj]
+        return obj
+
+    @staticmethod
+    def __decode(obj: dict):
+        """
+        Convert back a tagged object, used as object hook of the JSON decoder.
+
+        :param obj: decoded JSON object
+        :type obj: dict
+        :return: the original value
+        """
+        if len(obj) == 1:
+            if "__items__" in obj:
+                return {k: v for k, v in obj["__items__"]}
+            elif "__tuple__" in obj:
+                return tuple(obj["__tuple__"])
+            elif "__set__" in obj:
+                return set(obj["__set__"])
+            elif "__frozenset__" in obj:
+                return frozenset(obj["__frozenset__"])
+        return obj
+
+    def write(self, hostname: str, loaded_modules: dict, results: dict):
+        """
+        Write the results of a host.
+
+        :param hostname: hostname, path or vhost analyzed
+        :type hostname: str
+        :param loaded_modules: loaded modules, only their names are saved
+        :type loaded_modules: dict
+        :param results: results of the modules
+        :type results: dict
+        """
+        line = json.dumps(
+            {
+                "hostname": hostname,
+                "modules": list(loaded_modules.keys()),
+                "results": self.__encode(results),
+            },
+            default=str,  # objects without a JSON representation
+        )
+        with self.__lock:
+            self.__file.write(f"{line}\n")
+            self.__file.flush()
+        self.__logging.debug(f"Results of {hostname} written to {self.__path}.")
+
+    def close(self):
+        """
+        Close the stream.
+        """
+        self.__file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @staticmethod
+    def read(path: str):
+        """
+        Read a stream lazily, one host at a time.
+
+        A truncated last line, left by a crash, is skipped.
+
+        :param path: path of the JSONL file
+        :type path: str
+        :return: generator of (hostname, names of the modules, results) tuples
+        :rtype: Generator
+        """
+        with open(path, "r") as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line, object_hook=Result_stream.__decode)
+                except json.JSONDecodeError:
+                    Logger("Result_stream").warning(
+                        f"Skipping truncated line of {path}"
+                    )
+                    continue
+                yield entry["hostname"], entry["modules"], entry["results"]
@@ -0,0 +1,253 @@
+import json
+import os
+import select
+import subprocess
+import sys
+import threading
+from concurrent.futures import Future
+from itertools import count
+
+# the client side is imported by the wrappers, the server side runs as a script
+# with only the standard library available
+try:
+    from utils.logger import Logger
+except ImportError:
+    Logger = None
+
+
+class Zygote:
+    """
+    Preforked Python interpreter.
+
+    The zygote imports the given modules once, then forks a child for each script
+    to run. The children start with the modules already imported, paying neither
+    the interpreter startup nor the imports. Each script runs with ``runpy`` as
+    ``__main__`` in its working directory, its stdout is captured in a file.
+
+    Requests and responses are JSON lines on the stdin and stdout of the zygote.
+    """
+
+    def __init__(self, preload: list, env: dict = None):
+        """
+        :param preload: modules to import in the zygote
+        :type preload: list
+        :param env: environment variables of the zygote, default the current ones
+        :type env: dict
+        """
+        self.__logging = Logger("Zygote")
+        self.__ids = count()
+        self.__pending = {}  # id -> Future
+        self.__lock = threading.Lock()
+        self.__process = subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__)] + preload,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            env=env,
+        )
+        ready = self.__process.stdout.readline()
+        if not ready:
+            raise ChildProcessError("The zygote exited during the startup.")
+        self.__preloaded = json.loads(ready)
+        self.__logging.debug(f"Zygote started, preloaded {self.__preloaded}.")
+        threading.Thread(target=self.__read, daemon=True).start()
+
+    @staticmethod
+    def supported() -> bool:
+        """
+        Check if the zygote can work on this platform.
+
+        :return: True if fork is available
+        :rtype: bool
+        """
+        return hasattr(os, "fork")
+
+    def preloaded(self) -> list:
+        """
+        Obtain the modules imported by the zygote, the others failed to import.
+
+        :return: names of the imported modules
+        :rtype: list
+        """
+        return self.__preloaded
+
+    def alive(self) -> bool:
+        """
+        Check if the zygote is still running.
+
+        :return: True if running
+        :rtype: bool
+        """
+        return self.__process.poll() is None
+
+    def __read(self):
+        """
+        Dispatch the responses of the zygote to the pending futures.
+        """
+        for line in self.__process.stdout:
+            response = json.loads(line)
+            with self.__lock:
+                future = self.__pending.pop(response["id"])
+            future.set_result(response["code"])
+        # the zygote died, nothing else will be answered
+        with self.__lock:
+            pending, self.__pending = self.__pending, {}
+        for future in pending.values():
+            future.set_exception(ChildProcessError("The zygote exited."))
+
+    def submit(self, script: str, args: list, cwd: str, output: str) -> Future:
+        """
+        Run a script in a child of the zygote.
+
+        :param script: path of the script
+        :type script: str
+        :param args: arguments of the script
+        :type args: list
+        :param cwd: working directory of the script
+        :type cwd: str
+        :param output: file where to write the stdout of the script
+        :type output: str
+        :return: future of the exit code
+        :rtype: Future
+        """
+        future = Future()
+        request = {
+            "script": os.path.abspath(script),
+            "args": list(map(str, args)),
+            "cwd": os.path.abspath(cwd),
+            "output": os.path.abspath(output),
+        }
+        with self.__lock:
+            request["id"] = next(self.__ids)
+            self.__pending[request["id"]] = future
+            try:
+                self.__process.stdin.write(f"{json.dumps(request)}\n".encode())
+                self.__process.stdin.flush()
+            except (OSError, ValueError) as e:  # ValueError once closed
+                self.__pending.pop(request["id"])
+                future.set_exception(ChildProcessError(f"The zygote exited: {e}"))
+        return future
+
+    def close(self):
+        """
+        Stop the zygote, the running children are left to finish.
+        """
+        try:
+            self.__process.stdin.close()
+        except OSError:
+            pass
+        self.__process.wait()
+
+
+def _child(request: dict):
+    """
+    Body of a forked child, runs the requested script as __main__.
+
+    :param request: script, args, cwd and output of the run
+    :type request: dict
+    """
+    import random
+    import runpy
+
+    code = 0
+    try:
+        output = os.open(request["output"], os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+        os.dup2(output, 1)
+        os.close(output)
+        os.close(0)
+        sys.stdin = open(os.devnull)
+        sys.stdout = open(1, "w", closefd=False)
+        os.chdir(request["cwd"])
+        random.seed()  # don't share the random state of the zygote
+        sys.argv = [request["script"]] + request["args"]
+        # like the interpreter does, keeping the PYTHONPATH entries of the zygote
+        sys.path.insert(0, os.path.dirname(request["script"]))
+        runpy.run_path(request["script"], run_name="__main__")
+    except SystemExit as e:
+        if isinstance(e.code, int) or e.code is None:
+            code = e.code or 0
+        else:
+            print(e.code, file=sys.stderr)
+            code = 1
+    except BaseException:
+        import traceback
+
+        traceback.print_exc()
+        code = 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(code)
+
+
+def _exit_code(status: int) -> int:
+    """
+    Convert a wait status to an exit code, negative if killed by a signal.
+
+    :param status: status returned by waitpid
+    :type status: int
+    :return: the exit code
+    :rtype: int
+    """
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
+def _serve(preload: list):
+    """
+    Main loop of the zygote.
+
+    :param preload: modules to import before serving the requests
+    :type preload: list
+    """
+    import importlib
+
+    # the children redirect fd 1, the responses use a copy of it and anything else
+    # printed by the zygote goes to stderr
+    responses = os.fdopen(os.dup(1), "w")
+    os.dup2(2, 1)
+    loaded = []
+    for module in preload:
+        try:
+            importlib.import_module(module)
+            loaded.append(module)
+        except ImportError:
+            pass
+    responses.write(f"{json.dumps(loaded)}\n")
+    responses.flush()
+    children = {}  # pid -> id
+    requests = sys.stdin.buffer
+    buffer = b""
+    open_input = True
+    while open_input or children:
+        # wait for the requests, polling the children only while some are running
+        timeout = 0.01 if children else None
+        if open_input:
+            readable, _, _ = select.select([requests], [], [], timeout)
+            if readable:
+                chunk = os.read(requests.fileno(), 65536)
+                if not chunk:
+                    open_input = False
+                buffer += chunk
+                *lines, buffer = buffer.split(b"\n")
+                for line in lines:
+                    request = json.loads(line)
+                    pid = os.fork()
+                    if pid == 0:
+                        responses.close()
+                        _child(request)
+                    children[pid] = request["id"]
+        else:
+            select.select([], [], [], timeout)
+        while children:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+            if pid == 0:
+                break
+            response = {"id": children.pop(pid), "code": _exit_code(status)}
+            responses.write(f"{json.dumps(response)}\n")
+            responses.flush()
+
+
+if __name__ == "__main__":
+    sys.path.pop(0)  # the folder of this file is not part of the scripts' path
+    _serve(sys.argv[1:])